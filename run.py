@@ -3,7 +3,7 @@ import os
 import logging
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt, QCoreApplication
+from PyQt6.QtCore import Qt, QCoreApplication, QRunnable, QThreadPool
 from PyQt6.QtGui import QGuiApplication
 
 def setup_directories():
@@ -18,32 +18,27 @@ def setup_directories():
         'results',
         'metrics'
     ]
+    created = set()
     for d in dirs:
-        Path(d).mkdir(parents=True, exist_ok=True)
-
-def setup_logging():
-    """Initialize logging configuration."""
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    
-    # Setup file handler
-    file_handler = logging.FileHandler(
-        'logs/hardware_analyzer.log',
-        encoding='utf-8'
-    )
-    file_handler.setFormatter(formatter)
-    
-    # Setup console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+        path = Path(d)
+        if path in created:
+            continue
+        path.mkdir(parents=True, exist_ok=True)
+        # Parents now exist too, so later entries sharing them skip the mkdir
+        created.add(path)
+        created.update(path.parents)
+
+
+class EnvironmentSetup(QRunnable):
+    """Background task for filesystem setup that the first paint doesn't need."""
+
+    def run(self):
+        try:
+            setup_directories()
+            copy_default_theme()
+            print_log_locations()
+        except Exception:
+            logging.exception("Environment setup failed")
 
 def print_log_locations():
     """Print locations of log files."""
@@ -122,29 +117,29 @@ def optimize_qt_settings():
 def main():
     """Main application entry point with performance optimizations."""
     try:
-        # Setup environment
-        setup_directories()
-        setup_logging()
-        print_log_locations()
-        copy_default_theme()
-        
         # Add src to Python path
         src_path = os.path.join(os.path.dirname(__file__), "src")
         if src_path not in sys.path:
             sys.path.insert(0, src_path)
-        
+
+        # Qt reads these environment variables when QApplication is created
+        optimize_qt_settings()
+
         # Set DPI attributes before creating QApplication
         QApplication.setHighDpiScaleFactorRoundingPolicy(
             Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
         )
-        
-        # Initialize Qt application
+
+        # Initialize Qt application before any filesystem work
         app = QApplication(sys.argv)
         app.setStyle("Fusion")
-        
-        # Apply optimizations
-        optimize_qt_settings()
-        
+
+        # Logging is needed synchronously; the rest runs off-thread. The
+        # main window calls the same setup again, which reuses these sinks.
+        from core.utils import setup_logging
+        setup_logging()
+        QThreadPool.globalInstance().start(EnvironmentSetup())
+
         # Import and create main window
         from src.main import HardwareAnalyzerApp
         window = HardwareAnalyzerApp()
@@ -1,24 +1,111 @@
 import psutil
 import platform
 import subprocess
-import json
-import requests
 import logging
-import logging.handlers
 import os
 import csv
-from datetime import datetime
+import io
+import struct
+import threading
+import time
+from pathlib import Path
 from typing import Dict, Union, List
 
+import numpy as np
+
+from core.logging_util import get_manager_logger
+from core.utils import (
+    cached_hw_identity,
+    cached_timestamp,
+    dumps_json,
+    get_wmi,
+)
+
+# The OS never changes at runtime, so resolve it once
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_LINUX = _SYSTEM == "Linux"
+_IS_MAC = _SYSTEM == "Darwin"
+
+try:
+    from numba import njit
+
+    numba_available = True
+except ImportError:
+    numba_available = False
+
+    def njit(*args, **kwargs):
+        """Fallback that leaves the kernel as plain Python."""
+        return lambda func: func
+
+
+# Structured ring-buffer row for CPU history samples
+HISTORY_DTYPE = np.dtype(
+    [("ts", "u8"), ("usage", "f4"), ("freq", "f4"), ("temp", "f4")]
+)
+
+
+@njit(cache=True)
+def _alert_stats(usage, n):
+    """Return (peak, mean) CPU usage over the first n history samples."""
+    if n == 0:
+        return 0.0, 0.0
+    peak = usage[0]
+    total = 0.0
+    for i in range(n):
+        value = usage[i]
+        total += value
+        if value > peak:
+            peak = value
+    return peak, total / n
+
+
+# cpu_percent(interval=None) keeps one process-wide window, so every CPU
+# instance samples it through _sample_usage and shares the last reading
+_usage_lock = threading.Lock()
+_usage_sampled_at = None  # time.monotonic() of the last call; None until primed
+_last_usage = 0.0
+# Shorter cpu_percent() windows are mostly noise, so they are not published
+_MIN_USAGE_INTERVAL = 0.1
+
+
+def _sample_usage():
+    """Return CPU usage since the last sample, or that sample if it is too recent."""
+    global _usage_sampled_at, _last_usage
+    with _usage_lock:
+        now = time.monotonic()
+        if _usage_sampled_at is None:
+            # First use only opens the window; there is no delta to report yet
+            psutil.cpu_percent(interval=None)
+            _usage_sampled_at = now
+        elif now - _usage_sampled_at >= _MIN_USAGE_INTERVAL:
+            _last_usage = psutil.cpu_percent(interval=None, percpu=False)
+            _usage_sampled_at = now
+        return _last_usage
+
+_kernels_warmed = False
+
+
+def _warmup_kernels():
+    """Compile the JIT kernels once so the first real call does not stall."""
+    global _kernels_warmed
+    if numba_available and not _kernels_warmed:
+        _alert_stats(np.zeros(1, dtype=HISTORY_DTYPE)["usage"], 1)
+        _kernels_warmed = True
+
 
 class CPU:
+    # psutil.cpu_freq() reads sysfs/WMI, so reuse a sample for this long
+    FREQUENCY_TTL = 5.0
+
     def __init__(self, log_dir: str = "logs"):
         """Initialize CPU monitoring with enhanced features."""
         try:
             # Initialize core attributes
             self.log_dir = log_dir
-            self.history = []
             self.max_history_size = 100
+            self._hist = np.zeros(self.max_history_size, dtype=HISTORY_DTYPE)
+            self._hist_idx = 0
 
             # Initialize default values
             self.name = "Unknown"
@@ -29,14 +116,22 @@ class CPU:
             self.current_usage = 0
             self.temperature = "Not available"
             self.hyperthreading = False  # Add missing attribute
-            self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self._static_loaded = False
+            self._frequency_sampled_at = None
+            self._metrics_cache = None
+            self._metrics_dirty = True
+            self.timestamp = cached_timestamp()
 
-            # Create log directory
-            os.makedirs(log_dir, exist_ok=True)
+            # Create log and default output directories once
+            self._known_dirs = set()
+            for directory in (log_dir, "reports", "metrics"):
+                self._ensure_output_dir(directory)
 
             # Setup logging
             self.setup_logging()
 
+            _warmup_kernels()
+
             # Update metrics
             self.update_metrics()
 
@@ -44,63 +139,93 @@ class CPU:
             print(f"Error initializing CPU: {e}")
             raise
 
-    def setup_logging(self):
-        """Setup enhanced logging configuration."""
-        log_file = os.path.join(self.log_dir, "cpu_manager.log")
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file, maxBytes=10485760, backupCount=5
-        )
-        file_handler.setFormatter(formatter)
+    def _ensure_output_dir(self, output_dir: str):
+        """Create a directory the first time it is used."""
+        if output_dir not in self._known_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            self._known_dirs.add(output_dir)
 
-        self.logger = logging.getLogger("CPU_Manager")
-        self.logger.setLevel(logging.INFO)
-        self.logger.addHandler(file_handler)
+    def setup_logging(self):
+        """Attach the manager logger to the shared background log writer."""
+        self.logger = get_manager_logger("CPU_Manager", self.log_dir)
 
     def update_metrics(self):
         """Update CPU metrics with real-time information."""
         try:
-            # Get real CPU information
-            self.name = self.get_cpu_name()
-            self.cores = psutil.cpu_count(logical=False) or 0
-            self.threads = psutil.cpu_count(logical=True) or 0
-            self.hyperthreading = self.threads > self.cores if self.cores else False
-
-            # Get frequency
-            cpu_freq = psutil.cpu_freq()
-            self.frequency = cpu_freq.current if cpu_freq else 0
-
-            # Get architecture and usage
-            self.architecture = platform.architecture()[0]
-            self.current_usage = psutil.cpu_percent(interval=1)
-            self.temperature = self.get_cpu_temperature()
+            if not self._static_loaded:
+                self._refresh_static()
+            self._refresh_dynamic()
 
             # Update timestamp and history
-            self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.timestamp = cached_timestamp()
+            self._metrics_dirty = True
             self._update_history()
 
-            self.logger.info("CPU metrics updated successfully")
+            self.logger.debug("CPU metrics updated successfully")
 
         except Exception as e:
             self.logger.error(f"Error updating CPU metrics: {e}")
             raise
 
+    def _refresh_static(self):
+        """Load CPU identity, which does not change while the system is up."""
+        self.name = self.get_cpu_name()
+        self.cores = psutil.cpu_count(logical=False) or 0
+        self.threads = psutil.cpu_count(logical=True) or 0
+        self.hyperthreading = self.threads > self.cores if self.cores else False
+        # Pointer width of the interpreter; platform.architecture() can fork `file`
+        self.architecture = f"{struct.calcsize('P') * 8}bit"
+        self._static_loaded = True
+
+    def _refresh_dynamic(self):
+        """Sample the CPU metrics that change between refreshes."""
+        now = time.monotonic()
+        if (
+            self._frequency_sampled_at is None
+            or now - self._frequency_sampled_at >= self.FREQUENCY_TTL
+        ):
+            cpu_freq = psutil.cpu_freq()
+            self.frequency = cpu_freq.current if cpu_freq else 0
+            self._frequency_sampled_at = now
+
+        # Non-blocking: usage since the previous sample instead of sleeping 1 s
+        self.current_usage = _sample_usage()
+        self.temperature = self.get_cpu_temperature()
+
     def get_cpu_name(self) -> str:
+        """Get the CPU name, probing the platform only once per boot."""
+        try:
+            return cached_hw_identity("cpu_name", self._detect_cpu_name)
+        except Exception as e:
+            self.logger.error(f"Error getting CPU name: {e}")
+            return "Unknown CPU"
+
+    def _detect_cpu_name(self) -> str:
         """Get detailed CPU name based on platform with better error handling."""
         try:
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 try:
-                    import wmi
+                    # Direct registry read avoids WMI's COM initialization
+                    import winreg
+
+                    with winreg.OpenKey(
+                        winreg.HKEY_LOCAL_MACHINE,
+                        r"HARDWARE\DESCRIPTION\System\CentralProcessor\0",
+                    ) as key:
+                        name = winreg.QueryValueEx(key, "ProcessorNameString")[0]
+                        if name:
+                            return name.strip()
+                except Exception:
+                    pass
 
-                    w = wmi.WMI(timeout=3)  # Add timeout to prevent hanging
-                    for proc in w.Win32_Processor():
+                try:
+                    for proc in get_wmi().Win32_Processor():
                         return proc.Name.strip()
                 except Exception:
                     # Fallback to platform info if WMI fails
                     return platform.processor()
 
-            elif platform.system() == "Darwin":  # macOS
+            elif _IS_MAC:
                 try:
                     return (
                         subprocess.check_output(
@@ -112,12 +237,22 @@ class CPU:
                 except Exception:
                     return platform.processor()
 
-            elif platform.system() == "Linux":
+            elif _IS_LINUX:
                 try:
-                    with open("/proc/cpuinfo") as f:
-                        for line in f:
-                            if "model name" in line:
-                                return line.split(":")[1].strip()
+                    # The model name is in the first processor record, so a
+                    # single small read plus bytes.find avoids line iteration
+                    with open("/proc/cpuinfo", "rb") as f:
+                        data = f.read(4096)
+                        start = data.find(b"model name")
+                        if start == -1:
+                            data += f.read()
+                            start = data.find(b"model name")
+                    if start != -1:
+                        colon = data.find(b":", start) + 1
+                        end = data.find(b"\n", colon)
+                        if end == -1:
+                            end = len(data)
+                        return data[colon:end].decode(errors="replace").strip()
                     return platform.processor()
                 except Exception:
                     return platform.processor()
@@ -132,7 +267,7 @@ class CPU:
     def get_cpu_temperature(self) -> Union[float, str]:
         """Get CPU temperature if available."""
         try:
-            if platform.system() == "Linux":
+            if _IS_LINUX:
                 temp = psutil.sensors_temperatures().get("coretemp", [])
                 if temp:
                     return temp[0].current
@@ -142,19 +277,64 @@ class CPU:
 
     def _update_history(self):
         """Maintain historical CPU usage data."""
-        current_metrics = {
-            "timestamp": self.timestamp,
-            "usage_percent": self.current_usage,
-            "frequency": self.frequency,
-            "temperature": self.temperature,
-        }
-
-        self.history.append(current_metrics)
-        if len(self.history) > self.max_history_size:
-            self.history.pop(0)
+        temperature = (
+            self.temperature if isinstance(self.temperature, (int, float)) else np.nan
+        )
+        self._hist[self._hist_idx % self.max_history_size] = (
+            int(time.time()),
+            self.current_usage,
+            self.frequency,
+            temperature,
+        )
+        self._hist_idx += 1
+
+    def _history_rows(self, last: int = None) -> List[np.ndarray]:
+        """Get chronological views over the history ring, oldest first."""
+        count = min(self._hist_idx, self.max_history_size)
+        if count < self.max_history_size:
+            views = [self._hist[:count]]
+        else:
+            split = self._hist_idx % self.max_history_size
+            views = [self._hist[split:], self._hist[:split]]
+
+        if last is not None:
+            skip = max(count - last, 0)
+            trimmed = []
+            for view in views:
+                trimmed.append(view[skip:])
+                skip = max(skip - len(view), 0)
+            views = trimmed
+        return views
+
+    @property
+    def history(self) -> List[Dict[str, Union[str, float]]]:
+        """Historical CPU samples as dictionaries, oldest first."""
+        return [
+            {
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts)),
+                "usage_percent": float(usage),
+                "frequency": float(freq),
+                "temperature": "Not available" if np.isnan(temp) else float(temp),
+            }
+            for view in self._history_rows()
+            for ts, usage, freq, temp in view
+        ]
+
+    def get_usage_statistics(self) -> Dict[str, float]:
+        """Get peak and average CPU usage over the recorded history."""
+        count = min(self._hist_idx, self.max_history_size)
+        peak, mean = _alert_stats(self._hist["usage"], count)
+        return {"peak_usage": float(peak), "average_usage": float(mean)}
 
     def get_detailed_metrics(self) -> Dict[str, Union[str, float, bool]]:
-        """Get comprehensive CPU metrics."""
+        """Get comprehensive CPU metrics, formatted once per update."""
+        if self._metrics_dirty or self._metrics_cache is None:
+            self._metrics_cache = self._build_detailed_metrics()
+            self._metrics_dirty = False
+        return dict(self._metrics_cache)
+
+    def _build_detailed_metrics(self) -> Dict[str, Union[str, float, bool]]:
+        """Format the current CPU metrics."""
         return {
             "name": self.name,
             "cores": self.cores,
@@ -186,47 +366,59 @@ class CPU:
 
     def generate_report(self, output_dir: str = "reports") -> str:
         """Generate a comprehensive CPU usage report."""
-        os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._ensure_output_dir(output_dir)
+        timestamp = cached_timestamp("%Y%m%d_%H%M%S")
         report_path = os.path.join(output_dir, f"cpu_report_{timestamp}.txt")
 
-        with open(report_path, "w") as f:
-            f.write("=== CPU Performance Report ===\n")
-            f.write(f"Generated: {self.timestamp}\n\n")
+        parts = ["=== CPU Performance Report ===\n", f"Generated: {self.timestamp}\n\n"]
 
-            # Current metrics
-            f.write("Current CPU Metrics:\n")
-            for key, value in self.get_detailed_metrics().items():
-                f.write(f"{key}: {value}\n")
+        # Current metrics
+        parts.append("Current CPU Metrics:\n")
+        parts.extend(
+            f"{key}: {value}\n" for key, value in self.get_detailed_metrics().items()
+        )
 
-            # Performance alerts
-            f.write("\nAlerts:\n")
-            for alert in self.get_performance_alerts():
-                f.write(f"- {alert}\n")
+        # Performance alerts
+        parts.append("\nAlerts:\n")
+        parts.extend(f"- {alert}\n" for alert in self.get_performance_alerts())
+
+        # Usage statistics
+        stats = self.get_usage_statistics()
+        parts.append("\nUsage Statistics:\n")
+        parts.append(f"Peak: {stats['peak_usage']:.1f}%\n")
+        parts.append(f"Average: {stats['average_usage']:.1f}%\n")
+
+        # Usage history
+        parts.append("\nRecent Usage History:\n")
+        parts.extend(
+            f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(row['ts']))}: "
+            f"{row['usage']:.1f}% CPU usage\n"
+            for view in self._history_rows(last=10)
+            for row in view
+        )
 
-            # Usage history
-            f.write("\nRecent Usage History:\n")
-            for entry in self.history[-10:]:
-                f.write(f"{entry['timestamp']}: {entry['usage_percent']}% CPU usage\n")
+        Path(report_path).write_text("".join(parts), encoding="utf-8")
 
         return report_path
 
     def export_metrics(self, export_format: str = "json", output_dir: str = "metrics"):
         """Export CPU metrics in specified format."""
-        os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._ensure_output_dir(output_dir)
+        timestamp = cached_timestamp("%Y%m%d_%H%M%S")
 
         if export_format == "json":
             file_path = os.path.join(output_dir, f"cpu_metrics_{timestamp}.json")
-            with open(file_path, "w") as f:
-                json.dump(self.get_detailed_metrics(), f, indent=4)
+            with open(file_path, "wb") as f:
+                f.write(dumps_json(self.get_detailed_metrics()))
         elif export_format == "csv":
             file_path = os.path.join(output_dir, f"cpu_metrics_{timestamp}.csv")
             metrics = self.get_detailed_metrics()
-            with open(file_path, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=metrics.keys())
-                writer.writeheader()
-                writer.writerow(metrics)
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=metrics.keys())
+            writer.writeheader()
+            writer.writerow(metrics)
+            with open(file_path, "w", newline="", encoding="utf-8") as f:
+                f.write(buffer.getvalue())
 
         return file_path
 
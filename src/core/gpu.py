@@ -1,20 +1,70 @@
 import platform
-import json
+import importlib.util
 import subprocess
-import requests
+import shutil
 import logging
-import logging.handlers
 import os
 import csv
+import io
+import atexit
+import threading
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, Union, List
 
-try:
-    from py3nvml import py3nvml
+from core.logging_util import get_manager_logger
+from core.utils import (
+    cached_hw_identity,
+    cached_timestamp,
+    dumps_json,
+    get_wmi,
+)
+
+# The OS never changes at runtime, so resolve it once
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_LINUX = _SYSTEM == "Linux"
+_IS_MAC = _SYSTEM == "Darwin"
+
+# py3nvml is imported lazily by _ensure_nvml(); only probe that it exists here
+nvml_available = importlib.util.find_spec("py3nvml") is not None
+py3nvml = None
+
+# NVML is initialized once per process; the driver handshake is expensive
+_nvml_initialized = False
+_nvml_lock = threading.Lock()
+
+
+def _ensure_nvml() -> bool:
+    """Initialize NVML on first use and shut it down at interpreter exit."""
+    global _nvml_initialized, py3nvml
+    if _nvml_initialized:
+        return True
+    with _nvml_lock:
+        if not _nvml_initialized:
+            from py3nvml import py3nvml
 
-    nvml_available = True
-except ImportError:
-    nvml_available = False
+            py3nvml.nvmlInit()
+            atexit.register(py3nvml.nvmlShutdown)
+            _nvml_initialized = True
+    return True
+
+
+# Registry class key for display adapters
+DISPLAY_CLASS_KEY = (
+    r"SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}"
+)
+
+# Linux DRM devices and the PCI vendor IDs used to label them
+DRM_CLASS_DIR = "/sys/class/drm"
+PCI_VENDORS = {
+    "0x10de": "NVIDIA",
+    "0x1002": "AMD",
+    "0x8086": "Intel",
+    "0x1af4": "Virtio",
+    "0x15ad": "VMware",
+    "0x1234": "QEMU",
+}
 
 
 class GPU:
@@ -24,28 +74,27 @@ class GPU:
         self.log_dir = log_dir
         self.history = []
         self.max_history_size = 100
+        self._nvml_handles = {}
 
-        # Create log directory
-        os.makedirs(log_dir, exist_ok=True)
+        # Create log and default output directories once
+        self._known_dirs = set()
+        for directory in (log_dir, "reports", "metrics"):
+            self._ensure_output_dir(directory)
 
         # Setup components
         self.setup_logging()
+        self._metrics_cache = None
         self.gpus = self._get_gpu_info()
-        self.last_update = datetime.now()
-
-    def setup_logging(self):
-        """Setup enhanced logging configuration."""
-        log_file = os.path.join(self.log_dir, "gpu_manager.log")
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file, maxBytes=10485760, backupCount=5
-        )
-        file_handler.setFormatter(formatter)
+    def _ensure_output_dir(self, output_dir: str):
+        """Create a directory the first time it is used."""
+        if output_dir not in self._known_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            self._known_dirs.add(output_dir)
 
-        self.logger = logging.getLogger("GPU_Manager")
-        self.logger.setLevel(logging.INFO)
-        self.logger.addHandler(file_handler)
+    def setup_logging(self):
+        """Attach the manager logger to the shared background log writer."""
+        self.logger = get_manager_logger("GPU_Manager", self.log_dir)
 
     def _get_gpu_info(self) -> List[Dict[str, str]]:
         """Enhanced GPU detection with detailed information."""
@@ -54,17 +103,25 @@ class GPU:
         if nvml_available:
             gpus.extend(self._get_nvml_gpu_info())
 
-        # Platform-specific detection as fallback
+        # Platform-specific detection as fallback, probed once per boot
         if not gpus:
-            if platform.system() == "Windows":
-                gpus.extend(self._get_windows_gpu_info())
-            elif platform.system() == "Linux":
-                gpus.extend(self._get_linux_gpu_info())
-            elif platform.system() == "Darwin":
-                gpus.extend(self._get_mac_gpu_info())
+            platform_gpus = cached_hw_identity(
+                "platform_gpus", self._get_platform_gpu_info
+            )
+            gpus.extend(dict(gpu) for gpu in platform_gpus)
 
         return gpus or [{"name": "No GPU detected", "memory_total": "Unknown"}]
 
+    def _get_platform_gpu_info(self) -> List[Dict[str, str]]:
+        """Detect GPUs using the platform's native tooling."""
+        if _IS_WINDOWS:
+            return self._get_windows_gpu_info()
+        elif _IS_LINUX:
+            return self._get_linux_gpu_info()
+        elif _IS_MAC:
+            return self._get_mac_gpu_info()
+        return []
+
     def _get_windows_gpu_info(self) -> List[Dict[str, str]]:
         """Get GPU information on Windows using multiple methods."""
         gpus = []
@@ -75,11 +132,13 @@ class GPU:
                 if nvidia_gpus:
                     return nvidia_gpus
 
-            # Fallback to WMI
-            import wmi
+            # Direct registry read avoids WMI's COM initialization
+            registry_gpus = self._get_registry_gpu_info()
+            if registry_gpus:
+                return registry_gpus
 
-            w = wmi.WMI()
-            for gpu in w.Win32_VideoController():
+            # Fallback to WMI
+            for gpu in get_wmi().Win32_VideoController():
                 gpu_info = {
                     "name": gpu.Name.strip(),
                     "driver_version": (
@@ -99,6 +158,64 @@ class GPU:
             self.logger.error(f"Error getting Windows GPU info: {e}")
         return gpus
 
+    def _get_registry_gpu_info(self) -> List[Dict[str, str]]:
+        """Enumerate display adapters from the Windows registry."""
+        gpus = []
+        try:
+            import winreg
+
+            with winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE, DISPLAY_CLASS_KEY
+            ) as class_key:
+                index = 0
+                while True:
+                    try:
+                        subkey_name = winreg.EnumKey(class_key, index)
+                    except OSError:
+                        break
+                    index += 1
+
+                    # Skip non-adapter entries such as "Properties"
+                    if not subkey_name.isdigit():
+                        continue
+
+                    try:
+                        with winreg.OpenKey(class_key, subkey_name) as key:
+                            gpus.append(self._read_registry_gpu(winreg, key))
+                    except OSError:
+                        continue
+        except Exception as e:
+            self.logger.warning(f"Registry GPU detection failed: {e}")
+        return gpus
+
+    def _read_registry_gpu(self, winreg, key) -> Dict[str, str]:
+        """Read a single display adapter's details from its registry key."""
+
+        def query(name):
+            try:
+                return winreg.QueryValueEx(key, name)[0]
+            except OSError:
+                return None
+
+        memory = query("HardwareInformation.qwMemorySize")
+        if memory is None:
+            memory = query("HardwareInformation.MemorySize")
+            if isinstance(memory, bytes):
+                memory = int.from_bytes(memory[:4], "little")
+
+        name = query("DriverDesc") or "Unknown"
+        driver_version = query("DriverVersion")
+        return {
+            "name": name.strip(),
+            "driver_version": driver_version.strip() if driver_version else "Unknown",
+            "video_processor": "Unknown",
+            "memory_total": (
+                f"{memory / (1024**3):.2f} GB"
+                if isinstance(memory, int) and memory > 0
+                else "Memory size unknown"
+            ),
+        }
+
     def _get_gpu_memory_multi_source(self, gpu_obj) -> str:
         """Get GPU memory using multiple detection methods."""
         try:
@@ -114,7 +231,7 @@ class GPU:
                 return memory_from_reg
 
             # Method 3: Dedicated video memory from DirectX
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 try:
                     import ctypes
 
@@ -143,10 +260,9 @@ class GPU:
             # Method 4: GPU-specific detection
             if "NVIDIA" in gpu_obj.Name and nvml_available:
                 try:
-                    py3nvml.nvmlInit()
-                    handle = py3nvml.nvmlDeviceGetHandleByIndex(0)
+                    _ensure_nvml()
+                    handle = self._get_nvml_handle(0)
                     memory_info = py3nvml.nvmlDeviceGetMemoryInfo(handle)
-                    py3nvml.nvmlShutdown()
                     return f"{memory_info.total / (1024**3):.2f} GB"
                 except:
                     pass
@@ -186,33 +302,86 @@ class GPU:
         return "Memory size unknown"
 
     def _get_linux_gpu_info(self) -> List[Dict[str, str]]:
-        """Get GPU information on Linux using lspci."""
+        """Get GPU information on Linux from sysfs, falling back to lspci."""
         gpus = []
         try:
-            output = subprocess.check_output("lspci | grep -i vga", shell=True).decode()
-            for line in output.splitlines():
-                gpus.append(
-                    {
-                        "name": line.split(": ")[1] if ": " in line else line,
-                        "memory_total": "Unknown",
-                    }
-                )
+            gpus = self._get_sysfs_gpu_info()
+            if not gpus and shutil.which("lspci"):
+                output = subprocess.check_output(["lspci"]).decode()
+                for line in output.splitlines():
+                    if "vga" not in line.lower():
+                        continue
+                    gpus.append(
+                        {
+                            "name": line.split(": ")[1] if ": " in line else line,
+                            "memory_total": "Unknown",
+                        }
+                    )
         except Exception as e:
             self.logger.error(f"Error getting Linux GPU info: {e}")
         return gpus
 
+    def _get_sysfs_gpu_info(self) -> List[Dict[str, str]]:
+        """Read DRM card PCI IDs and drivers directly from /sys/class/drm."""
+        gpus = []
+        if not os.path.isdir(DRM_CLASS_DIR):
+            return gpus
+
+        for card in sorted(os.listdir(DRM_CLASS_DIR)):
+            # Skip connector entries such as card0-HDMI-A-1
+            if not card.startswith("card") or not card[4:].isdigit():
+                continue
+            device_dir = os.path.join(DRM_CLASS_DIR, card, "device")
+            try:
+                with open(os.path.join(device_dir, "vendor")) as f:
+                    vendor = f.read().strip()
+                with open(os.path.join(device_dir, "device")) as f:
+                    device = f.read().strip()
+            except OSError:
+                continue
+
+            driver = "Unknown"
+            try:
+                with open(os.path.join(device_dir, "uevent")) as f:
+                    for line in f:
+                        if line.startswith("DRIVER="):
+                            driver = line.split("=", 1)[1].strip()
+                            break
+            except OSError:
+                pass
+
+            vendor_name = PCI_VENDORS.get(vendor)
+            ids = f"{vendor[2:]}:{device[2:]}"
+            gpus.append(
+                {
+                    "name": (
+                        f"{vendor_name} GPU [{ids}]" if vendor_name else f"PCI {ids}"
+                    ),
+                    "memory_total": "Unknown",
+                    "driver_version": driver,
+                }
+            )
+        return gpus
+
     def _get_mac_gpu_info(self) -> List[Dict[str, str]]:
         """Get GPU information on macOS using system_profiler."""
         gpus = []
         try:
-            output = subprocess.check_output(
-                ["system_profiler", "SPDisplaysDataType"]
-            ).decode()
-            for line in output.splitlines():
-                if "Chipset Model:" in line:
-                    gpus.append(
-                        {"name": line.split(": ")[1].strip(), "memory_total": "Unknown"}
-                    )
+            # Stream the mini-detail report line by line instead of buffering it
+            with subprocess.Popen(
+                ["system_profiler", "-detailLevel", "mini", "SPDisplaysDataType"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            ) as proc:
+                for line in proc.stdout:
+                    if "Chipset Model:" in line:
+                        gpus.append(
+                            {
+                                "name": line.split(": ", 1)[1].strip(),
+                                "memory_total": "Unknown",
+                            }
+                        )
         except Exception as e:
             self.logger.error(f"Error getting macOS GPU info: {e}")
         return gpus
@@ -221,70 +390,117 @@ class GPU:
         """Get NVIDIA GPU information using NVML."""
         gpus = []
         try:
-            py3nvml.nvmlInit()
+            static_info = cached_hw_identity("nvml_static", self._get_nvml_static_info)
+            if not static_info:
+                return gpus
+
+            _ensure_nvml()
+            for i, info in enumerate(static_info):
+                handle = self._get_nvml_handle(i)
+                memory_info = py3nvml.nvmlDeviceGetMemoryInfo(handle)
+
+                gpus.append(
+                    {
+                        "name": info["name"],
+                        "memory_total": info["memory_total"],
+                        "memory_used": f"{memory_info.used / (1024**2):.0f} MB",
+                        "memory_free": f"{memory_info.free / (1024**2):.0f} MB",
+                        "driver_version": info["driver_version"],
+                    }
+                )
+        except Exception as e:
+            self.logger.error(f"Error getting NVIDIA GPU info: {e}")
+        return gpus
+
+    def _get_nvml_static_info(self) -> List[Dict[str, str]]:
+        """Get the NVIDIA GPU fields that do not change between refreshes."""
+        gpus = []
+        try:
+            _ensure_nvml()
             device_count = py3nvml.nvmlDeviceGetCount()
+            driver_version = py3nvml.nvmlSystemGetDriverVersion().decode()
 
             for i in range(device_count):
-                handle = py3nvml.nvmlDeviceGetHandleByIndex(i)
+                handle = self._get_nvml_handle(i)
                 memory_info = py3nvml.nvmlDeviceGetMemoryInfo(handle)
 
                 gpus.append(
                     {
                         "name": py3nvml.nvmlDeviceGetName(handle).decode(),
                         "memory_total": f"{memory_info.total / (1024**2):.0f} MB",
-                        "memory_used": f"{memory_info.used / (1024**2):.0f} MB",
-                        "memory_free": f"{memory_info.free / (1024**2):.0f} MB",
-                        "driver_version": py3nvml.nvmlSystemGetDriverVersion().decode(),
+                        "driver_version": driver_version,
                     }
                 )
-
-            py3nvml.nvmlShutdown()
         except Exception as e:
             self.logger.error(f"Error getting NVIDIA GPU info: {e}")
         return gpus
 
+    def _get_nvml_handle(self, index: int):
+        """Get a cached NVML device handle."""
+        handle = self._nvml_handles.get(index)
+        if handle is None:
+            handle = py3nvml.nvmlDeviceGetHandleByIndex(index)
+            self._nvml_handles[index] = handle
+        return handle
+
+    @property
+    def gpus(self) -> List[Dict[str, str]]:
+        """Detected GPUs from the most recent probe."""
+        return self._gpus
+
+    @gpus.setter
+    def gpus(self, value: List[Dict[str, str]]):
+        self._gpus = value
+        self.last_update = datetime.now()
+        self._metrics_cache = None
+
     def get_performance_metrics(self) -> Dict[str, Union[str, List[Dict]]]:
-        """Get current GPU performance metrics."""
-        metrics = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "gpus": self.gpus,
-        }
-        return metrics
+        """Get current GPU performance metrics, built once per GPU probe."""
+        if self._metrics_cache is None:
+            self._metrics_cache = {
+                "timestamp": self.last_update.strftime("%Y-%m-%d %H:%M:%S"),
+                "gpus": self.gpus,
+            }
+        return dict(self._metrics_cache)
 
     def generate_report(self, output_dir: str = "reports") -> str:
         """Generate a comprehensive GPU report."""
-        os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._ensure_output_dir(output_dir)
+        timestamp = cached_timestamp("%Y%m%d_%H%M%S")
         report_path = os.path.join(output_dir, f"gpu_report_{timestamp}.txt")
 
-        with open(report_path, "w") as f:
-            f.write("=== GPU Analysis Report ===\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        parts = [
+            "=== GPU Analysis Report ===\n",
+            f"Generated: {cached_timestamp()}\n\n",
+        ]
+
+        for gpu in self.gpus:
+            parts.append("GPU Information:\n")
+            parts.extend(f"{key}: {value}\n" for key, value in gpu.items())
+            parts.append("\n")
 
-            for gpu in self.gpus:
-                f.write("GPU Information:\n")
-                for key, value in gpu.items():
-                    f.write(f"{key}: {value}\n")
-                f.write("\n")
+        Path(report_path).write_text("".join(parts), encoding="utf-8")
 
         return report_path
 
     def export_metrics(self, export_format: str = "json", output_dir: str = "metrics"):
         """Export GPU metrics in specified format."""
-        os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._ensure_output_dir(output_dir)
+        timestamp = cached_timestamp("%Y%m%d_%H%M%S")
 
         if export_format == "json":
             file_path = os.path.join(output_dir, f"gpu_metrics_{timestamp}.json")
-            with open(file_path, "w") as f:
-                json.dump({"gpus": self.gpus}, f, indent=4)
+            with open(file_path, "wb") as f:
+                f.write(dumps_json({"gpus": self.gpus}))
         elif export_format == "csv":
             file_path = os.path.join(output_dir, f"gpu_metrics_{timestamp}.csv")
-            with open(file_path, "w", newline="") as f:
-                if self.gpus:
-                    writer = csv.DictWriter(f, fieldnames=self.gpus[0].keys())
-                    writer.writeheader()
-                    writer.writerows(self.gpus)
+            buffer = io.StringIO()
+            if self.gpus:
+                writer = csv.DictWriter(buffer, fieldnames=self.gpus[0].keys())
+                writer.writeheader()
+                writer.writerows(self.gpus)
+            with open(file_path, "w", newline="", encoding="utf-8") as f:
+                f.write(buffer.getvalue())
 
         return file_path
 
@@ -311,5 +527,5 @@ def get_detailed_metrics(self):
     """Get comprehensive GPU metrics."""
     return {
         "gpus": self.gpus,
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "timestamp": cached_timestamp(),
     }
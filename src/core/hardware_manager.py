@@ -2,33 +2,261 @@ from core.cpu import CPU
 from core.ram import RAM
 from core.storage import Storage
 from core.gpu import GPU
-from core.logging_util import get_logger  # Add this import
-import json
-import requests
+from core.logging_util import get_manager_logger
+from core.utils import (
+    cached_timestamp,
+    dumps_json,
+    get_http_session,
+    get_wmi,
+    synchronized,
+)
 import csv
+import functools
+import importlib
+import html
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from typing import Dict, Any, List
 import platform
-import wmi
-import matplotlib.pyplot as plt
+import threading
+import time
+import types
+import numpy as np
 from io import BytesIO
 import base64
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    filename="hardware_manager.log",
-    filemode="a",
+
+@functools.lru_cache(maxsize=None)
+def _lazy_module(name: str):
+    """Import a heavyweight module on first use and keep its handle."""
+    return importlib.import_module(name)
+
+
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        """Fallback that leaves the kernel as plain Python."""
+        return lambda func: func
+
+
+# Structured ring-buffer row for refresh_all usage samples
+PERF_HISTORY_DTYPE = np.dtype(
+    [("t", "f8"), ("cpu", "f4"), ("ram", "f4"), ("gpu", "f4")]
+)
+PERF_HISTORY_SIZE = 3600
+# Most points plotted per series in generate_performance_graphs
+GRAPH_POINTS = 1000
+
+
+@njit(cache=True)
+def _lttb_indices(x, y, threshold):
+    """Pick indices that keep a series' shape (Largest-Triangle-Three-Buckets)."""
+    n = x.shape[0]
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    out = np.empty(threshold, dtype=np.int64)
+    out[0] = 0
+    out[threshold - 1] = n - 1
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(avg_start, avg_end):
+            avg_x += x[j]
+            avg_y += y[j]
+        count = max(avg_end - avg_start, 1)
+        avg_x /= count
+        avg_y /= count
+
+        best = -1.0
+        best_idx = int(i * every) + 1
+        for j in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            area = abs(
+                (x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a])
+            )
+            if area > best:
+                best = area
+                best_idx = j
+        out[i + 1] = best_idx
+        a = best_idx
+    return out
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Usage percentages and formatted summary sampled in one refresh."""
+
+    cpu: float
+    ram: float
+    gpu: float
+    summary: str
+
+
+# Refresh intervals in seconds; shared and read-only
+_REFRESH_INTERVALS = types.MappingProxyType(
+    {
+        "fast": 1,  # 1 second for critical metrics
+        "normal": 5,  # 5 seconds for regular updates
+        "slow": 30,  # 30 seconds for non-critical metrics
+    }
+)
+
+
+def _pct(value) -> float:
+    """Parse a "47.3%" style percentage; numbers pass straight through."""
+    if value.__class__ is str:
+        return float(value[:-1] if value.endswith("%") else value)
+    return float(value)
+
+
+def _gb(value) -> float:
+    """Parse a "7.25 GB" style size into its number of gigabytes."""
+    return float(value.split()[0])
+
+
+def _bar_table(width: int, fill: str) -> tuple:
+    """Prebuild every usage bar of the given width, indexed by filled cells."""
+    return tuple(f"[{fill * i}{'░' * (width - i)}]" for i in range(width + 1))
+
+
+_MEM_BARS = _bar_table(20, "█")
+_STOR_BARS_LIGHT = _bar_table(40, "█")
+_STOR_BARS_MED = _bar_table(40, "▒")
+_STOR_BARS_HEAVY = _bar_table(40, "▓")
+
+
+# (resource, level) -> (message, details template) for _get_resource_status
+_RESOURCE_STATUS = types.MappingProxyType(
+    {
+        (name, level): (message.format(name=name), details.format(name=name))
+        for name in ("CPU", "RAM", "GPU")
+        for level, message, details in (
+            (
+                "crit",
+                "🔴 Critical {name} Usage",
+                "{name} usage at {{u:.1f}}% - Performance severely impacted",
+            ),
+            (
+                "warn",
+                "🟡 High {name} Load",
+                "{name} usage at {{u:.1f}}% - Monitor for performance impact",
+            ),
+            (
+                "ok",
+                "🟢 {name} Optimal",
+                "{name} usage at {{u:.1f}}% - Operating normally",
+            ),
+        )
+    }
+)
+_STORAGE_CRITICAL = "🔴 Critical Storage Space"
+_STORAGE_WARNING = "🟡 Storage Space Warning"
+_STORAGE_OPTIMAL = types.MappingProxyType(
+    {
+        "message": "🟢 Storage Optimal",
+        "details": "All drives have adequate free space",
+    }
 )
 
+# Section headers for get_formatted_summary
+_SECTION_HEADERS = types.MappingProxyType(
+    {
+        "SYSTEM": "💻 SYSTEM INFORMATION",
+        "CPU": "⚡ CPU INFORMATION",
+        "MEMORY": "🧮 MEMORY STATUS",
+        "GPU": "🎮 GPU INFORMATION",
+        "STORAGE": "💾 STORAGE DEVICES",
+        "STATUS": "📊 SYSTEM STATUS",
+    }
+)
+
+# (summary key, header key, formatter) per section after SYSTEM, in display
+# order; the order matches the parts of _formatted_summary_key
+_SUMMARY_SECTIONS = (
+    ("cpu", "CPU", "_format_cpu_section"),
+    ("ram", "MEMORY", "_format_memory_section"),
+    ("gpu", "GPU", "_format_gpu_section"),
+    ("storage", "STORAGE", "_format_storage_section"),
+    ("performance_status", "STATUS", "_format_status_section"),
+)
+
+# Box templates for get_formatted_summary; one format call per section
+_BOX_TOP = "╔════════════════ {header} ════════════════╗\n"
+_BOX_BOTTOM = "╚══════════════════════════════════════════════════╝"
+# Top borders for the fixed header set, built once at import
+_HEADER_BOX = types.MappingProxyType(
+    {h: _BOX_TOP.format(header=h) for h in _SECTION_HEADERS.values()}
+)
+_SECTION_TMPL = "\n{top}{rows}" + _BOX_BOTTOM
+_SYSTEM_TMPL = "{top}{rows}" + _BOX_BOTTOM
+_SYSTEM_ROW_TMPL = "║  {key:<15}: {value:<35} ║\n"
+# Fixed-layout sections keep {top} and their own fields as placeholders
+_CPU_TMPL = _SECTION_TMPL.format(
+    top="{top}",
+    rows=(
+        "║  Model      : {model:<35} ║\n"
+        "║  Cores      : {cores} Physical, {threads} Logical ║\n"
+        "║  Frequency  : {freq:<35} ║\n"
+        "║  Usage      : {usage:<35} ║\n"
+    ),
+)
+_CPU_ERROR_TMPL = _SECTION_TMPL.format(
+    top="{top}",
+    rows="║  Error: Could not retrieve CPU information        ║\n",
+)
+_MEMORY_TMPL = _SECTION_TMPL.format(
+    top="{top}",
+    rows=(
+        "║  Total      : {total:>6.2f} GB {bar} ║\n"
+        "║  Used       : {used:>6.2f} GB ({percent:.1f}%) ║\n"
+        "║  Available  : {available:>6.2f} GB ║\n"
+    ),
+)
+_GPU_ROW_TMPL = (
+    "║  Model      : {name:<35} ║\n"
+    "║  Memory     : {memory:<35} ║\n"
+    "║  Driver     : {driver:<35} ║\n"
+)
+_STORAGE_ROW_TMPL = (
+    "║  {label:<44} ║\n"
+    "║  {bar} [{percent:>5.1f}%] ║\n"
+    "║  Total: {total:<10} Used: {used:<10} Free: {free:<10} ║\n"
+    "║──────────────────────────────────────────────────║\n"
+)
+_STATUS_TMPL = _SECTION_TMPL.format(
+    top="{top}",
+    rows=(
+        "║  CPU Status    : {cpu_status:<35} ║\n"
+        "║  RAM Status    : {ram_status:<35} ║\n"
+        "║  Storage Status: {storage_status:<35} ║\n"
+    ),
+)
+
+
+def _header_box(header: str) -> str:
+    """Get the top border for a section header."""
+    box = _HEADER_BOX.get(header)
+    return box if box is not None else _BOX_TOP.format(header=header)
+
 
 class HardwareManager:
+    # CPU name from WMI, looked up once per process
+    _wmi_cpu_name = None
+    _wmi_lock = threading.Lock()
+
     def __init__(self):
         try:
-            # Setup logging with UTF-8 encoding
-            self.logger = get_logger("Hardware_Manager", "hardware_manager.log")
+            # Setup logging with UTF-8 encoding through the shared queue
+            self.logger = get_manager_logger(
+                "Hardware_Manager", "logs", "hardware_manager.log"
+            )
 
             # Initialize components with error handling
             try:
@@ -36,8 +264,31 @@ class HardwareManager:
                 self.ram = RAM()
                 self.storage = Storage()
                 self.gpu = GPU()
+                # Component updates are I/O-bound, so run them concurrently
+                self._refresh_pool = ThreadPoolExecutor(
+                    max_workers=3, thread_name_prefix="hw-refresh"
+                )
+                # Samplers on several threads share this manager; its caches
+                # and the components' psutil counters are not thread-safe
+                self._lock = threading.RLock()
+                # (drives list, parsed usage percentages) from the last parse
+                self._drive_pcts = (None, None)
+                self.performance_history = np.zeros(
+                    PERF_HISTORY_SIZE, dtype=PERF_HISTORY_DTYPE
+                )
+                self._perf_idx = 0
+                # section -> (key part, formatted lines), so a tick that only
+                # moves CPU usage re-renders just the CPU box
+                self._section_cache = {}
 
+                # platform.* values never change while the process runs
+                self._system_info_cached = self._build_system_info()
                 self.system_info = self._get_system_info()
+                self._system_section_cached = tuple(
+                    self._format_system_section(
+                        self._system_info_cached, _SECTION_HEADERS["SYSTEM"]
+                    )
+                )
                 self._setup_refresh_interval()
                 self.logger.info("Hardware Manager initialized successfully")
             except Exception as e:
@@ -55,9 +306,7 @@ class HardwareManager:
             cpu = CPU()
             if platform.system() == "Windows":
                 try:
-                    w = wmi.WMI()
-                    cpu_info = w.Win32_Processor()[0]
-                    cpu.name = cpu_info.Name.strip()
+                    cpu.name = self._get_wmi_cpu_name()
                 except Exception as e:
                     self.logger.warning(f"WMI CPU detection failed: {e}")
             return cpu
@@ -65,8 +314,21 @@ class HardwareManager:
             self.logger.error(f"CPU initialization failed: {e}")
             raise RuntimeError(f"Failed to initialize CPU component: {e}")
 
+    @classmethod
+    def _get_wmi_cpu_name(cls) -> str:
+        """Get the CPU name from WMI, querying it only on first use."""
+        with cls._wmi_lock:
+            if cls._wmi_cpu_name is None:
+                cpu_info = get_wmi().Win32_Processor()[0]
+                cls._wmi_cpu_name = cpu_info.Name.strip()
+            return cls._wmi_cpu_name
+
     def _get_system_info(self) -> Dict[str, Any]:
         """Get detailed system information."""
+        return dict(self._system_info_cached)
+
+    def _build_system_info(self) -> Dict[str, Any]:
+        """Collect system information from the platform module."""
         return {
             "system": platform.system(),
             "machine": platform.machine(),
@@ -77,61 +339,104 @@ class HardwareManager:
 
     def _setup_refresh_interval(self):
         """Setup default refresh intervals."""
-        self.refresh_intervals = {
-            "fast": 1,  # 1 second for critical metrics
-            "normal": 5,  # 5 seconds for regular updates
-            "slow": 30,  # 30 seconds for non-critical metrics
-        }
+        self.refresh_intervals = _REFRESH_INTERVALS
         self.current_interval = self.refresh_intervals["normal"]
 
-    def refresh_all(self):
-        """Refresh all hardware components with enhanced error handling."""
-        results = {"success": False, "cpu": 0.0, "ram": 0.0, "gpu": 0.0, "errors": []}
+    def _refresh_gpu(self):
+        """Re-query GPU information."""
+        self.gpu.gpus = self.gpu._get_gpu_info()
 
-        try:
-            self.cpu.update_metrics()
-            results["cpu"] = self.get_cpu_usage()
-        except Exception as e:
-            self.logger.error(f"CPU refresh failed: {e}")
-            results["errors"].append(f"CPU: {str(e)}")
-
-        try:
-            self.ram.update_metrics()
-            results["ram"] = self.get_ram_usage()
-        except Exception as e:
-            self.logger.error(f"RAM refresh failed: {e}")
-            results["errors"].append(f"RAM: {str(e)}")
+    def _component_updates(self):
+        """Return (key, update, usage) callables for each live component."""
+        return (
+            ("cpu", self.cpu.update_metrics, self.get_cpu_usage),
+            ("ram", self.ram.update_metrics, self.get_ram_usage),
+            ("gpu", self._refresh_gpu, self.get_gpu_usage),
+        )
 
+    @staticmethod
+    def _refresh_component(key, update, usage):
+        """Update one component and read its usage, capturing any error."""
         try:
-            self.gpu.gpus = self.gpu._get_gpu_info()
-            results["gpu"] = self.get_gpu_usage()
+            update()
+            return key, usage(), None
         except Exception as e:
-            self.logger.error(f"GPU refresh failed: {e}")
-            results["errors"].append(f"GPU: {str(e)}")
+            return key, 0.0, e
+
+    def _update_components(self):
+        """Update CPU, RAM and GPU concurrently, raising the first failure."""
+        futures = [
+            self._refresh_pool.submit(update)
+            for _, update, _ in self._component_updates()
+        ]
+        for future in futures:
+            future.result()
+
+    @synchronized
+    def refresh_all(self):
+        """Refresh all hardware components with enhanced error handling."""
+        results = {"success": False, "cpu": 0.0, "ram": 0.0, "gpu": 0.0, "errors": []}
+        futures = [
+            self._refresh_pool.submit(self._refresh_component, *component)
+            for component in self._component_updates()
+        ]
+        for future in as_completed(futures):
+            key, value, error = future.result()
+            if error is None:
+                results[key] = value
+            else:
+                self.logger.error(f"{key.upper()} refresh failed: {error}")
+                results["errors"].append(f"{key.upper()}: {str(error)}")
 
         results["success"] = not results["errors"]
+        self._record_performance(results["cpu"], results["ram"], results["gpu"])
         return results
 
-    def get_hardware_summary(self) -> Dict[str, Any]:
+    def _record_performance(self, cpu: float, ram: float, gpu: float):
+        """Append one usage sample to the performance ring buffer."""
+        self.performance_history[self._perf_idx % PERF_HISTORY_SIZE] = (
+            time.time(),
+            cpu,
+            ram,
+            gpu,
+        )
+        self._perf_idx += 1
+
+    def _performance_rows(self) -> np.ndarray:
+        """Return recorded performance samples in chronological order."""
+        count = min(self._perf_idx, PERF_HISTORY_SIZE)
+        if self._perf_idx <= PERF_HISTORY_SIZE:
+            return self.performance_history[:count]
+        split = self._perf_idx % PERF_HISTORY_SIZE
+        return np.concatenate(
+            (self.performance_history[split:], self.performance_history[:split])
+        )
+
+    @synchronized
+    def get_hardware_summary(self, refresh: bool = True) -> Dict[str, Any]:
         """Generate a comprehensive hardware summary with enhanced formatting and error handling."""
         try:
-            # Update all components first
-            self.cpu.update_metrics()
-            self.ram.update_metrics()
-            self.gpu.gpus = self.gpu._get_gpu_info()
+            # Update all components first, unless a sampler keeps them current
+            if refresh:
+                self._update_components()
 
+            cpu_metrics = self.cpu.get_detailed_metrics()
+            ram_metrics = self.ram.get_detailed_metrics()
+            storage_metrics = self.storage.to_display_dict()
             summary = {
                 "system_info": self._get_system_info(),
-                "cpu": self.cpu.get_detailed_metrics(),
-                "ram": self.ram.get_detailed_metrics(),
-                "storage": self.storage.to_dict(),
+                "cpu": cpu_metrics,
+                "ram": ram_metrics,
+                "storage": storage_metrics,
                 "gpu": {"gpus": self.gpu.gpus},
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": cached_timestamp(),
             }
 
             # Add performance indicators
             try:
-                summary["performance_status"] = self._get_performance_status()
+                summary["performance_status"] = self._get_performance_status(
+                    cpu_metrics, ram_metrics, storage_metrics
+                )
             except Exception as e:
                 self.logger.error(f"Error getting performance status: {e}")
                 summary["performance_status"] = {
@@ -140,7 +445,7 @@ class HardwareManager:
                     "storage_status": "🔴 Error",
                 }
 
-            self.logger.info("✓ Hardware summary generated successfully")
+            self.logger.debug("✓ Hardware summary generated successfully")
             return summary
 
         except Exception as e:
@@ -148,20 +453,28 @@ class HardwareManager:
             # Return a minimal summary with error information
             return {
                 "error": str(e),
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": cached_timestamp(),
                 "system_info": self._get_system_info(),
             }
 
-    def _get_performance_status(self) -> Dict[str, str]:
+    def _get_performance_status(
+        self,
+        cpu_metrics: Dict[str, Any] = None,
+        ram_metrics: Dict[str, Any] = None,
+        storage_metrics: Dict[str, Any] = None,
+    ) -> Dict[str, str]:
         """Generate detailed performance status indicators with thresholds."""
         try:
-            # Get current metrics
-            cpu_metrics = self.cpu.get_detailed_metrics()
-            ram_metrics = self.ram.get_detailed_metrics()
-            storage_metrics = self.storage.to_dict()
+            # Fetch only the metrics the caller has not already collected
+            if cpu_metrics is None:
+                cpu_metrics = self.cpu.get_detailed_metrics()
+            if ram_metrics is None:
+                ram_metrics = self.ram.get_detailed_metrics()
+            if storage_metrics is None:
+                storage_metrics = self.storage.to_display_dict()
 
             # CPU Status
-            cpu_usage = float(cpu_metrics["current_usage"].strip("%"))
+            cpu_usage = _pct(cpu_metrics["current_usage"])
             cpu_status = self._get_resource_status(
                 cpu_usage,
                 warning_threshold=70,
@@ -170,7 +483,7 @@ class HardwareManager:
             )
 
             # RAM Status
-            ram_usage = float(ram_metrics["percent_used"].strip("%"))
+            ram_usage = _pct(ram_metrics["percent_used"])
             ram_status = self._get_resource_status(
                 ram_usage,
                 warning_threshold=75,
@@ -208,119 +521,129 @@ class HardwareManager:
     ) -> Dict[str, str]:
         """Get detailed status for a resource with specific thresholds."""
         if usage >= critical_threshold:
-            return {
-                "message": f"🔴 Critical {resource_name} Usage",
-                "details": f"{resource_name} usage at {usage:.1f}% - Performance severely impacted",
-            }
+            level = "crit"
         elif usage >= warning_threshold:
-            return {
-                "message": f"🟡 High {resource_name} Load",
-                "details": f"{resource_name} usage at {usage:.1f}% - Monitor for performance impact",
-            }
+            level = "warn"
         else:
-            return {
-                "message": f"🟢 {resource_name} Optimal",
-                "details": f"{resource_name} usage at {usage:.1f}% - Operating normally",
-            }
+            level = "ok"
+        message, details = _RESOURCE_STATUS[(resource_name, level)]
+        return {"message": message, "details": details.format(u=usage)}
+
+    def _drive_percents(self, drives: List[Dict]) -> np.ndarray:
+        """Parse drive usage percentages once per drives list."""
+        cached_drives, pcts = self._drive_pcts
+        if cached_drives is not drives:
+            pcts = np.fromiter(
+                (_pct(d.get("percent_used", 0.0)) for d in drives),
+                dtype=np.float32,
+                count=len(drives),
+            )
+            self._drive_pcts = (drives, pcts)
+        return pcts
 
     def _get_aggregate_storage_status(self, drives: List[Dict]) -> Dict[str, str]:
         """Get aggregated storage status across all drives."""
-        critical_drives = []
-        warning_drives = []
-
-        for drive in drives:
-            usage = float(drive["percent_used"].strip("%"))
-            if usage > 90:
-                critical_drives.append(drive["device"])
-            elif usage > 80:
-                warning_drives.append(drive["device"])
+        pcts = self._drive_percents(drives)
+        devices = np.array([d["device"] for d in drives], dtype=object)
+        critical_drives = devices[pcts > 90].tolist()
+        warning_drives = devices[(pcts > 80) & (pcts <= 90)].tolist()
 
         if critical_drives:
             return {
-                "message": "🔴 Critical Storage Space",
-                "details": f"Critical space on drives: {', '.join(critical_drives)}",
+                "message": _STORAGE_CRITICAL,
+                "details": "Critical space on drives: " + ", ".join(critical_drives),
             }
         elif warning_drives:
             return {
-                "message": "🟡 Storage Space Warning",
-                "details": f"Low space on drives: {', '.join(warning_drives)}",
+                "message": _STORAGE_WARNING,
+                "details": "Low space on drives: " + ", ".join(warning_drives),
             }
-        return {
-            "message": "🟢 Storage Optimal",
-            "details": "All drives have adequate free space",
-        }
+        return dict(_STORAGE_OPTIMAL)
 
     def to_json(self, pretty: bool = True) -> str:
         """Convert hardware summary to formatted JSON."""
-        return json.dumps(self.get_hardware_summary(), indent=4 if pretty else None)
+        return dumps_json(self.get_hardware_summary(), indent=pretty).decode("utf-8")
+
+    def _post_summary(self, url: str, timeout: int):
+        """POST the hardware summary as pre-serialized JSON."""
+        return get_http_session().post(
+            url,
+            data=dumps_json(self.get_hardware_summary(), indent=False),
+            headers={"Content-Type": "application/json"},
+            timeout=timeout,
+        )
 
     def export_to_web(self, api_url: str, timeout: int = 10) -> None:
         """Export hardware summary to web API with enhanced error handling."""
+        requests = _lazy_module("requests")
         try:
-            response = requests.post(
-                api_url, json=self.get_hardware_summary(), timeout=timeout
-            )
+            response = self._post_summary(api_url, timeout)
             response.raise_for_status()
-            logging.info("✓ Hardware summary exported to web successfully")
+            self.logger.info("✓ Hardware summary exported to web successfully")
         except requests.exceptions.RequestException as e:
-            logging.error(f"✗ Web export failed: {e}")
+            self.logger.error(f"✗ Web export failed: {e}")
             raise
 
     def save_to_file(self, file_path: str, format: str = "json") -> None:
         """Save hardware summary to file with format options."""
         try:
             if format.lower() == "json":
-                with open(file_path, "w") as f:
-                    f.write(self.to_json())
+                with open(file_path, "wb") as f:
+                    f.write(dumps_json(self.get_hardware_summary()))
             elif format.lower() == "csv":
-                summary = self.get_hardware_summary()
-                with open(file_path, "w", newline="") as f:
-                    writer = csv.writer(f)
-                    for section, data in summary.items():
-                        writer.writerow([section.upper()])
-                        if isinstance(data, dict):
-                            for key, value in data.items():
-                                writer.writerow([key, value])
-                        writer.writerow([])
-            logging.info(f"✓ Hardware summary saved to {file_path}")
+                self._write_summary_csv(file_path, self.get_hardware_summary())
+            self.logger.info(f"✓ Hardware summary saved to {file_path}")
         except Exception as e:
-            logging.error(f"✗ File save failed: {e}")
+            self.logger.error(f"✗ File save failed: {e}")
             raise
 
+    @staticmethod
+    def _write_summary_csv(file_path: str, summary: Dict[str, Any]) -> None:
+        """Write a summary as CSV, one block of key/value rows per section."""
+        with open(file_path, "w", newline="", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            for section, data in summary.items():
+                rows = [[section.upper()]]
+                if isinstance(data, dict):
+                    rows.extend([key, value] for key, value in data.items())
+                rows.append([])
+                writer.writerows(rows)
+
     def export_to_mobile(self, mobile_api_url):
         """Send hardware summary to a mobile app API."""
+        requests = _lazy_module("requests")
         try:
-            summary = self.get_hardware_summary()
-            response = requests.post(mobile_api_url, json=summary, timeout=10)
+            response = self._post_summary(mobile_api_url, 10)
             response.raise_for_status()
-            logging.info("Hardware summary successfully sent to the mobile app.")
+            self.logger.info("Hardware summary successfully sent to the mobile app.")
             print("Hardware summary successfully sent to the mobile app.")
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error sending hardware summary to mobile app: {e}")
+            self.logger.error(f"Error sending hardware summary to mobile app: {e}")
             print(f"Error sending hardware summary to mobile app: {e}")
 
     def log_to_file(self, log_file_path):
         """Append hardware summary to a log file."""
         try:
-            with open(log_file_path, "a") as log_file:
-                log_file.write(self.to_json() + "\n")
-            logging.info(f"Hardware summary logged to: {log_file_path}")
+            with open(log_file_path, "ab") as log_file:
+                log_file.write(dumps_json(self.get_hardware_summary()) + b"\n")
+            self.logger.info(f"Hardware summary logged to: {log_file_path}")
             print(f"Hardware summary logged to: {log_file_path}")
         except Exception as e:
-            logging.error(f"Error logging hardware summary to file: {e}")
+            self.logger.error(f"Error logging hardware summary to file: {e}")
             print(f"Error logging hardware summary to file: {e}")
 
     def get_cpu_usage(self):
         """Get current CPU usage with error handling."""
         try:
-            return float(self.cpu.get_detailed_metrics()["current_usage"].strip("%"))
+            # The component keeps the numeric sample; skip the display string
+            return float(self.cpu.current_usage)
         except Exception:
             return 0.0
 
     def get_ram_usage(self):
         """Get current RAM usage with error handling."""
         try:
-            return float(self.ram.get_detailed_metrics()["percent_used"].strip("%"))
+            return float(self.ram.percent)
         except Exception:
             return 0.0
 
@@ -335,16 +658,24 @@ class HardwareManager:
         except Exception:
             return 0.0
 
+    def get_usage_vector(self):
+        """Get current (cpu, ram, gpu) usage percentages in one call."""
+        # Each getter reads the last refreshed sample, so nothing here blocks
+        return self.get_cpu_usage(), self.get_ram_usage(), self.get_gpu_usage()
+
+    @synchronized
+    def snapshot(self) -> MetricsSnapshot:
+        """Refresh the components once and read everything the UI shows."""
+        # The summary updates the components, so read usage after it
+        summary = self.get_formatted_summary()
+        return MetricsSnapshot(*self.get_usage_vector(), summary)
+
     def cleanup(self):
         """Cleanup resources properly."""
         try:
-            # Close any open handlers
-            for handler in self.logger.handlers[:]:
-                try:
-                    handler.close()
-                    self.logger.removeHandler(handler)
-                except Exception as e:
-                    self.logger.error(f"Error closing handler: {e}")
+            pool = getattr(self, "_refresh_pool", None)
+            if pool is not None:
+                pool.shutdown(wait=True)
 
             # Cleanup components with error handling
             components = ["gpu", "cpu", "ram", "storage"]
@@ -357,6 +688,11 @@ class HardwareManager:
                         self.logger.error(f"Error cleaning up {component_name}: {e}")
 
             self.logger.info("Hardware Manager cleanup completed")
+
+            # The queue handler is shared with the other managers and its
+            # listener stops at exit, so detach it without closing it
+            for handler in self.logger.handlers[:]:
+                self.logger.removeHandler(handler)
         except Exception as e:
             print(f"Error during cleanup: {e}")
 
@@ -364,168 +700,162 @@ class HardwareManager:
         """String representation of hardware summary."""
         return self.to_json()
 
+    @synchronized
     def get_formatted_summary(self) -> str:
         """Get pre-formatted hardware summary for display."""
         try:
             summary = self.get_hardware_summary()
-            sections = []
-
-            # Headers with improved formatting
-            headers = {
-                "SYSTEM": "💻 SYSTEM INFORMATION",
-                "CPU": "⚡ CPU INFORMATION",
-                "MEMORY": "🧮 MEMORY STATUS",
-                "GPU": "🎮 GPU INFORMATION",
-                "STORAGE": "💾 STORAGE DEVICES",
-                "STATUS": "📊 SYSTEM STATUS",
-            }
 
-            # Format each section with caching for performance
-            sections.extend(
-                self._format_system_section(summary["system_info"], headers["SYSTEM"])
-            )
-            sections.extend(self._format_cpu_section(summary["cpu"], headers["CPU"]))
-            sections.extend(
-                self._format_memory_section(summary["ram"], headers["MEMORY"])
-            )
-            sections.extend(self._format_gpu_section(summary["gpu"], headers["GPU"]))
-            sections.extend(
-                self._format_storage_section(summary["storage"], headers["STORAGE"])
-            )
-            sections.extend(
-                self._format_status_section(
-                    summary["performance_status"], headers["STATUS"]
-                )
-            )
+            # Sections whose displayed values did not change are reused
+            key = self._formatted_summary_key(summary)
+            body = self._format_summary_body(summary, key)
 
             # Add timestamp with icon
-            sections.append(f"\n⏰ Last Updated: {summary['timestamp']}")
-
-            return "\n".join(sections)
+            return f"{body}\n\n⏰ Last Updated: {summary['timestamp']}"
 
         except Exception as e:
             self.logger.error(f"Error formatting summary: {e}")
             return "Error generating formatted summary"
 
+    @staticmethod
+    def _formatted_summary_key(summary: Dict[str, Any]) -> tuple:
+        """Build a key from every summary value the formatted sections display."""
+        cpu = summary["cpu"]
+        ram = summary["ram"]
+        status = summary["performance_status"]
+        return (
+            tuple(
+                cpu.get(k)
+                for k in ("name", "cores", "threads", "frequency", "current_usage")
+            ),
+            (ram["total"], ram["used"], ram["available"], ram["percent_used"]),
+            tuple(
+                (g.get("name"), g.get("memory_total"), g.get("driver_version"))
+                for g in summary["gpu"]["gpus"]
+            ),
+            tuple(
+                tuple(d.get(k) for k in ("device", "type", "total", "used", "free"))
+                + (d.get("percent_used"),)
+                for d in summary["storage"]["drives"]
+            ),
+            (status["cpu_status"], status["ram_status"], status["storage_status"]),
+        )
+
+    def _format_summary_body(self, summary: Dict[str, Any], key: tuple) -> str:
+        """Format every section of a summary, without the timestamp line."""
+        # System info never changes, so its section is formatted once
+        sections = list(self._system_section_cached)
+
+        # Reuse each section whose displayed values match the last render
+        cache = self._section_cache
+        for (field, header, formatter), part in zip(_SUMMARY_SECTIONS, key):
+            cached = cache.get(field)
+            if cached is None or cached[0] != part:
+                format_section = getattr(self, formatter)
+                lines = format_section(summary[field], _SECTION_HEADERS[header])
+                cached = cache[field] = (part, lines)
+            sections.extend(cached[1])
+        return "\n".join(sections)
+
     def _format_system_section(self, system_info: dict, header: str) -> List[str]:
         """Format system information section."""
-        sections = []
-        sections.append("╔════════════════ " + header + " ════════════════╗")
-        for key, value in system_info.items():
-            sections.append(f"║  {key.replace('_', ' ').title():<15}: {value:<35} ║")
-        sections.append("╚══════════════════════════════════════════════════╝")
-        return sections
+        rows = "".join(
+            _SYSTEM_ROW_TMPL.format(key=key.replace("_", " ").title(), value=value)
+            for key, value in system_info.items()
+        )
+        return [_SYSTEM_TMPL.format(top=_header_box(header), rows=rows)]
 
     def _format_cpu_section(self, cpu_info: dict, header: str) -> List[str]:
         """Format CPU information section with error handling."""
-        sections = []
-        sections.append("\n╔════════════════ " + header + " ════════════════╗")
         try:
             # Handle potentially missing or None values with defaults
-            model = cpu_info.get("name", "Unknown")
-            cores = cpu_info.get("cores", "?")
-            threads = cpu_info.get("threads", "?")
-            freq = cpu_info.get("frequency", "Unknown")
-            usage = cpu_info.get("current_usage", "0%")
-
-            # Strip '%' and convert to float, with error handling
             try:
-                usage_value = float(
-                    usage.strip("%") if isinstance(usage, str) else usage
-                )
-            except (ValueError, AttributeError):
+                usage_value = _pct(cpu_info.get("current_usage", "0%"))
+            except (ValueError, TypeError):
                 usage_value = 0.0
 
-            # Format the sections with proper padding
-            sections.append(f"║  Model      : {str(model):<35} ║")
-            sections.append(f"║  Cores      : {cores} Physical, {threads} Logical ║")
-            sections.append(f"║  Frequency  : {str(freq):<35} ║")
-            sections.append(
-                f"║  Usage      : {self._get_status_indicator(usage_value):<35} ║"
-            )
+            return [
+                _CPU_TMPL.format_map(
+                    {
+                        "top": _header_box(header),
+                        "model": str(cpu_info.get("name", "Unknown")),
+                        "cores": cpu_info.get("cores", "?"),
+                        "threads": cpu_info.get("threads", "?"),
+                        "freq": str(cpu_info.get("frequency", "Unknown")),
+                        "usage": self._get_status_indicator(usage_value),
+                    }
+                )
+            ]
 
         except Exception as e:
             self.logger.error(f"Error formatting CPU section: {e}")
-            sections.append(f"║  Error: Could not retrieve CPU information        ║")
-
-        sections.append("╚══════════════════════════════════════════════════╝")
-        return sections
+            return [_CPU_ERROR_TMPL.format(top=_header_box(header))]
 
     def _format_memory_section(self, ram_info: dict, header: str) -> List[str]:
         """Format memory information section."""
-        sections = []
-        sections.append("\n╔════════════════ " + header + " ════════════════╗")
-        total = float(ram_info["total"].split()[0])
-        used = float(ram_info["used"].split()[0])
-        percent = float(ram_info["percent_used"].strip("%"))
-        sections.append(
-            f"║  Total      : {total:>6.2f} GB {self._get_memory_bar(percent)} ║"
-        )
-        sections.append(f"║  Used       : {used:>6.2f} GB ({percent}%) ║")
-        sections.append(
-            f"║  Available  : {float(ram_info['available'].split()[0]):>6.2f} GB ║"
-        )
-        sections.append("╚══════════════════════════════════════════════════╝")
-        return sections
+        percent = _pct(ram_info["percent_used"])
+        return [
+            _MEMORY_TMPL.format_map(
+                {
+                    "top": _header_box(header),
+                    "total": _gb(ram_info["total"]),
+                    "used": _gb(ram_info["used"]),
+                    "available": _gb(ram_info["available"]),
+                    "percent": percent,
+                    "bar": self._get_memory_bar(percent),
+                }
+            )
+        ]
 
     def _format_gpu_section(self, gpu_info: dict, header: str) -> List[str]:
         """Format GPU information section with accurate memory reporting."""
-        sections = []
-        sections.append("\n╔════════════════ " + header + " ════════════════╗")
+        rows = []
         for gpu in gpu_info["gpus"]:
-            sections.append(f"║  Model      : {gpu['name']:<35} ║")
             memory = gpu.get("memory_total", "Memory size unknown")
             if memory != "Memory size unknown" and not isinstance(memory, str):
                 memory = f"{memory / (1024**3):.2f} GB"
-            sections.append(f"║  Memory     : {memory:<35} ║")
-            sections.append(f"║  Driver     : {gpu['driver_version']:<35} ║")
-        sections.append("╚══════════════════════════════════════════════════╝")
-        return sections
+            rows.append(
+                _GPU_ROW_TMPL.format(
+                    name=gpu["name"], memory=memory, driver=gpu["driver_version"]
+                )
+            )
+        return [_SECTION_TMPL.format(top=_header_box(header), rows="".join(rows))]
 
     def _format_storage_section(self, storage_info: dict, header: str) -> List[str]:
         """Format storage information section."""
-        sections = []
-        sections.append("\n╔════════════════ " + header + " ════════════════╗")
-        for drive in storage_info["drives"]:
-            percent = float(drive["percent_used"].strip("%"))
-            label = f"{drive['device']} ({drive['type']})"
-            sections.append(f"║  {label:<44} ║")
-            sections.append(f"║  {self._get_storage_bar(percent)} [{percent:>5.1f}%] ║")
-            sections.append(
-                f"║  Total: {drive['total']:<10} Used: {drive['used']:<10} Free: {drive['free']:<10} ║"
+        drives = storage_info["drives"]
+        rows = "".join(
+            _STORAGE_ROW_TMPL.format_map(
+                {
+                    "label": f"{drive['device']} ({drive['type']})",
+                    "bar": self._get_storage_bar(percent),
+                    "percent": percent,
+                    "total": drive["total"],
+                    "used": drive["used"],
+                    "free": drive["free"],
+                }
             )
-            sections.append("║──────────────────────────────────────────────────║")
-        sections.append("╚══════════════════════════════════════════════════╝")
-        return sections
+            for drive, percent in zip(drives, self._drive_percents(drives).tolist())
+        )
+        return [_SECTION_TMPL.format(top=_header_box(header), rows=rows)]
 
     def _format_status_section(self, status: dict, header: str) -> List[str]:
         """Format system status section."""
-        sections = []
-        sections.append("\n╔════════════════ " + header + " ════════════════╗")
-        sections.append(f"║  CPU Status    : {status['cpu_status']:<35} ║")
-        sections.append(f"║  RAM Status    : {status['ram_status']:<35} ║")
-        sections.append(f"║  Storage Status: {status['storage_status']:<35} ║")
-        sections.append("╚══════════════════════════════════════════════════╝")
-        return sections
+        return [_STATUS_TMPL.format_map(dict(status, top=_header_box(header)))]
 
     def _get_memory_bar(self, percent: float) -> str:
         """Generate memory usage bar."""
-        width = 20
-        filled = int(width * percent / 100)
-        bar = "█" * filled + "░" * (width - filled)
-        return f"[{bar}]"
+        return _MEM_BARS[max(0, min(20, int(0.2 * percent)))]
 
     def _get_storage_bar(self, percent: float) -> str:
         """Generate storage usage bar."""
-        width = 40
-        filled = int(width * percent / 100)
         if percent < 60:
-            bar = "█" * filled + "░" * (width - filled)
+            bars = _STOR_BARS_LIGHT
         elif percent < 80:
-            bar = "▒" * filled + "░" * (width - filled)
+            bars = _STOR_BARS_MED
         else:
-            bar = "▓" * filled + "░" * (width - filled)
-        return f"[{bar}]"
+            bars = _STOR_BARS_HEAVY
+        return bars[max(0, min(40, int(0.4 * percent)))]
 
     def _format_hardware_summary(self, summary):
         """Format hardware summary for display with error handling."""
@@ -543,12 +873,11 @@ class HardwareManager:
                 f"║  Frequency  : {cpu_info.get('frequency', 'Unknown'):<35} ║"
             )
             usage = cpu_info.get("current_usage", "0%")
-            if isinstance(usage, str):
-                usage = float(usage.strip("%"))
+            usage = _pct(usage)
             sections.append(
                 f"║  Usage      : {self._get_status_indicator(usage):<35} ║"
             )
-            sections.append("╚══════════════════════════════════════════════════╝")
+            sections.append(_BOX_BOTTOM)
 
             # ...rest of existing code...
 
@@ -558,56 +887,50 @@ class HardwareManager:
 
     def generate_performance_graphs(self):
         """Generate performance graphs for CPU, RAM, and GPU usage."""
-        if not hasattr(self, "performance_history") or not self.performance_history:
+        if not getattr(self, "_perf_idx", 0):
             return None
 
         try:
-            # Extract data
-            timestamps = [entry["timestamp"] for entry in self.performance_history]
-            cpu_usage = [
-                entry["metrics"].get("cpu", {}).get("usage", 0)
-                for entry in self.performance_history
-            ]
-            ram_usage = [
-                entry["metrics"].get("ram", {}).get("usage", 0)
-                for entry in self.performance_history
-            ]
-            gpu_usage = [
-                entry["metrics"].get("gpu", {}).get("usage", 0)
-                for entry in self.performance_history
-            ]
+            # Extract and downsample each series to at most GRAPH_POINTS
+            rows = self._performance_rows()
+            t = rows["t"]
+            series = {}
+            for key in ("cpu", "ram", "gpu"):
+                idx = _lttb_indices(t, rows[key], GRAPH_POINTS)
+                series[key] = ((t[idx] * 1e6).astype("datetime64[us]"), rows[key][idx])
 
             # Create figure with subplots
-            fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(10, 8))
+            # A standalone Figure renders with Agg and never touches pyplot's
+            # GUI backend
+            fig = _lazy_module("matplotlib.figure").Figure(figsize=(10, 8))
+            ax1, ax2, ax3 = fig.subplots(3, 1)
             fig.suptitle("System Performance History")
 
             # CPU Usage
-            ax1.plot(timestamps, cpu_usage, "b-", label="CPU")
+            ax1.plot(*series["cpu"], "b-", label="CPU")
             ax1.set_ylabel("CPU Usage %")
             ax1.grid(True)
             ax1.legend()
 
             # RAM Usage
-            ax2.plot(timestamps, ram_usage, "g-", label="RAM")
+            ax2.plot(*series["ram"], "g-", label="RAM")
             ax2.set_ylabel("RAM Usage %")
             ax2.grid(True)
             ax2.legend()
 
             # GPU Usage
-            ax3.plot(timestamps, gpu_usage, "r-", label="GPU")
+            ax3.plot(*series["gpu"], "r-", label="GPU")
             ax3.set_ylabel("GPU Usage %")
             ax3.grid(True)
             ax3.legend()
 
             # Rotate x-axis labels for better readability
-            plt.xticks(rotation=45)
-            plt.tight_layout()
+            ax3.tick_params(axis="x", labelrotation=45)
+            fig.tight_layout()
 
             # Convert plot to base64 string
             buf = BytesIO()
-            plt.savefig(buf, format="png", dpi=300, bbox_inches="tight")
-            buf.seek(0)
-            plt.close()
+            fig.savefig(buf, format="png", dpi=120, bbox_inches="tight")
 
             return base64.b64encode(buf.getvalue()).decode("utf-8")
 
@@ -618,12 +941,18 @@ class HardwareManager:
     def export_performance_report(self, file_path, format="pdf"):
         """Export comprehensive performance report."""
         try:
+            # Poll the hardware once and share the result with every writer
+            summary = self.get_hardware_summary()
             if format == "pdf":
-                self._export_pdf_report(file_path)
+                self._export_pdf_report(
+                    file_path, summary, self.generate_performance_graphs()
+                )
             elif format == "html":
-                self._export_html_report(file_path)
+                self._export_html_report(
+                    file_path, summary, self.generate_performance_graphs()
+                )
             elif format == "csv":
-                self._export_csv_report(file_path)
+                self._export_csv_report(file_path, summary)
 
             self.logger.info(f"Performance report exported to {file_path}")
             return True
@@ -632,7 +961,7 @@ class HardwareManager:
             self.logger.error(f"Error exporting performance report: {e}")
             return False
 
-    def _export_pdf_report(self, file_path):
+    def _export_pdf_report(self, file_path, summary, graph_data=None):
         """Export report as PDF."""
         try:
             from reportlab.lib import colors
@@ -642,6 +971,7 @@ class HardwareManager:
                 Table,
                 TableStyle,
                 Paragraph,
+                Image,
             )
             from reportlab.lib.styles import getSampleStyleSheet
 
@@ -652,9 +982,6 @@ class HardwareManager:
             # Add title
             elements.append(Paragraph("System Performance Report", styles["Title"]))
 
-            # Add current metrics
-            summary = self.get_hardware_summary()
-
             # Create tables for each section
             for section, data in summary.items():
                 elements.append(Paragraph(section.upper(), styles["Heading1"]))
@@ -676,17 +1003,12 @@ class HardwareManager:
                     )
                     elements.append(t)
 
-            # Generate and add performance graphs
-            graph_data = self.generate_performance_graphs()
+            # Add performance graphs
             if graph_data:
-                # Add performance graphs to PDF
-                img_data = base64.b64decode(graph_data)
-                img_path = "temp_graph.png"
-                with open(img_path, "wb") as f:
-                    f.write(img_data)
+                # reportlab reads the PNG straight from memory
+                img = BytesIO(base64.b64decode(graph_data))
                 elements.append(Paragraph("Performance Graphs", styles["Heading1"]))
-                elements.append(Image(img_path))
-                os.remove(img_path)
+                elements.append(Image(img))
 
             doc.build(elements)
 
@@ -694,6 +1016,47 @@ class HardwareManager:
             self.logger.error(f"Error creating PDF report: {e}")
             raise
 
+    def _export_html_report(self, file_path, summary, graph_data=None):
+        """Export report as HTML."""
+        try:
+            parts = [
+                "<!DOCTYPE html><html><head><meta charset='utf-8'>",
+                "<title>System Performance Report</title></head><body>",
+                "<h1>System Performance Report</h1>",
+            ]
+            for section, data in summary.items():
+                parts.append(f"<h2>{html.escape(section.upper())}</h2>")
+                if isinstance(data, dict):
+                    parts.append("<table border='1'>")
+                    parts.extend(
+                        f"<tr><td>{html.escape(str(k))}</td>"
+                        f"<td>{html.escape(str(v))}</td></tr>"
+                        for k, v in data.items()
+                    )
+                    parts.append("</table>")
+                else:
+                    parts.append(f"<p>{html.escape(str(data))}</p>")
+
+            if graph_data:
+                parts.append("<h2>Performance Graphs</h2>")
+                parts.append(f"<img src='data:image/png;base64,{graph_data}'>")
+            parts.append("</body></html>")
+
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write("".join(parts))
+
+        except Exception as e:
+            self.logger.error(f"Error creating HTML report: {e}")
+            raise
+
+    def _export_csv_report(self, file_path, summary):
+        """Export report as CSV."""
+        try:
+            self._write_summary_csv(file_path, summary)
+        except Exception as e:
+            self.logger.error(f"Error creating CSV report: {e}")
+            raise
+
 
 # Example usage
 if __name__ == "__main__":
@@ -1,30 +1,214 @@
 import os
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+import time
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 import sys
 
+from core.utils import ensure_dir
+
+MANAGER_LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+
+class FastFormatter(logging.Formatter):
+    """Formatter that reuses the formatted asctime second across records."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = None
+        self._last_str = ""
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_str = time.strftime("%Y-%m-%d %H:%M:%S", self.converter(sec))
+        return f"{self._last_str},{int(record.msecs):03d}"
+
+
+class CheapRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that tracks written size instead of seeking per record."""
+
+    # The stock shouldRollover() does a seek+tell on every record; this one
+    # keeps an upper bound on the file size (4 bytes per character, the UTF-8
+    # maximum) and only asks the file once that bound reaches maxBytes.
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        try:
+            self._approx_bytes = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._approx_bytes = 0
+
+    def format(self, record):
+        msg = super().format(record)
+        self._approx_bytes += 4 * (len(msg) + len(self.terminator))
+        return msg
+
+    def shouldRollover(self, record):
+        if self.maxBytes <= 0 or self._approx_bytes < self.maxBytes:
+            return False
+        if self.stream is not None:
+            # Resync with the real size before deciding
+            self.stream.seek(0, 2)
+            self._approx_bytes = self.stream.tell()
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        super().doRollover()
+        self._approx_bytes = 0
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler with a 1 MiB stream buffer that is only flushed on flush()."""
+
+    # FileHandler flushes after every record, which defeats a large buffer;
+    # pair this with IntervalMemoryHandler, which flushes it once per batch
+
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode, encoding=self.encoding, buffering=1 << 20
+        )
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class IntervalMemoryHandler(MemoryHandler):
+    """MemoryHandler that also flushes flush_interval seconds after its last flush."""
+
+    def __init__(self, target, capacity=1024, flush_interval=30.0):
+        super().__init__(
+            capacity, flushLevel=logging.ERROR, target=target, flushOnClose=True
+        )
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+
+    def shouldFlush(self, record):
+        return (
+            super().shouldFlush(record)
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        )
+
+    def flush(self):
+        super().flush()
+        if self.target is not None:
+            self.target.flush()
+        self._last_flush = time.monotonic()
+
+
+class _FileRouter(logging.Handler):
+    """Dispatch queued records to the rotating file registered for their logger."""
+
+    def __init__(self):
+        super().__init__()
+        self.routes = {}
+        # Root-level handlers from setup_logging(); they see every record
+        self.sinks = []
+
+    def emit(self, record):
+        # A propagated manager record is queued twice: once by the manager's
+        # handler (routed to its file) and once by the root's (sinks only)
+        if getattr(record, "_root_sink", False):
+            for sink in self.sinks:
+                if record.levelno >= sink.level:
+                    sink.handle(record)
+            return
+        handler = self.routes.get(record.name)
+        if handler is not None:
+            handler.handle(record)
+
+
+class _RootQueueHandler(QueueHandler):
+    """Queue handler for the root logger; marks records for the root sinks."""
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record._root_sink = True
+        return record
+
+
+# A single queue and listener thread serve every manager logger
+_log_queue = queue.Queue(-1)
+_queue_handler = QueueHandler(_log_queue)
+_root_queue_handler = _RootQueueHandler(_log_queue)
+_router = _FileRouter()
+_listener = None
+_bus_lock = threading.Lock()
+
+
+def _start_listener():
+    """Start the shared listener thread; the caller holds _bus_lock."""
+    global _listener
+    if _listener is None:
+        _listener = QueueListener(_log_queue, _router)
+        _listener.start()
+        atexit.register(_stop_listener)
+
+
+def _stop_listener():
+    """Flush the queue at exit unless a caller already stopped the listener."""
+    # QueueListener.stop() is not idempotent before Python 3.12
+    if _listener is not None and _listener._thread is not None:
+        _listener.stop()
+
+
+def attach_root_sinks(*sinks):
+    """Serve root-level handlers from the shared listener thread."""
+    # The root logger only enqueues; formatting and I/O for every sink
+    # happen on the listener, which flushes them at exit
+    with _bus_lock:
+        _router.sinks.extend(sinks)
+        _start_listener()
+    root = logging.getLogger()
+    if _root_queue_handler not in root.handlers:
+        root.addHandler(_root_queue_handler)
+    return _listener
+
 
 def setup_logging():
     """Setup base logging configuration."""
     # Create logs directory in the project root
     base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
     logs_dir = os.path.join(base_dir, "logs")
-    os.makedirs(logs_dir, exist_ok=True)
-
-    # Configure root logger
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            RotatingFileHandler(
-                os.path.join(logs_dir, "hardware_analyzer.log"),
-                maxBytes=10485760,  # 10MB
-                backupCount=5,
-                encoding="utf-8",
-            ),
-            logging.StreamHandler(),
-        ],
+    ensure_dir(logs_dir)
+
+    # Configure root logger; like basicConfig, leave existing handlers alone
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    root.setLevel(logging.INFO)
+
+    formatter = FastFormatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
+    file_handler = CheapRotatingFileHandler(
+        os.path.join(logs_dir, "hardware_analyzer.log"),
+        maxBytes=10485760,  # 10MB
+        backupCount=5,
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(formatter)
+    # Per-tick INFO lines stay in the file; the console only shows problems
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setLevel(logging.WARNING)
+    console_handler.setFormatter(formatter)
+
+    attach_root_sinks(IntervalMemoryHandler(file_handler), console_handler)
 
 
 def get_logger(name, filename):
@@ -35,25 +219,51 @@ def get_logger(name, filename):
     # Create logs directory if it doesn't exist
     base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
     logs_dir = os.path.join(base_dir, "logs")
-    os.makedirs(logs_dir, exist_ok=True)
+    ensure_dir(logs_dir)
 
     # File handler
-    file_handler = RotatingFileHandler(
+    file_handler = CheapRotatingFileHandler(
         os.path.join(logs_dir, filename),
         maxBytes=10485760,  # 10MB
         backupCount=5,
         encoding="utf-8",
     )
     file_handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        FastFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     )
     logger.addHandler(file_handler)
 
     # Console handler
-    console_handler = logging.StreamHandler()
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setLevel(logging.WARNING)
     console_handler.setFormatter(
         logging.Formatter("%(name)s - %(levelname)s - %(message)s")
     )
     logger.addHandler(console_handler)
 
     return logger
+
+
+def get_manager_logger(name, log_dir="logs", filename=None):
+    """Get a manager logger that writes to its own file via the shared queue."""
+    # One QueueHandler/QueueListener pair serves every manager; the listener
+    # routes records by logger name, e.g. CPU_Manager -> cpu_manager.log
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+
+    with _bus_lock:
+        if name not in _router.routes:
+            ensure_dir(log_dir)
+            file_handler = CheapRotatingFileHandler(
+                os.path.join(log_dir, filename or f"{name.lower()}.log"),
+                maxBytes=10485760,  # 10MB
+                backupCount=5,
+                encoding="utf-8",
+            )
+            file_handler.setFormatter(FastFormatter(MANAGER_LOG_FORMAT))
+            _router.routes[name] = file_handler
+
+        _start_listener()
+
+    logger.addHandler(_queue_handler)
+    return logger
@@ -4,24 +4,54 @@ Network-related utilities.
 
 import psutil
 import json
-import logging
-import logging.handlers
 import os
-from datetime import datetime
+import time
+from collections import deque
 from typing import Dict, List, Any
+
+from core.logging_util import get_manager_logger
+from core.utils import (
+    cached_timestamp,
+    dumps_json,
+    ensure_dir,
+    get_http_session,
+    synchronized,
+)
 import socket
-import requests
+import threading
+
+# The subset of the I/O counters reported by get_network_summary
+_SUMMARY_IO_KEYS = (
+    "bytes_sent",
+    "bytes_recv",
+    "packets_sent",
+    "packets_recv",
+    "errin",
+    "errout",
+)
 
 
 class Network:
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: str = "logs", conn_ttl: float = 10.0):
         """Initialize Network monitoring with enhanced features."""
         self.log_dir = log_dir
-        self.history = []
         self.max_history_size = 100
+        self.history = deque(maxlen=self.max_history_size)
+        # net_connections() walks every process's sockets, so reuse its result
+        self._conn_ttl = conn_ttl
+        self._conn_cache = (0.0, None)
+        self.connections = []
+        # net_if_addrs()/net_if_stats() are shared by the interface helpers
+        self._if_ttl = 5.0
+        self._if_cache = {"addrs": None, "stats": None, "ts": 0.0}
+        # The external IP rarely changes, so the ipify lookup is reused too
+        self._ext_ip_ttl = 300.0
+        self._ext_ip_cache = (0.0, None)
+        # Serializes samplers on different threads over the caches above
+        self._lock = threading.RLock()
 
         # Create log directory
-        os.makedirs(log_dir, exist_ok=True)
+        ensure_dir(log_dir)
 
         # Setup logging
         self.setup_logging()
@@ -30,78 +60,78 @@ class Network:
         self.update_metrics()
 
     def setup_logging(self):
-        """Setup enhanced logging configuration."""
-        log_file = os.path.join(self.log_dir, "network_manager.log")
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file, maxBytes=10485760, backupCount=5
-        )
-        file_handler.setFormatter(formatter)
+        """Attach the manager logger to the shared background log writer."""
+        self.logger = get_manager_logger("Network_Manager", self.log_dir)
 
-        self.logger = logging.getLogger("Network_Manager")
-        self.logger.setLevel(logging.INFO)
-        self.logger.addHandler(file_handler)
-
-    def update_metrics(self):
+    @synchronized
+    def update_metrics(self, include_connections: bool = True):
         """Update network metrics."""
         try:
             self.interfaces = self._get_network_interfaces()
-            self.connections = self._get_network_connections()
+            if include_connections:
+                self.connections = self._get_network_connections()
             self.io_counters = self._get_io_counters()
-            self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.timestamp = cached_timestamp()
             self._update_history()
-            self.logger.info("Network metrics updated successfully")
+            self.logger.debug("Network metrics updated successfully")
         except Exception as e:
             self.logger.error(f"Error updating network metrics: {e}")
             raise
 
+    def _get_if_info(self):
+        """Get (net_if_addrs, net_if_stats), re-reading them after _if_ttl."""
+        cache = self._if_cache
+        now = time.monotonic()
+        if cache["addrs"] is None or now - cache["ts"] > self._if_ttl:
+            cache["addrs"] = psutil.net_if_addrs()
+            cache["stats"] = psutil.net_if_stats()
+            cache["ts"] = now
+        return cache["addrs"], cache["stats"]
+
     def _get_network_interfaces(self) -> List[Dict[str, Any]]:
         """Get detailed network interface information."""
-        interfaces = []
-
-        # Get addresses for all interfaces
-        net_if_addrs = psutil.net_if_addrs()
-        net_if_stats = psutil.net_if_stats()
+        return self._build_interfaces(*self._get_if_info())
 
+    @staticmethod
+    def _build_interfaces(net_if_addrs, net_if_stats) -> List[Dict[str, Any]]:
+        """Build interface dicts from already-fetched addresses and stats."""
+        interfaces = []
         for interface_name, addresses in net_if_addrs.items():
             interface_info = {
                 "name": interface_name,
-                "addresses": [],
                 "status": "Down",
                 "speed": None,
                 "mtu": None,
+                "addresses": [
+                    {
+                        "family": str(addr.family),
+                        "address": addr.address,
+                        "netmask": addr.netmask,
+                        "broadcast": addr.broadcast,
+                    }
+                    for addr in addresses
+                ],
             }
 
             # Get interface statistics
-            if interface_name in net_if_stats:
-                stats = net_if_stats[interface_name]
-                interface_info.update(
-                    {
-                        "status": "Up" if stats.isup else "Down",
-                        "speed": (
-                            f"{stats.speed} Mbps" if stats.speed > 0 else "Unknown"
-                        ),
-                        "mtu": stats.mtu,
-                    }
+            stats = net_if_stats.get(interface_name)
+            if stats is not None:
+                interface_info["status"] = "Up" if stats.isup else "Down"
+                interface_info["speed"] = (
+                    f"{stats.speed} Mbps" if stats.speed > 0 else "Unknown"
                 )
-
-            # Get IP addresses
-            for addr in addresses:
-                addr_info = {
-                    "family": str(addr.family),
-                    "address": addr.address,
-                    "netmask": addr.netmask if hasattr(addr, "netmask") else None,
-                    "broadcast": addr.broadcast if hasattr(addr, "broadcast") else None,
-                }
-                interface_info["addresses"].append(addr_info)
+                interface_info["mtu"] = stats.mtu
 
             interfaces.append(interface_info)
 
         return interfaces
 
     def _get_network_connections(self) -> List[Dict[str, Any]]:
-        """Get active network connections."""
+        """Get active network connections, cached for conn_ttl seconds."""
+        cached_at, cached = self._conn_cache
+        if cached is not None and time.monotonic() - cached_at < self._conn_ttl:
+            return cached
+
         connections = []
 
         try:
@@ -121,6 +151,7 @@ class Network:
         except (psutil.AccessDenied, psutil.NoSuchProcess):
             self.logger.warning("Access denied when fetching network connections")
 
+        self._conn_cache = (time.monotonic(), connections)
         return connections
 
     def _get_io_counters(self) -> Dict[str, Any]:
@@ -146,90 +177,28 @@ class Network:
         current_metrics = {"timestamp": self.timestamp, "io_counters": self.io_counters}
 
         self.history.append(current_metrics)
-        if len(self.history) > self.max_history_size:
-            self.history.pop(0)
 
-    def get_network_summary(self) -> dict:
+    def get_network_summary(self, include_connections: bool = True) -> dict:
         """Get comprehensive network summary."""
         try:
-            self.update_metrics()
-
-            stats = psutil.net_io_counters()
-            net_if_stats = psutil.net_if_stats()
-            net_if_addrs = psutil.net_if_addrs()
-
-            interfaces = []
-            for name, addrs in net_if_addrs.items():
-                interface = {
-                    "name": name,
-                    "status": "Up" if net_if_stats[name].isup else "Down",
-                    "speed": (
-                        f"{net_if_stats[name].speed} Mbps"
-                        if net_if_stats[name].speed > 0
-                        else "Unknown"
-                    ),
-                    "mtu": net_if_stats[name].mtu,
-                    "addresses": [],
-                }
-
-                for addr in addrs:
-                    addr_info = {
-                        "family": str(addr.family),
-                        "address": addr.address,
-                        "netmask": getattr(addr, "netmask", None),
-                        "broadcast": getattr(addr, "broadcast", None),
-                    }
-                    interface["addresses"].append(addr_info)
-
-                interfaces.append(interface)
+            with self._lock:
+                self.update_metrics(include_connections)
 
+                # update_metrics just read the interfaces and I/O counters
+                interfaces = self.interfaces
+                stats = self.io_counters
             return {
                 "interfaces": interfaces,
-                "io_stats": {
-                    "bytes_sent": stats.bytes_sent,
-                    "bytes_recv": stats.bytes_recv,
-                    "packets_sent": stats.packets_sent,
-                    "packets_recv": stats.packets_recv,
-                    "errin": stats.errin,
-                    "errout": stats.errout,
-                },
+                "io_stats": {key: stats.get(key) for key in _SUMMARY_IO_KEYS},
+                # Probed outside the lock; it can wait seconds on the network
                 "connectivity": self.test_internet_connection(),
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": cached_timestamp(),
             }
 
         except Exception as e:
             self.logger.error(f"Error getting network summary: {e}")
             return {"error": str(e), "connectivity": {"connected": False}}
 
-    def _get_interfaces_info(self) -> list:
-        """Get detailed network interface information."""
-        interfaces = []
-        stats = psutil.net_if_stats()
-        addrs = psutil.net_if_addrs()
-
-        for name, stat in stats.items():
-            interface = {
-                "name": name,
-                "status": "Up" if stat.isup else "Down",
-                "speed": f"{stat.speed} Mbps" if stat.speed > 0 else "Unknown",
-                "mtu": stat.mtu,
-                "addresses": [],
-            }
-
-            if name in addrs:
-                for addr in addrs[name]:
-                    address_info = {
-                        "family": str(addr.family),
-                        "address": addr.address,
-                        "netmask": getattr(addr, "netmask", None),
-                        "broadcast": getattr(addr, "broadcast", None),
-                    }
-                    interface["addresses"].append(address_info)
-
-            interfaces.append(interface)
-
-        return interfaces
-
     def _get_active_connections(self) -> list:
         """Get list of active network connections."""
         connections = []
@@ -250,7 +219,7 @@ class Network:
             pass
         return connections
 
-    def test_internet_connection(self) -> Dict[str, Any]:
+    def test_internet_connection(self, lookup_ip: bool = True) -> Dict[str, Any]:
         """Test internet connectivity with better error handling."""
         result = {
             "connected": False,
@@ -260,36 +229,59 @@ class Network:
         }
 
         try:
-            # Test basic connectivity (with timeout)
-            socket.create_connection(("8.8.8.8", 53), timeout=3)
+            # Test basic connectivity (with timeout); the TCP connect time
+            # doubles as the latency probe
+            start = time.perf_counter()
+            with socket.create_connection(("8.8.8.8", 53), timeout=3):
+                result["latency"] = (time.perf_counter() - start) * 1000
             result["connected"] = True
 
-            try:
-                # Get external IP (with timeout)
-                response = requests.get("https://api.ipify.org?format=json", timeout=5)
-                if response.status_code == 200:
-                    result["external_ip"] = response.json()["ip"]
-                    result["latency"] = response.elapsed.total_seconds() * 1000
-            except Exception as e:
-                result["error"] = f"IP lookup failed: {str(e)}"
+            if lookup_ip:
+                # Socket and HTTP waits stay outside the lock; only the cache
+                # tuple is read and replaced under it
+                with self._lock:
+                    cached_at, external_ip = self._ext_ip_cache
+                if (
+                    external_ip is not None
+                    and time.monotonic() - cached_at < self._ext_ip_ttl
+                ):
+                    result["external_ip"] = external_ip
+                else:
+                    try:
+                        # Get external IP (with timeout) over the pooled session
+                        response = get_http_session().get(
+                            "https://api.ipify.org?format=json", timeout=5
+                        )
+                        if response.status_code == 200:
+                            result["external_ip"] = response.json()["ip"]
+                            with self._lock:
+                                self._ext_ip_cache = (
+                                    time.monotonic(),
+                                    result["external_ip"],
+                                )
+                    except Exception as e:
+                        result["error"] = f"IP lookup failed: {str(e)}"
 
         except Exception as e:
+            # Look the IP up again once connectivity comes back
+            with self._lock:
+                self._ext_ip_cache = (0.0, None)
             result["error"] = f"Connection test failed: {str(e)}"
 
         return result
 
     def export_metrics(self, export_format: str = "json", output_dir: str = "metrics"):
         """Export network metrics in specified format."""
-        os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        ensure_dir(output_dir)
+        timestamp = cached_timestamp("%Y%m%d_%H%M%S")
 
         try:
             if export_format == "json":
                 file_path = os.path.join(
                     output_dir, f"network_metrics_{timestamp}.json"
                 )
-                with open(file_path, "w") as f:
-                    json.dump(self.get_network_summary(), f, indent=4)
+                with open(file_path, "wb") as f:
+                    f.write(dumps_json(self.get_network_summary()))
             return file_path
         except Exception as e:
             self.logger.error(f"Error exporting metrics: {e}")
@@ -298,14 +290,11 @@ class Network:
     def cleanup(self):
         """Cleanup network resources."""
         try:
-            # Close any open handlers
+            # The queue handler is shared with the other managers, so detach
+            # it without closing it
             if hasattr(self, "logger") and self.logger:
                 for handler in self.logger.handlers[:]:
-                    try:
-                        handler.close()
-                        self.logger.removeHandler(handler)
-                    except Exception as e:
-                        print(f"Error closing network handler: {e}")
+                    self.logger.removeHandler(handler)
         except Exception as e:
             print(f"Error during network cleanup: {e}")
 
@@ -1,71 +1,90 @@
 import psutil
-import json
-import requests
+import bisect
 import logging
-import logging.handlers
 import os
-import csv
-from datetime import datetime
+import time
 from typing import Dict, Union, List
 
+import numpy as np
+
+from core.logging_util import get_manager_logger
+from core.utils import cached_timestamp, dumps_json, ensure_dir
+
+_GIB = 1 << 30
+
+# Ascending alert thresholds; bisect_left counts how many are strictly exceeded
+_RAM_THRESHOLDS = (80, 90)
+_RAM_ALERTS = (None, "WARNING: RAM usage above 80%", "CRITICAL: RAM usage above 90%")
+_SWAP_THRESHOLDS = (50,)
+_SWAP_ALERTS = (None, "WARNING: High swap usage detected")
+
+# Structured ring-buffer row for RAM history samples
+HISTORY_DTYPE = np.dtype(
+    [
+        ("ts", "u8"),
+        ("used_percent", "f4"),
+        ("available_gb", "f4"),
+        ("swap_percent", "f4"),
+    ]
+)
+
 
 class RAM:
     def __init__(self, log_dir: str = "logs"):
         """Initialize RAM monitoring with enhanced features."""
         # Initialize core attributes
         self.log_dir = log_dir
-        self.history = []
         self.max_history_size = 100
+        self._hist = np.zeros(self.max_history_size, dtype=HISTORY_DTYPE)
+        self._hist_idx = 0
+        # /proc/meminfo and the swap counters change slowly; skip re-reads
+        # that arrive faster than this
+        self._min_interval = 0.5
+        self._last_update = float("-inf")
 
         # Create log directory
-        os.makedirs(log_dir, exist_ok=True)
+        ensure_dir(log_dir)
 
         # Setup components
         self.setup_logging()
         self.update_metrics()
 
     def setup_logging(self):
-        """Setup enhanced logging configuration."""
-        log_file = os.path.join(self.log_dir, "ram_manager.log")
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file, maxBytes=10485760, backupCount=5
-        )
-        file_handler.setFormatter(formatter)
-
-        self.logger = logging.getLogger("RAM_Manager")
-        self.logger.setLevel(logging.INFO)
-        self.logger.addHandler(file_handler)
+        """Attach the manager logger to the shared background log writer."""
+        self.logger = get_manager_logger("RAM_Manager", self.log_dir)
 
     def update_metrics(self):
         """Update RAM metrics with real-time information."""
-        try:
-            # Set timestamp first
-            self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now = time.monotonic()
+        if now - self._last_update < self._min_interval:
+            # Keep the cached values from the last read
+            return
 
-            # Get real memory information from system
+        try:
+            # Read memory and swap back to back so they describe one moment
             mem = psutil.virtual_memory()
             swap = psutil.swap_memory()
+            self._last_update = now
+            self.timestamp = cached_timestamp()
 
             # Real RAM usage in GB
-            self.total = mem.total / (1024**3)
-            self.used = mem.used / (1024**3)
-            self.available = mem.available / (1024**3)
+            self.total = mem.total / _GIB
+            self.used = mem.used / _GIB
+            self.available = mem.available / _GIB
             self.percent = mem.percent
 
             # Initialize cached and buffers
-            self.cached = getattr(mem, "cached", 0) / (1024**3)
-            self.buffers = getattr(mem, "buffers", 0) / (1024**3)
+            self.cached = getattr(mem, "cached", 0) / _GIB
+            self.buffers = getattr(mem, "buffers", 0) / _GIB
 
             # Real swap memory usage
-            self.swap_total = swap.total / (1024**3)
-            self.swap_used = swap.used / (1024**3)
-            self.swap_free = swap.free / (1024**3)
+            self.swap_total = swap.total / _GIB
+            self.swap_used = swap.used / _GIB
+            self.swap_free = swap.free / _GIB
             self.swap_percent = swap.percent
 
             self._update_history()
-            self.logger.info("RAM metrics updated successfully")
+            self.logger.debug("RAM metrics updated successfully")
         except Exception as e:
             self.logger.error(f"Error updating RAM metrics: {e}")
             raise
@@ -73,20 +92,51 @@ class RAM:
     def _update_history(self):
         """Maintain historical RAM usage data."""
         try:
-            current_metrics = {
-                "timestamp": self.timestamp,
-                "used_percent": self.percent,
-                "available_gb": self.available,
-                "swap_percent": self.swap_percent,
-            }
-
-            self.history.append(current_metrics)
-            if len(self.history) > self.max_history_size:
-                self.history.pop(0)
+            self._hist[self._hist_idx % self.max_history_size] = (
+                int(time.time()),
+                self.percent,
+                self.available,
+                self.swap_percent,
+            )
+            self._hist_idx += 1
         except Exception as e:
             self.logger.error(f"Error updating history: {e}")
             raise
 
+    def _history_rows(self, last: int = None) -> np.ndarray:
+        """Get the recorded history rows in chronological order."""
+        count = min(self._hist_idx, self.max_history_size)
+        if count < self.max_history_size:
+            rows = self._hist[:count]
+        else:
+            split = self._hist_idx % self.max_history_size
+            rows = np.concatenate((self._hist[split:], self._hist[:split]))
+        return rows if last is None else rows[-last:]
+
+    @property
+    def history(self) -> List[Dict[str, Union[str, float]]]:
+        """Historical RAM samples as dictionaries, oldest first."""
+        return [
+            {
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts)),
+                "used_percent": float(used),
+                "available_gb": float(available),
+                "swap_percent": float(swap),
+            }
+            for ts, used, available, swap in self._history_rows()
+        ]
+
+    def get_usage_statistics(self) -> Dict[str, float]:
+        """Get min, mean and peak RAM usage over the recorded history."""
+        used = self._history_rows()["used_percent"]
+        if not used.size:
+            return {"min_usage": 0.0, "avg_usage": 0.0, "peak_usage": 0.0}
+        return {
+            "min_usage": float(used.min()),
+            "avg_usage": float(used.mean()),
+            "peak_usage": float(used.max()),
+        }
+
     def get_detailed_metrics(self) -> Dict[str, Union[str, float]]:
         """Get comprehensive RAM metrics."""
         return {
@@ -105,21 +155,16 @@ class RAM:
 
     def get_usage_alerts(self) -> List[str]:
         """Generate RAM usage alerts based on thresholds."""
-        alerts = []
-        if self.percent > 90:
-            alerts.append("CRITICAL: RAM usage above 90%")
-        elif self.percent > 80:
-            alerts.append("WARNING: RAM usage above 80%")
-
-        if self.swap_percent > 50:
-            alerts.append("WARNING: High swap usage detected")
-
-        return alerts
+        alerts = (
+            _RAM_ALERTS[bisect.bisect_left(_RAM_THRESHOLDS, self.percent)],
+            _SWAP_ALERTS[bisect.bisect_left(_SWAP_THRESHOLDS, self.swap_percent)],
+        )
+        return [alert for alert in alerts if alert]
 
     def generate_report(self, output_dir: str = "reports") -> str:
         """Generate a comprehensive RAM usage report."""
-        os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        ensure_dir(output_dir)
+        timestamp = cached_timestamp("%Y%m%d_%H%M%S")
         report_path = os.path.join(output_dir, f"ram_report_{timestamp}.txt")
 
         with open(report_path, "w") as f:
@@ -136,24 +181,32 @@ class RAM:
             for alert in self.get_usage_alerts():
                 f.write(f"- {alert}\n")
 
+            # Usage statistics
+            f.write("\nUsage Statistics:\n")
+            for key, value in self.get_usage_statistics().items():
+                f.write(f"{key}: {value:.1f}%\n")
+
             # Usage history
             f.write("\nUsage History:\n")
-            for entry in self.history[-10:]:
-                f.write(f"{entry['timestamp']}: {entry['used_percent']}% used\n")
+            for ts, used in self._history_rows(last=10)[["ts", "used_percent"]]:
+                stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+                f.write(f"{stamp}: {used:.1f}% used\n")
 
         return report_path
 
     def export_metrics(self, export_format: str = "json", output_dir: str = "metrics"):
         """Export RAM metrics in specified format."""
-        os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        ensure_dir(output_dir)
+        timestamp = cached_timestamp("%Y%m%d_%H%M%S")
 
         if export_format == "json":
             file_path = os.path.join(output_dir, f"ram_metrics_{timestamp}.json")
-            with open(file_path, "w") as f:
-                json.dump(self.get_detailed_metrics(), f, indent=4)
+            with open(file_path, "wb") as f:
+                f.write(dumps_json(self.get_detailed_metrics()))
         elif export_format == "csv":
             file_path = os.path.join(output_dir, f"ram_metrics_{timestamp}.csv")
+            import csv
+
             metrics = self.get_detailed_metrics()
             with open(file_path, "w", newline="") as f:
                 writer = csv.DictWriter(f, fieldnames=metrics.keys())
@@ -1,138 +1,222 @@
 import psutil
-import json
-import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    filename="storage_manager.log",
-    filemode="a",
-)
+from core.logging_util import get_manager_logger
+from core.utils import dumps_json, get_http_session
+
+_GIB = 1 << 30
+
+
+def _format_drive(drive):
+    """Format a numeric drive record with the GB/% strings the UIs show."""
+    if "error" in drive:
+        return dict(drive)
+    return {
+        "device": drive["device"],
+        "mountpoint": drive["mountpoint"],
+        "type": drive["type"],
+        "total": f"{drive['total_gb']:.2f} GB",
+        "used": f"{drive['used_gb']:.2f} GB",
+        "free": f"{drive['free_gb']:.2f} GB",
+        "percent_used": f"{drive['percent_used']:.1f}%",
+    }
 
 
 class Storage:
-    def __init__(self):
+    def __init__(self, log_dir: str = "logs"):
         """Initialize the storage details."""
+        self.logger = get_manager_logger("Storage_Manager", log_dir)
+        self._display_cache = (None, None)
+        # Usage is probed on first access to drives; statvfs can block for
+        # seconds on sleeping USB disks or network mounts
+        self._drives = None
         try:
-            self.drives = self._get_storage_info()
-            logging.info("Storage details initialized successfully.")
+            self._partitions = psutil.disk_partitions(all=False)
+            self.logger.info("Storage details initialized successfully.")
         except Exception as e:
-            logging.error(f"Error initializing storage details: {e}")
-            self.drives = []
+            self.logger.error(f"Error initializing storage details: {e}")
+            self._partitions = []
 
-    def _get_storage_info(self):
-        """Retrieve storage details from all partitions."""
-        storage_details = []
-        for partition in psutil.disk_partitions(all=False):
+    @property
+    def drives(self):
+        """Drive records for all partitions, probed on first access."""
+        if self._drives is None:
             try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                storage_details.append(
-                    {
-                        "device": partition.device,
-                        "mountpoint": partition.mountpoint,
-                        "type": partition.fstype,
-                        "total": f"{usage.total / (1024 ** 3):.2f} GB",  # Convert bytes to GB
-                        "used": f"{usage.used / (1024 ** 3):.2f} GB",  # Convert bytes to GB
-                        "free": f"{usage.free / (1024 ** 3):.2f} GB",  # Convert bytes to GB
-                        "percent_used": f"{usage.percent:.1f}%",
-                    }
-                )
-                logging.info(
-                    f"Retrieved storage details for device: {partition.device}"
-                )
-            except PermissionError:
-                # Skip inaccessible partitions
-                logging.warning(f"Permission denied for device: {partition.device}")
-                storage_details.append(
-                    {
-                        "device": partition.device,
-                        "mountpoint": partition.mountpoint,
-                        "type": partition.fstype,
-                        "error": "Permission denied",
-                    }
-                )
+                self._drives = self._get_storage_info()
             except Exception as e:
-                logging.error(
-                    f"Error retrieving storage details for device {partition.device}: {e}"
-                )
-                storage_details.append(
-                    {
-                        "device": partition.device,
-                        "mountpoint": partition.mountpoint,
-                        "type": partition.fstype,
-                        "error": str(e),
-                    }
-                )
-        return storage_details
+                self.logger.error(f"Error retrieving storage details: {e}")
+                self._drives = []
+        return self._drives
+
+    @drives.setter
+    def drives(self, value):
+        self._drives = value
 
-    def to_dict(self):
+    def drive_for(self, device):
+        """Retrieve storage details for a single device or mountpoint."""
+        if self._drives is not None:
+            for drive in self._drives:
+                if device in (drive["device"], drive["mountpoint"]):
+                    return drive
+        for partition in self._partitions:
+            if device in (partition.device, partition.mountpoint):
+                return self._drive_record(partition)
+        return None
+
+    def _get_storage_info(self):
+        """Retrieve storage details from all partitions."""
+        partitions = list(self._partitions)
+        if len(partitions) < 2:
+            return [self._drive_record(partition) for partition in partitions]
+        # disk_usage blocks in statvfs with the GIL released, so probing in
+        # parallel costs the slowest mount rather than the sum of them all
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(partitions)), thread_name_prefix="disk-usage"
+        ) as executor:
+            return list(executor.map(self._drive_record, partitions))
+
+    def _drive_record(self, partition):
+        """Retrieve storage details for one partition."""
+        try:
+            usage = psutil.disk_usage(partition.mountpoint)
+            self.logger.debug(
+                f"Retrieved storage details for device: {partition.device}"
+            )
+            return {
+                "device": partition.device,
+                "device_letter": partition.device.split(":", 1)[0],
+                "mountpoint": partition.mountpoint,
+                "type": partition.fstype,
+                "total_gb": usage.total / _GIB,
+                "used_gb": usage.used / _GIB,
+                "free_gb": usage.free / _GIB,
+                "percent_used": usage.percent,
+            }
+        except PermissionError:
+            # Skip inaccessible partitions
+            self.logger.warning(f"Permission denied for device: {partition.device}")
+            return {
+                "device": partition.device,
+                "mountpoint": partition.mountpoint,
+                "type": partition.fstype,
+                "error": "Permission denied",
+            }
+        except Exception as e:
+            self.logger.error(
+                f"Error retrieving storage details for device {partition.device}: {e}"
+            )
+            return {
+                "device": partition.device,
+                "mountpoint": partition.mountpoint,
+                "type": partition.fstype,
+                "error": str(e),
+            }
+
+    def to_dict(self, include_usage=True):
         """Convert storage details to a dictionary."""
         try:
+            if not include_usage:
+                return {
+                    "drives": [
+                        {
+                            "device": p.device,
+                            "mountpoint": p.mountpoint,
+                            "type": p.fstype,
+                        }
+                        for p in self._partitions
+                    ]
+                }
             return {"drives": self.drives}  # Updated key to 'drives'
         except Exception as e:
-            logging.error(f"Error converting storage details to dictionary: {e}")
+            self.logger.error(f"Error converting storage details to dictionary: {e}")
             return {"error": "Failed to convert storage details to dictionary"}
 
-    def to_json(self):
+    def to_display_dict(self):
+        """Convert storage details to a dictionary of display strings."""
+        # Format once per drives snapshot; refreshes replace self.drives
+        drives, display = self._display_cache
+        if drives is not self.drives:
+            display = {"drives": [_format_drive(d) for d in self.drives]}
+            self._display_cache = (self.drives, display)
+        return display
+
+    def to_json(self, include_usage=True):
         """Convert storage details to JSON."""
         try:
-            return json.dumps(self.to_dict(), indent=4)
+            return dumps_json(self.to_dict(include_usage)).decode("utf-8")
         except Exception as e:
-            logging.error(f"Error converting storage details to JSON: {e}")
-            return json.dumps({"error": "Failed to convert storage details to JSON"})
+            self.logger.error(f"Error converting storage details to JSON: {e}")
+            return dumps_json(
+                {"error": "Failed to convert storage details to JSON"}, indent=False
+            ).decode("utf-8")
 
     def export_to_web(self, api_url):
         """Send storage details to a web API."""
+        import requests
+
         try:
-            response = requests.post(api_url, json=self.to_dict(), timeout=10)
+            response = get_http_session().post(
+                api_url,
+                data=dumps_json(self.to_dict(), indent=False),
+                headers={"Content-Type": "application/json"},
+                timeout=10,
+            )
             response.raise_for_status()
-            logging.info("Storage details successfully sent to the web server.")
+            self.logger.info("Storage details successfully sent to the web server.")
             print("Storage details successfully sent to the web server.")
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error sending storage details to web server: {e}")
+            self.logger.error(f"Error sending storage details to web server: {e}")
             print(f"Error sending storage details to web server: {e}")
 
     def export_to_mobile(self, mobile_api_url):
         """Send storage details to a mobile app API."""
+        import requests
+
         try:
-            response = requests.post(mobile_api_url, json=self.to_dict(), timeout=10)
+            response = get_http_session().post(
+                mobile_api_url,
+                data=dumps_json(self.to_dict(), indent=False),
+                headers={"Content-Type": "application/json"},
+                timeout=10,
+            )
             response.raise_for_status()
-            logging.info("Storage details successfully sent to the mobile app.")
+            self.logger.info("Storage details successfully sent to the mobile app.")
             print("Storage details successfully sent to the mobile app.")
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error sending storage details to mobile app: {e}")
+            self.logger.error(f"Error sending storage details to mobile app: {e}")
             print(f"Error sending storage details to mobile app: {e}")
 
     def save_to_file(self, file_path):
         """Save storage details to a JSON file."""
         try:
-            with open(file_path, "w") as file:
-                file.write(self.to_json())
-            logging.info(f"Storage details saved to: {file_path}")
+            with open(file_path, "wb", buffering=65536) as file:
+                file.write(dumps_json(self.to_dict()))
+            self.logger.info(f"Storage details saved to: {file_path}")
             print(f"Storage details saved to: {file_path}")
         except Exception as e:
-            logging.error(f"Error saving storage details to file: {e}")
+            self.logger.error(f"Error saving storage details to file: {e}")
             print(f"Error saving storage details to file: {e}")
 
     def log_to_file(self, log_file_path):
         """Append storage details to a log file."""
         try:
-            with open(log_file_path, "a") as log_file:
-                log_file.write(self.to_json() + "\n")
-            logging.info(f"Storage details logged to: {log_file_path}")
+            with open(log_file_path, "ab", buffering=65536) as log_file:
+                # Two buffered writes instead of concatenating the payload
+                log_file.write(dumps_json(self.to_dict()))
+                log_file.write(b"\n")
+            self.logger.info(f"Storage details logged to: {log_file_path}")
             print(f"Storage details logged to: {log_file_path}")
         except Exception as e:
-            logging.error(f"Error logging storage details to file: {e}")
+            self.logger.error(f"Error logging storage details to file: {e}")
             print(f"Error logging storage details to file: {e}")
 
     def get_drive_health_status(self, drive_info):
         """Get detailed health status for a drive."""
         try:
-            used_percent = float(drive_info["percent_used"].strip("%"))
-            total_gb = float(drive_info["total"].split()[0])
-            free_gb = float(drive_info["free"].split()[0])
+            used_percent = drive_info["percent_used"]
+            total_gb = drive_info["total_gb"]
+            free_gb = drive_info["free_gb"]
 
             status = {"status": "optimal", "warnings": [], "recommendations": []}
 
@@ -160,7 +244,7 @@ class Storage:
                 )
 
             # System drive specific checks
-            if drive_info["device"].split(":")[0] == "C":
+            if drive_info["device_letter"] == "C":
                 if free_gb < 50:
                     status["warnings"].append(
                         "System drive space critical for optimal performance"
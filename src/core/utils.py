@@ -3,42 +3,94 @@ import sys
 import json
 import logging
 import csv
-from datetime import datetime
+import contextlib
+import functools
+import operator
+import platform
+import shutil
+import tempfile
+import threading
+import time
+import psutil
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+# ujson covers platforms without an orjson wheel; json stays the last resort
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# Resolved once; %-style arguments are only formatted if a handler emits
+logger = logging.getLogger(__name__)
+
+# Hardware identity (CPU model, GPU list) is fixed for a given boot, so probes
+# are memoized in-process and persisted here to survive restarts.
+HW_CACHE_FILE = os.path.join("logs", ".hw_cache.json")
+_hw_identity = {}
+
+# Listener from the first setup_logging() call; later calls reuse it
+_logging_listener = None
 
 
 def setup_logging():
-    """Setup application logging with UTF-8 encoding."""
+    """Setup application logging with UTF-8 encoding; returns the listener."""
+    global _logging_listener
+    if _logging_listener is not None:
+        # A second set of sinks would write every record twice
+        return _logging_listener
+    if logging.getLogger().handlers:
+        # Configured elsewhere; like basicConfig, leave those handlers alone
+        return None
+
+    # logging_util imports this module, so import it at call time
+    from core.logging_util import (
+        BufferedFileHandler,
+        FastFormatter,
+        IntervalMemoryHandler,
+        attach_root_sinks,
+    )
+
     # Ensure logs directory exists
-    os.makedirs("logs", exist_ok=True)
+    ensure_dir("logs")
 
     # Configure logging with UTF-8 encoding
-    formatter = logging.Formatter(
+    formatter = FastFormatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
     # File handler with UTF-8 encoding
-    file_handler = logging.FileHandler("logs/hardware_analyzer.log", encoding="utf-8")
+    file_handler = BufferedFileHandler("logs/hardware_analyzer.log", encoding="utf-8")
     file_handler.setFormatter(formatter)
 
-    # Console handler
-    console_handler = logging.StreamHandler()
+    # Console handler; per-tick INFO lines only go to the file
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setLevel(logging.WARNING)
     console_handler.setFormatter(formatter)
 
-    # Root logger
+    # Root logger; records are queued and written on the listener thread
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    # File writes are batched; ERROR records and a 30 s age flush the batch
+    _logging_listener = attach_root_sinks(
+        IntervalMemoryHandler(file_handler), console_handler
+    )
+
+    logger.info("Logging setup complete.")
+    return _logging_listener
+
 
-    logging.info("Logging setup complete.")
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB", "EB")
 
 
 def format_size(size_bytes):
     """Format byte sizes in a human-readable format."""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024
+    # Each unit is 2**10 of the one before, so the bit length picks the unit
+    bits = int(size_bytes).bit_length() - 1
+    idx = min(max(bits, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.2f} {_SIZE_UNITS[idx]}"
 
 
 def format_percentage(value):
@@ -46,88 +98,401 @@ def format_percentage(value):
     return f"{value:.1f}%"
 
 
+# Green circle for good, yellow for warning, red for critical
+_STATUS_EMOJI = ("🟢", "🟡", "🔴")
+
+
 def get_status_emoji(value):
     """Get status emoji based on value."""
-    if value < 60:
-        return "🟢"  # Green circle for good
-    elif value < 80:
-        return "🟡"  # Yellow circle for warning
-    else:
-        return "🔴"  # Red circle for critical
+    return _STATUS_EMOJI[(value >= 60) + (value >= 80)]
+
+
+def dumps_json(data, indent=True, sort_keys=False):
+    """Serialize data to UTF-8 JSON bytes with the fastest installed encoder."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # Fall through for types orjson does not support
+            pass
+    elif ujson is not None:
+        try:
+            return ujson.dumps(
+                data,
+                indent=2 if indent else 0,
+                sort_keys=sort_keys,
+                ensure_ascii=False,
+                escape_forward_slashes=False,
+            ).encode("utf-8")
+        except (TypeError, OverflowError):
+            pass
+    # Compact separators match orjson's output when not indenting
+    separators = None if indent else (",", ":")
+    return json.dumps(
+        data, indent=2 if indent else None, separators=separators, sort_keys=sort_keys
+    ).encode("utf-8")
+
+
+@contextlib.contextmanager
+def _atomic_open(file_path, mode, **kwargs):
+    """Open a temp file that replaces file_path only once writing succeeds."""
+    file_path = os.fspath(file_path)
+    # A unique temp name per call, so concurrent writers never share one
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(file_path) or ".",
+        prefix=os.path.basename(file_path) + ".",
+        suffix=".tmp",
+    )
+    try:
+        with open(fd, mode, **kwargs) as file:
+            yield file
+        if os.path.exists(file_path):
+            # mkstemp creates the file 0600; keep the permissions it replaces
+            shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # Leave the previous file intact and drop the partial one
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+# All three accept UTF-8 bytes
+_loads_json = next(lib.loads for lib in (orjson, ujson, json) if lib is not None)
+
+
+def loads_json(data):
+    """Parse JSON from str or UTF-8 bytes with the fastest installed parser."""
+    return _loads_json(data)
 
 
 def save_to_json(file_path, data):
     """Save data to a JSON file."""
     try:
-        with open(file_path, "w") as file:
-            json.dump(data, file, indent=4)
-        logging.info(f"Data successfully saved to {file_path}")
+        if orjson is not None:
+            with _atomic_open(file_path, "wb", buffering=1 << 20) as file:
+                file.write(dumps_json(data))
+        else:
+            # iterencode hands out small chunks, so the whole document is
+            # never built as one string
+            encoder = json.JSONEncoder(indent=4, ensure_ascii=False)
+            with _atomic_open(
+                file_path, "w", encoding="utf-8", buffering=1 << 20
+            ) as file:
+                file.writelines(encoder.iterencode(data))
+        logger.info("Data successfully saved to %s", file_path)
     except Exception as e:
-        logging.error(f"Error saving data to JSON file: {e}")
+        logger.error("Error saving data to JSON file: %s", e)
         raise
 
 
+def save_to_jsonl(file_path, records):
+    """Save records to a JSON Lines file, one compact record per line."""
+    try:
+        with _atomic_open(file_path, "wb", buffering=1 << 20) as file:
+            for record in records:
+                file.write(dumps_json(record, indent=False))
+                file.write(b"\n")
+        logger.info("Data successfully saved to %s", file_path)
+    except Exception as e:
+        logger.error("Error saving data to JSONL file: %s", e)
+        raise
+
+
+_CSV_BATCH_SIZE = 1024
+
+
+def _csv_row_getter(fieldnames):
+    """Build a C-level getter that turns a dict row into a tuple of fields."""
+    fieldnames = list(fieldnames)
+    field_set = frozenset(fieldnames)
+    getter = operator.itemgetter(*fieldnames)
+    single = len(fieldnames) == 1
+
+    def row_values(row):
+        try:
+            values = getter(row)
+        except KeyError:
+            values = None
+        # Every field was found, so only a longer row can carry extra keys
+        if values is None or len(row) != len(field_set):
+            wrong_fields = row.keys() - field_set
+            if wrong_fields:
+                # Same error as DictWriter's default extrasaction="raise"
+                raise ValueError(
+                    "dict contains fields not in fieldnames: "
+                    + ", ".join([repr(x) for x in wrong_fields])
+                )
+            if values is None:
+                # Missing keys are written empty, as DictWriter's restval does
+                return tuple(row.get(key, "") for key in fieldnames)
+        return (values,) if single else values
+
+    return row_values
+
+
 def save_to_csv(file_path, data, fieldnames=None):
-    """Save data to a CSV file."""
+    """Save rows from any iterable of dicts to a CSV file."""
     try:
-        with open(file_path, "w", newline="") as file:
-            writer = csv.DictWriter(file, fieldnames=fieldnames or data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
-        logging.info(f"Data successfully saved to {file_path}")
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None and not fieldnames:
+            raise IndexError("No rows to take CSV fieldnames from")
+        with _atomic_open(
+            file_path, "w", newline="", encoding="utf-8", buffering=1 << 20
+        ) as file:
+            fieldnames = list(fieldnames or first.keys())
+            row_values = _csv_row_getter(fieldnames)
+            writer = csv.writer(file)
+            writer.writerow(fieldnames)
+            # Only one batch of rows is held at a time, so generators of any
+            # length can be exported
+            batch = [] if first is None else [row_values(first)]
+            for row in rows:
+                batch.append(row_values(row))
+                if len(batch) >= _CSV_BATCH_SIZE:
+                    writer.writerows(batch)
+                    batch.clear()
+            if batch:
+                writer.writerows(batch)
+        logger.info("Data successfully saved to %s", file_path)
     except Exception as e:
-        logging.error(f"Error saving data to CSV file: {e}")
+        logger.error("Error saving data to CSV file: %s", e)
         raise
 
 
+_DIRS_CREATED = set()
+
+
+def ensure_dir(path):
+    """Create a directory once per process; later calls skip the stat."""
+    if path not in _DIRS_CREATED:
+        os.makedirs(path, exist_ok=True)
+        _DIRS_CREATED.add(path)
+
+
+_timestamp_cache = {}
+
+
+def cached_timestamp(fmt="%Y-%m-%d %H:%M:%S"):
+    """Format the current local time, reusing the string within the same second."""
+    now = int(time.time())
+    cached = _timestamp_cache.get(fmt)
+    if cached is not None and cached[0] == now:
+        return cached[1]
+    text = time.strftime(fmt, time.localtime(now))
+    _timestamp_cache[fmt] = (now, text)
+    return text
+
+
 def generate_timestamped_filename(base_name, extension):
     """Generate a filename with a timestamp."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"{base_name}_{timestamp}.{extension}"
+    return f"{base_name}_{cached_timestamp('%Y%m%d_%H%M%S')}.{extension}"
+
+
+@functools.lru_cache(maxsize=128)
+def _dir_writable(directory):
+    """Check once per directory whether files can be created in it."""
+    return os.access(directory, os.W_OK)
 
 
 def validate_writable_path(file_path):
     """Validate if the file path is writable."""
+    # Checks the parent directory rather than opening the file, which would
+    # truncate an existing one
     try:
-        with open(file_path, "w") as file:
-            pass
-        logging.info(f"Path is writable: {file_path}")
+        directory = os.path.dirname(os.path.abspath(file_path)) or "."
+        if not _dir_writable(directory):
+            raise PermissionError(f"Directory is not writable: {directory}")
+        logger.info("Path is writable: %s", file_path)
     except Exception as e:
-        logging.error(f"Path is not writable: {file_path} - {e}")
+        logger.error("Path is not writable: %s - %s", file_path, e)
         raise
 
 
 # Load data from a JSON file
-def load_from_json(file_path):
-    """Load data from a JSON file."""
+def load_from_json(file_path, stream=False):
+    """Load data from a JSON file, or iterate a JSON Lines file with stream=True."""
+    # For large JSON documents use iter_records(), which does not hold the
+    # whole parsed tree in memory
+    if stream:
+        return _iter_jsonl(file_path)
     try:
-        with open(file_path, "r") as file:
-            data = json.load(file)
-        logging.info(f"Data successfully loaded from {file_path}")
+        with open(file_path, "rb") as file:
+            data = _loads_json(file.read())
+        logger.info("Data successfully loaded from %s", file_path)
         return data
     except Exception as e:
-        logging.error(f"Error loading data from JSON file: {e}")
+        logger.error("Error loading data from JSON file: %s", e)
+        raise
+
+
+def _iter_jsonl(file_path):
+    """Yield the records of a JSON Lines file one line at a time."""
+    try:
+        with open(file_path, "rb") as file:
+            for line in file:
+                if line.strip():
+                    yield _loads_json(line)
+    except Exception as e:
+        logger.error("Error loading data from JSONL file: %s", e)
         raise
 
 
+def iter_records(file_path, prefix="item"):
+    """Yield the objects under an ijson prefix of a JSON document one at a time."""
+    # "item" is each element of a top-level array, "drives.item" each
+    # element of the "drives" array, and so on
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+    with open(file_path, "rb") as file:
+        if ijson is not None:
+            yield from ijson.items(file, prefix, use_float=True)
+            return
+        # Without ijson the document is parsed whole, then walked
+        nodes = [_loads_json(file.read())]
+    for part in prefix.split(".") if prefix else ():
+        if part == "item":
+            nodes = [child for node in nodes for child in node]
+        else:
+            nodes = [node[part] for node in nodes]
+    yield from nodes
+
+
+# Filesystem totals change slowly, so pollers reuse a result for a moment
+_DISK_SPACE_TTL = 2.0
+_disk_space_cache = {}
+
+
 # Check disk space for a given path
 def check_disk_space(path="."):
     """Check the available disk space for a given path."""
+    key = os.path.abspath(path)
+    now = time.monotonic()
+    hit = _disk_space_cache.get(key)
+    if hit is not None and now - hit[0] < _DISK_SPACE_TTL:
+        # A copy, so a caller editing its result cannot change the cached one
+        return dict(hit[1])
     try:
-        statvfs = os.statvfs(path)
-        total = statvfs.f_blocks * statvfs.f_frsize
-        available = statvfs.f_bavail * statvfs.f_frsize
-        logging.info(f"Disk space check complete for path: {path}")
-        return {
+        if hasattr(os, "statvfs"):
+            statvfs = os.statvfs(path)
+            total = statvfs.f_blocks * statvfs.f_frsize
+            available = statvfs.f_bavail * statvfs.f_frsize
+        else:
+            # Windows has no statvfs
+            usage = shutil.disk_usage(path)
+            total, available = usage.total, usage.free
+        logger.info("Disk space check complete for path: %s", path)
+        result = {
             "total_space": total,
             "available_space": available,
             "used_space": total - available,
         }
+        _disk_space_cache[key] = (now, result)
+        return dict(result)
     except Exception as e:
-        logging.error(f"Error checking disk space for path {path}: {e}")
+        logger.error("Error checking disk space for path %s: %s", path, e)
         raise
 
 
+check_disk_space.cache_clear = _disk_space_cache.clear
+
+
+def _hw_cache_key():
+    """Identify the current machine and boot."""
+    return f"{platform.node()}:{int(psutil.boot_time())}"
+
+
+def _load_hw_cache():
+    """Load the persisted hardware cache if it belongs to this boot."""
+    try:
+        with open(HW_CACHE_FILE, "r") as file:
+            data = json.load(file)
+        if data.get("key") == _hw_cache_key():
+            return data
+    except (OSError, ValueError):
+        pass
+    return {"key": _hw_cache_key()}
+
+
+def cached_hw_identity(section, probe):
+    """Return the cached value for `section`, calling `probe` once per boot."""
+    if section in _hw_identity:
+        return _hw_identity[section]
+
+    data = _load_hw_cache()
+    if section in data:
+        value = data[section]
+    else:
+        value = probe()
+        if value:
+            data[section] = value
+            try:
+                os.makedirs(os.path.dirname(HW_CACHE_FILE), exist_ok=True)
+                with open(HW_CACHE_FILE, "w") as file:
+                    json.dump(data, file)
+            except OSError as e:
+                logger.warning("Could not persist hardware cache: %s", e)
+
+    _hw_identity[section] = value
+    return value
+
+
+def synchronized(method):
+    """Run a method while holding its instance's `_lock`."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+# COM objects are apartment-threaded, so each thread gets its own connection
+_wmi_local = threading.local()
+
+
+def get_wmi():
+    """Get this thread's WMI connection, importing wmi only on first use."""
+    conn = getattr(_wmi_local, "conn", None)
+    if conn is None:
+        import pythoncom
+        import wmi
+
+        # Worker threads have no COM apartment until they initialize one
+        pythoncom.CoInitialize()
+        conn = _wmi_local.conn = wmi.WMI()
+    return conn
+
+
+@functools.lru_cache(maxsize=None)
+def get_http_session():
+    """Get a shared keep-alive requests.Session with a small connection pool."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # Retry covers idempotent requests only; export POSTs are not resent
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 # Example usage of the utilities
 if __name__ == "__main__":
     # Setup logging
@@ -2,7 +2,9 @@ import sys
 import os
 import json
 import logging
+import time
 from datetime import datetime
+from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -21,31 +23,160 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QScrollArea,
 )
-from PyQt6.QtCore import Qt, QTimer, QSize, QObject
+from PyQt6.QtCore import (
+    Qt,
+    QEvent,
+    QTimer,
+    QSize,
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    QThreadPool,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QTextCursor, QIcon, QFont
 from core.hardware_manager import HardwareManager
 from core.network import Network
-from core.utils import setup_logging
+from core.utils import dumps_json, format_size, setup_logging
 from themes import ThemeManager
 
 # Add at the top of the file, before other imports
 try:
     import matplotlib.pyplot as plt
     from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-    import matplotlib.dates as mdates
-    from datetime import datetime, timedelta
 
     matplotlib_available = True
 except ImportError:
     matplotlib_available = False
 
+try:
+    import darkdetect
+except ImportError:
+    darkdetect = None
+
 import numpy as np
-from collections import deque
-from threading import Lock
-import csv
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Thread
+
+
+# Default export folder and settings file, resolved once
+_DESKTOP = Path.home() / "Desktop"
+_SETTINGS_PATH = Path("settings.json")
+_SETTINGS_TMP_PATH = _SETTINGS_PATH.with_name("settings.json.tmp")
+
+# Counters shown in the network statistics label
+_IO_KEYS = (
+    "bytes_recv",
+    "bytes_sent",
+    "packets_recv",
+    "packets_sent",
+    "errin",
+    "errout",
+)
+
+
+def _bar_table(width, fill):
+    """Prebuild every usage bar of the given width, indexed by filled cells."""
+    return tuple(f"[{fill * i}{'░' * (width - i)}]" for i in range(width + 1))
+
+
+_MEM_BARS = _bar_table(20, "█")
+_STOR_BARS_LIGHT = _bar_table(40, "█")
+_STOR_BARS_MED = _bar_table(40, "▒")
+_STOR_BARS_HEAVY = _bar_table(40, "▓")
+
+
+class _SamplerSignals(QObject):
+    """Signals of a _Sampler; QRunnable itself cannot carry them."""
+
+    finished = pyqtSignal(dict)
+
+
+class _Sampler(QRunnable):
+    """Run a collect function on the thread pool and emit its result."""
+
+    def __init__(self, collect, apply):
+        super().__init__()
+        self._collect = collect
+        self.signals = _SamplerSignals()
+        self.signals.finished.connect(apply)
+        self.inflight = False  # Set while queued or running
+        self.setAutoDelete(False)  # Reused for every refresh
+
+    def run(self):
+        try:
+            payload = self._collect()
+        except Exception as e:
+            payload = {"error": str(e)}
+        # Delivery is queued, so the next run may start before apply does
+        self.inflight = False
+        self.signals.finished.emit(payload)
+
+
+def _listen_system_theme(callback):
+    """Forward OS theme changes until the process exits; runs on a thread."""
+    try:
+        darkdetect.listener(callback)
+    except Exception:
+        pass  # No change notifications here; the startup reading stands
 
 
 class HardwareAnalyzerApp(QMainWindow):
+    # Carries darkdetect's "Dark"/"Light" from its listener thread
+    _system_theme_changed = pyqtSignal(str)
+
+    # Stylesheets assigned from refreshes; reparsing CSS restyles the widget
+    _STYLE_OK = """
+        QLabel {
+            padding: 10px;
+            border-radius: 5px;
+            font-weight: bold;
+            background-color: #E8F5E9;
+            color: #2E7D32;
+        }
+    """
+    _STYLE_BAD = """
+        QLabel {
+            padding: 10px;
+            border-radius: 5px;
+            font-weight: bold;
+            background-color: #FFEBEE;
+            color: #C62828;
+        }
+    """
+    _STATS_STYLE = """
+        QLabel {
+            font-family: 'Consolas';
+            font-size: 12px;
+            padding: 15px;
+            background-color: #252526;
+            color: #ffffff;
+            border-radius: 5px;
+        }
+    """
+    _EXTERNAL_IP_STYLE = """
+        QLabel {
+            font-size: 13px;
+            padding: 10px;
+            background-color: #252526;
+            color: #ffffff;
+            border-radius: 5px;
+        }
+    """
+    _HW_TEMPLATE = (
+        "╔════════════════ CPU INFORMATION ════════════════╗\n"
+        "║  Model      : {cpu_name:<35} ║\n"
+        "║  Cores      : {cores} Physical, {threads} Logical ║\n"
+        "║  Frequency  : {frequency:<35} ║\n"
+        "║  Usage      : {usage}% ║\n"
+        "╚══════════════════════════════════════════════════╝\n"
+        "\n╔════════════════ MEMORY STATUS ════════════════╗\n"
+        "║  Total      : {total_ram:>6.2f} GB {ram_bar} ║\n"
+        "║  Used       : {used_ram:>6.2f} GB ({ram_percent:.1f}%) ║\n"
+        "║  Available  : {available_ram:>6.2f} GB ║\n"
+        "╚══════════════════════════════════════════════════╝"
+    )
+
     def __init__(self):
         super().__init__()
 
@@ -68,7 +199,56 @@ class HardwareAnalyzerApp(QMainWindow):
 
         # Add theme manager instance
         self.theme_manager = ThemeManager()
+        # Stylesheets are built once; switching themes is a dict lookup
+        self._themes = {
+            "Light": self.theme_manager.get_light_theme(),
+            "Dark": self.theme_manager.get_dark_theme(),
+        }
         self.current_theme = "Light"
+        # OS theme, read once and then kept current by darkdetect's listener
+        self._system_is_dark = bool(darkdetect and darkdetect.isDark())
+        if darkdetect is not None:
+            self._system_theme_changed.connect(self._on_system_theme_changed)
+            Thread(
+                target=_listen_system_theme,
+                args=(self._system_theme_changed.emit,),
+                name="theme-listener",
+                daemon=True,
+            ).start()
+
+        # Graph window length, needed when the monitoring tab is built
+        self.max_points = 60  # 60 seconds of data
+
+        # Hashes of the last texts shown, to skip re-laying out unchanged text
+        self._hw_text_hash = None
+        self._net_json_hash = None
+        # Last values pushed to the CPU/RAM/GPU bars and connection label
+        self._last_bars = [-1, -1, -1]
+        self._last_connection = None
+        # Interface cards keyed by interface name, updated in place
+        self._iface_cards = {}
+
+        # psutil/WMI sampling runs on the pool; widgets update on delivery
+        self._thread_pool = QThreadPool.globalInstance()
+        self._refresh_sampler = _Sampler(self._collect_refresh, self._apply_refresh)
+        self._network_sampler = _Sampler(self._collect_network, self._apply_network)
+        self._hardware_sampler = _Sampler(
+            self._collect_hardware, self._apply_hardware
+        )
+        self._network_refresh_sampler = _Sampler(
+            self._collect_network, self._apply_network_refresh
+        )
+        # Network probes overlap the hardware snapshot in refresh_all
+        self._probe_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="network-probe"
+        )
+        # Counters behind the statistics label, to skip idle refreshes
+        self._last_io = None
+        # Setting changes in quick succession share one write
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(500)
+        self._settings_save_timer.timeout.connect(self._do_save_settings)
 
         try:
             # Initialize managers with optimized settings
@@ -80,7 +260,7 @@ class HardwareAnalyzerApp(QMainWindow):
             self.setup_optimized_refresh()
 
             # Apply light theme by default
-            self.setStyleSheet(self.theme_manager.get_light_theme())
+            self.setStyleSheet(self._themes["Light"])
 
             # Load settings last
             self.load_settings()
@@ -90,10 +270,8 @@ class HardwareAnalyzerApp(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to initialize: {e}")
             raise
 
-        # Add monitoring locks and buffers
+        # Add monitoring lock
         self.data_lock = Lock()
-        self.max_points = 60  # 60 seconds of data
-        self.initialize_data_buffers()
 
     def print_log_locations(self):
         """Print locations of all log files."""
@@ -171,9 +349,20 @@ class HardwareAnalyzerApp(QMainWindow):
         # Initialize tabs
         self.init_hardware_tab()
         self.init_network_tab()
+        self.initialize_data_buffers()
         self.init_monitoring_tab()
         self.init_settings_tab()
 
+        # Expensive tab contents are built when the tab is first shown
+        self._tab_builders = {
+            self.tab_widget.indexOf(self.network_tab): self.refresh_network,
+            self.tab_widget.indexOf(self.monitoring_tab): self._build_monitoring_graphs,
+        }
+
+        # Graphs only run while the monitoring tab is on screen
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+        self._on_tab_changed(self.tab_widget.currentIndex())
+
     def init_hardware_tab(self):
         """Initialize hardware information tab with enhanced visuals."""
         hardware_tab = QWidget()
@@ -182,55 +371,21 @@ class HardwareAnalyzerApp(QMainWindow):
         # Hardware info display with improved styling
         self.hardware_text = QTextEdit()
         self.hardware_text.setReadOnly(True)
-        self.hardware_text.setFont(QFont("Consolas", 11))
-        self.hardware_text.setStyleSheet(
-            """
-            QTextEdit {
-                background-color: #1E1E1E;
-                color: #FFFFFF;
-                border: 1px solid #333333;
-                padding: 10px;
-            }
-        """
-        )
+        self.hardware_text.setAcceptRichText(False)
+        self.hardware_text.setFont(QFont("Cascadia Code", 10))  # Monospace font
+        self.hardware_text.setObjectName("hardwareText")
         layout.addWidget(self.hardware_text)
 
         # Control buttons with modern styling
         button_layout = QHBoxLayout()
 
         refresh_btn = QPushButton("🔄 Refresh")
-        refresh_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #0066cc;
-                color: white;
-                padding: 8px 15px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0052a3;
-            }
-        """
-        )
+        refresh_btn.setObjectName("refreshBtn")
         refresh_btn.clicked.connect(self.refresh_hardware)
         button_layout.addWidget(refresh_btn)
 
         export_btn = QPushButton("💾 Export")
-        export_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                padding: 8px 15px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            """
-        )
+        export_btn.setObjectName("exportBtn")
         export_btn.clicked.connect(self.export_hardware)
         button_layout.addWidget(export_btn)
 
@@ -244,41 +399,13 @@ class HardwareAnalyzerApp(QMainWindow):
 
         # Add refresh button at the top
         refresh_btn = QPushButton("🔄 Refresh Network")
-        refresh_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #0066cc;
-                color: white;
-                padding: 8px 15px;
-                border-radius: 4px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }
-            QPushButton:hover {
-                background-color: #0052a3;
-            }
-        """
-        )
+        refresh_btn.setObjectName("networkRefreshBtn")
         refresh_btn.clicked.connect(self.refresh_network)
         layout.addWidget(refresh_btn)
 
         # Network Status Card
         status_group = QGroupBox("Network Status")
-        status_group.setStyleSheet(
-            """
-            QGroupBox {
-                border: 2px solid #2196F3;
-                border-radius: 8px;
-                margin-top: 1ex;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """
-        )
+        status_group.setObjectName("statusGroup")
         status_layout = QVBoxLayout()
 
         self.connection_status = QLabel()
@@ -302,21 +429,7 @@ class HardwareAnalyzerApp(QMainWindow):
 
         # Network Interfaces Card
         interfaces_group = QGroupBox("Network Interfaces")
-        interfaces_group.setStyleSheet(
-            """
-            QGroupBox {
-                border: 2px solid #4CAF50;
-                border-radius: 8px;
-                margin-top: 1ex;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """
-        )
+        interfaces_group.setObjectName("interfacesGroup")
         interfaces_layout = QVBoxLayout()
 
         self.interfaces_area = QScrollArea()
@@ -327,25 +440,12 @@ class HardwareAnalyzerApp(QMainWindow):
 
         interfaces_layout.addWidget(self.interfaces_area)
         interfaces_group.setLayout(interfaces_layout)
-        layout.addWidget(interfaces_group)
+        # Fixed stretch: the cards are only added once the tab is first shown
+        layout.addWidget(interfaces_group, 2)
 
         # Network Statistics Card
         stats_group = QGroupBox("Network Statistics")
-        stats_group.setStyleSheet(
-            """
-            QGroupBox {
-                border: 2px solid #9C27B0;
-                border-radius: 8px;
-                margin-top: 1ex;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """
-        )
+        stats_group.setObjectName("statsGroup")
         stats_layout = QVBoxLayout()
 
         self.network_stats = QLabel()
@@ -368,59 +468,47 @@ class HardwareAnalyzerApp(QMainWindow):
         # Initialize network_text for JSON display
         self.network_text = QTextEdit()
         self.network_text.setReadOnly(True)
+        self.network_text.setAcceptRichText(False)
         self.network_text.setFont(QFont("Consolas", 10))
-        self.network_text.setStyleSheet(
-            """
-            QTextEdit {
-                background-color: #252526;
-                color: #ffffff;
-                border: 1px solid #3a3a3a;
-                border-radius: 4px;
-                padding: 10px;
-            }
-        """
-        )
+        self.network_text.setObjectName("networkText")
 
         # Add to layout
-        layout.addWidget(self.network_text)
+        layout.addWidget(self.network_text, 1)
 
+        self.network_tab = network_tab
         self.tab_widget.addTab(network_tab, "Network")
 
-        # Do initial network refresh
-        self.refresh_network()
+    def _start_sampler(self, sampler):
+        """Queue a sampler on the pool unless its last run is still going."""
+        if sampler.inflight:
+            return
+        sampler.inflight = True
+        self._thread_pool.start(sampler)
 
     def update_network(self):
+        """Sample network information off the GUI thread."""
+        self._start_sampler(self._network_sampler)
+
+    def _collect_network(self):
+        """Collect network information; runs on the thread pool."""
+        network_info = self.network_manager.get_network_summary()
+        return {
+            "network": network_info,
+            "network_json": dumps_json(network_info).decode("utf-8"),
+        }
+
+    def _apply_network(self, payload):
         """Update network information with enhanced visuals."""
         try:
-            network_info = self.network_manager.get_network_summary()
+            if "error" in payload:
+                raise RuntimeError(payload["error"])
+            network_info = payload["network"]
 
             # Update connection status
             if network_info.get("connectivity", {}).get("connected"):
-                self.connection_status.setText("🟢 Connected")
-                self.connection_status.setStyleSheet(
-                    """
-                    QLabel {
-                        background-color: #E8F5E9;
-                        color: #2E7D32;
-                        font-weight: bold;
-                        padding: 10px;
-                        border-radius: 5px;
-                    }
-                """
-                )
+                self._set_connection_status(True, "🟢 Connected")
             else:
-                self.connection_status.setText("🔴 No Internet Connection")
-                self.connection_status.setStyleSheet(
-                    """
-                    QLabel {
-                        background-color: #FFEBEE;
-                        color: #C62828;
-                        font-weight: bold;
-                        padding: 10px;
-                        border-radius: 5px;
-                    }
-                """
-                )
+                self._set_connection_status(False, "🔴 No Internet Connection")
 
             # Update external IP
             external_ip = network_info.get("connectivity", {}).get(
@@ -429,77 +517,130 @@ class HardwareAnalyzerApp(QMainWindow):
             self.external_ip.setText(f"External IP: {external_ip}")
 
             # Update interfaces
-            self._clear_layout(self.interfaces_layout)
-            for iface in network_info.get("interfaces", []):
-                interface_card = self._create_interface_card(iface)
-                self.interfaces_layout.addWidget(interface_card)
+            self._sync_interface_cards(network_info.get("interfaces", []))
 
             # Update network statistics
             io_stats = network_info.get("io_stats", {})
-            stats_text = (
-                f"📥 Bytes Received: {self._format_bytes(io_stats.get('bytes_recv', 0))}\n"
-                f"📤 Bytes Sent: {self._format_bytes(io_stats.get('bytes_sent', 0))}\n"
-                f"📦 Packets Received: {io_stats.get('packets_recv', 0):,}\n"
-                f"📦 Packets Sent: {io_stats.get('packets_sent', 0):,}\n"
-                f"❌ Errors In: {io_stats.get('errin', 0):,}\n"
-                f"❌ Errors Out: {io_stats.get('errout', 0):,}"
-            )
-            self.network_stats.setText(stats_text)
+            io_key = self._io_key("network", io_stats)
+            if io_key != self._last_io:
+                stats_text = (
+                    f"📥 Bytes Received: {self._format_bytes(io_stats.get('bytes_recv', 0))}\n"
+                    f"📤 Bytes Sent: {self._format_bytes(io_stats.get('bytes_sent', 0))}\n"
+                    f"📦 Packets Received: {io_stats.get('packets_recv', 0):,}\n"
+                    f"📦 Packets Sent: {io_stats.get('packets_sent', 0):,}\n"
+                    f"❌ Errors In: {io_stats.get('errin', 0):,}\n"
+                    f"❌ Errors Out: {io_stats.get('errout', 0):,}"
+                )
+                self.network_stats.setText(stats_text)
+                self._last_io = io_key
 
         except Exception as e:
             self.logger.error(f"Error updating network display: {e}")
 
+    @staticmethod
+    def _io_key(view, io_stats):
+        """Key the statistics label on its layout and raw counter values."""
+        return (view,) + tuple(io_stats.get(key, 0) for key in _IO_KEYS)
+
+    def _set_connection_status(self, connected, text):
+        """Restyle the connection label only when its state changes."""
+        if self._last_connection == text:
+            return
+        self._last_connection = text
+        self.connection_status.setText(text)
+        self._set_style(
+            self.connection_status, self._STYLE_OK if connected else self._STYLE_BAD
+        )
+
+    @staticmethod
+    def _set_style(widget, style):
+        """Assign a stylesheet only when it differs from the current one."""
+        if widget.styleSheet() != style:
+            widget.setStyleSheet(style)
+
+    def _sync_interface_cards(self, interfaces):
+        """Update interface cards in place, rebuilding only changed ones."""
+        current = set()
+        for iface in interfaces:
+            name = iface["name"]
+            current.add(name)
+            entry = self._iface_cards.get(name)
+            addresses = self._interface_addresses(iface)
+            if entry is not None and entry["addresses"] == addresses:
+                for key, text in self._interface_texts(iface).items():
+                    if entry[key].text() != text:
+                        entry[key].setText(text)
+                continue
+            # New interface or changed address list: build a fresh card
+            new_entry = self._create_interface_card(iface)
+            if entry is None:
+                self.interfaces_layout.addWidget(new_entry["card"])
+            else:
+                self.interfaces_layout.replaceWidget(entry["card"], new_entry["card"])
+                entry["card"].deleteLater()
+            self._iface_cards[name] = new_entry
+
+        for name in set(self._iface_cards) - current:
+            card = self._iface_cards.pop(name)["card"]
+            self.interfaces_layout.removeWidget(card)
+            card.deleteLater()
+
+    @staticmethod
+    def _interface_texts(iface):
+        """Label texts for the per-refresh fields of an interface card."""
+        status = "🟢 Up" if iface["status"] == "Up" else "🔴 Down"
+        return {
+            "status_label": f"Status: {status}",
+            "speed_label": f"Speed: {iface['speed']}",
+            "mtu_label": f"MTU: {iface['mtu']}",
+        }
+
+    @staticmethod
+    def _interface_addresses(iface):
+        """Address label texts of an interface card."""
+        return tuple(f"{a['family']}: {a['address']}" for a in iface["addresses"])
+
     def _create_interface_card(self, iface):
-        """Create a styled network interface card."""
+        """Create a styled network interface card and its updatable labels."""
         card = QGroupBox(f"🔌 {iface['name']}")
         layout = QVBoxLayout()
+        texts = self._interface_texts(iface)
+        addresses = self._interface_addresses(iface)
 
         # Status with icon
-        status = "🟢 Up" if iface["status"] == "Up" else "🔴 Down"
-        status_label = QLabel(f"Status: {status}")
-        status_label.setStyleSheet(
-            """
-            QLabel {
-                padding: 5px;
-                border-radius: 3px;
-                background-color: #2d2d2d;
-            }
-        """
-        )
+        status_label = QLabel(texts["status_label"])
+        status_label.setObjectName("ifaceStatus")
         layout.addWidget(status_label)
 
         # Speed and MTU
-        layout.addWidget(QLabel(f"Speed: {iface['speed']}"))
-        layout.addWidget(QLabel(f"MTU: {iface['mtu']}"))
+        speed_label = QLabel(texts["speed_label"])
+        mtu_label = QLabel(texts["mtu_label"])
+        layout.addWidget(speed_label)
+        layout.addWidget(mtu_label)
 
         # IP Addresses
-        if iface["addresses"]:
+        if addresses:
             addr_group = QGroupBox("Addresses")
             addr_layout = QVBoxLayout()
-            for addr in iface["addresses"]:
-                addr_text = QLabel(f"{addr['family']}: {addr['address']}")
-                addr_text.setStyleSheet("font-family: 'Consolas'; padding: 2px;")
+            for addr in addresses:
+                addr_text = QLabel(addr)
+                addr_text.setObjectName("ifaceAddress")
                 addr_layout.addWidget(addr_text)
             addr_group.setLayout(addr_layout)
             layout.addWidget(addr_group)
 
         card.setLayout(layout)
-        return card
+        return {
+            "card": card,
+            "status_label": status_label,
+            "speed_label": speed_label,
+            "mtu_label": mtu_label,
+            "addresses": addresses,
+        }
 
     def _format_bytes(self, bytes):
         """Format bytes as human-readable text."""
-        for unit in ["B", "KB", "MB", "GB"]:
-            if bytes < 1024:
-                return f"{bytes:.2f} {unit}"
-            bytes /= 1024
-        return f"{bytes:.2f} TB"
-
-    def _clear_layout(self, layout):
-        """Clear all widgets from a layout."""
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        return format_size(bytes)
 
     def init_monitoring_tab(self):
         """Initialize real-time monitoring tab."""
@@ -509,61 +650,24 @@ class HardwareAnalyzerApp(QMainWindow):
         # CPU Usage
         layout.addWidget(QLabel("CPU Usage:"))
         self.cpu_progress = QProgressBar()
-        self.cpu_progress.setStyleSheet(
-            """
-            QProgressBar {
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #0066cc;
-                border-radius: 5px;
-            }
-        """
-        )
+        self.cpu_progress.setObjectName("cpuProgress")
         layout.addWidget(self.cpu_progress)
 
         # RAM Usage
         layout.addWidget(QLabel("RAM Usage:"))
         self.ram_progress = QProgressBar()
-        self.ram_progress.setStyleSheet(
-            """
-            QProgressBar {
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #28a745;
-                border-radius: 5px;
-            }
-        """
-        )
+        self.ram_progress.setObjectName("ramProgress")
         layout.addWidget(self.ram_progress)
 
         # GPU Usage
         layout.addWidget(QLabel("GPU Usage:"))
         self.gpu_progress = QProgressBar()
-        self.gpu_progress.setStyleSheet(
-            """
-            QProgressBar {
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #dc3545;
-                border-radius: 5px;
-            }
-        """
-        )
+        self.gpu_progress.setObjectName("gpuProgress")
         layout.addWidget(self.gpu_progress)
 
-        # Add graphs if matplotlib is available
-        if matplotlib_available:
-            self.add_monitoring_graphs(layout)
-
+        # Graphs are added when the tab is first shown
+        self._monitoring_layout = layout
+        self.monitoring_tab = monitoring_tab
         self.tab_widget.addTab(monitoring_tab, "Monitoring")
 
     def add_monitoring_graphs(self, layout):
@@ -578,11 +682,10 @@ class HardwareAnalyzerApp(QMainWindow):
             # Store axes for updates
             self.performance_axes = [ax1, ax2, ax3]
 
-            # Initialize data structures
-            self.time_data = deque(maxlen=60)  # Store 60 seconds of data
-            self.cpu_data = deque(maxlen=60)
-            self.ram_data = deque(maxlen=60)
-            self.gpu_data = deque(maxlen=60)
+            # One x slot per sample, newest on the right; the axes never
+            # rescale, so their rendered backgrounds can be reused
+            self._graph_x = np.arange(self.max_points)
+            newest = self.max_points - 1
 
             # Configure axes
             for ax in self.performance_axes:
@@ -590,14 +693,26 @@ class HardwareAnalyzerApp(QMainWindow):
                 ax.grid(True, linestyle="--", alpha=0.3)
                 ax.tick_params(colors="white")
                 ax.set_ylim(0, 100)
+                ax.set_xlim(0, newest)
+                ax.set_xticks(self._graph_x[newest::-10])
                 ax.yaxis.set_major_formatter(
                     plt.FuncFormatter(lambda x, p: f"{int(x)}%")
                 )
+                ax.xaxis.set_major_formatter(
+                    plt.FuncFormatter(lambda x, p: f"{int(x) - newest}s")
+                )
 
-            # Create lines
-            (self.cpu_line,) = ax1.plot([], [], "c-", linewidth=2, label="CPU")
-            (self.ram_line,) = ax2.plot([], [], "g-", linewidth=2, label="RAM")
-            (self.gpu_line,) = ax3.plot([], [], "r-", linewidth=2, label="GPU")
+            # Create lines; animated artists are left out of full redraws and
+            # blitted over the cached backgrounds instead
+            (self.cpu_line,) = ax1.plot(
+                [], [], "c-", linewidth=2, label="CPU", animated=True
+            )
+            (self.ram_line,) = ax2.plot(
+                [], [], "g-", linewidth=2, label="RAM", animated=True
+            )
+            (self.gpu_line,) = ax3.plot(
+                [], [], "r-", linewidth=2, label="GPU", animated=True
+            )
 
             # Set titles
             ax1.set_title("CPU Usage", color="cyan", pad=10)
@@ -609,6 +724,7 @@ class HardwareAnalyzerApp(QMainWindow):
                 size=10,
                 color="white",
                 bbox=dict(facecolor="#1E1E1E", edgecolor="none", alpha=0.7),
+                animated=True,
             )
             self.cpu_text = ax1.text(0.02, 0.95, "", transform=ax1.transAxes, **style)
             self.ram_text = ax2.text(0.02, 0.95, "", transform=ax2.transAxes, **style)
@@ -618,61 +734,145 @@ class HardwareAnalyzerApp(QMainWindow):
             for ax in self.performance_axes:
                 ax.legend(loc="upper right")
 
+            self._graph_artists = [
+                (self.cpu_line, self.cpu_text),
+                (self.ram_line, self.ram_text),
+                (self.gpu_line, self.gpu_text),
+            ]
+
             self.canvas = FigureCanvas(self.fig)
+            self._graph_backgrounds = None
+            self.canvas.mpl_connect("draw_event", self._on_graph_draw)
+            self.canvas.mpl_connect("resize_event", self._on_graph_resize)
             layout.addWidget(self.canvas)
 
-            # Start update timer
+            # Update timer, started by _update_graph_timer while visible
             self.graph_timer = QTimer()
             self.graph_timer.timeout.connect(self.update_graphs)
-            self.graph_timer.start(1000)  # Update every second
+            self.graph_timer.setInterval(1000)  # Update every second
 
         except Exception as e:
             self.logger.error(f"Error setting up monitoring graphs: {e}")
 
+    def _on_tab_changed(self, index):
+        """Build a tab on first view and pause graphs that are not shown."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            builder()
+        self._update_graph_timer()
+
+    def _build_monitoring_graphs(self):
+        """Add the monitoring graphs if matplotlib is available."""
+        if matplotlib_available:
+            self.add_monitoring_graphs(self._monitoring_layout)
+
+    def _update_graph_timer(self):
+        """Run the graph timer only while the monitoring tab can be seen."""
+        if not hasattr(self, "graph_timer"):
+            return
+        visible = (
+            self.isVisible()
+            and not self.isMinimized()
+            and self.tab_widget.currentWidget() is self.monitoring_tab
+        )
+        if visible and not self.graph_timer.isActive():
+            # Samples from before the pause stay; the monitoring export reads
+            # them, and only initialize_data_buffers clears the ring
+            self.graph_timer.start()
+        elif not visible and self.graph_timer.isActive():
+            self.graph_timer.stop()
+
+    def showEvent(self, event):
+        """Resume the graphs when the window is shown."""
+        super().showEvent(event)
+        self._update_graph_timer()
+
+    def hideEvent(self, event):
+        """Pause the graphs when the window is hidden."""
+        super().hideEvent(event)
+        self._update_graph_timer()
+
+    def changeEvent(self, event):
+        """Pause the graphs while the window is minimized."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._update_graph_timer()
+
     def update_graphs(self):
         """Update performance graphs with latest data."""
         try:
-            current_time = datetime.now()
-
             # Get latest values
-            cpu_usage = float(self.hardware_manager.get_cpu_usage())
-            ram_usage = float(self.hardware_manager.get_ram_usage())
-            gpu_usage = float(self.hardware_manager.get_gpu_usage())
+            usage = self.hardware_manager.get_usage_vector()
+            cpu_usage, ram_usage, gpu_usage = usage
 
             # Update data
-            self.time_data.append(current_time)
-            self.cpu_data.append(cpu_usage)
-            self.ram_data.append(ram_usage)
-            self.gpu_data.append(gpu_usage)
-
-            # Update line data
-            times = list(self.time_data)
-            self.cpu_line.set_data(times, self.cpu_data)
-            self.ram_line.set_data(times, self.ram_data)
-            self.gpu_line.set_data(times, self.gpu_data)
+            i = self.mon_idx
+            self.mon[:, i] = (time.time(), *usage)
+            self.mon_idx = (i + 1) % self.max_points
+            self.mon_count = min(self.mon_count + 1, self.max_points)
+
+            # Update line data, oldest sample first
+            order = self._mon_order()
+            x = self._graph_x[self.max_points - len(order) :]
+            self.cpu_line.set_data(x, self.mon[1, order])
+            self.ram_line.set_data(x, self.mon[2, order])
+            self.gpu_line.set_data(x, self.mon[3, order])
 
             # Update text displays
             self.cpu_text.set_text(f"{cpu_usage:.1f}%")
             self.ram_text.set_text(f"{ram_usage:.1f}%")
             self.gpu_text.set_text(f"{gpu_usage:.1f}%")
 
-            # Update axes limits
-            for ax in self.performance_axes:
-                ax.set_xlim(current_time - timedelta(seconds=60), current_time)
-                ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M:%S"))
-
             # Draw update
-            self.canvas.draw()
+            self._blit_graphs()
 
         except Exception as e:
             self.logger.error(f"Error updating graphs: {e}")
 
+    def _blit_graphs(self):
+        """Redraw only the lines and value labels over the cached axes."""
+        if self._graph_backgrounds is None:
+            # Nothing cached yet; the full draw's draw_event adds the artists
+            self.canvas.draw()
+            return
+        for ax, background, artists in zip(
+            self.performance_axes, self._graph_backgrounds, self._graph_artists
+        ):
+            self.canvas.restore_region(background)
+            for artist in artists:
+                ax.draw_artist(artist)
+            self.canvas.blit(ax.bbox)
+
+    def _on_graph_draw(self, event):
+        """Cache the axes backgrounds after a full redraw and draw the artists."""
+        self._graph_backgrounds = [
+            self.canvas.copy_from_bbox(ax.bbox) for ax in self.performance_axes
+        ]
+        for ax, artists in zip(self.performance_axes, self._graph_artists):
+            for artist in artists:
+                ax.draw_artist(artist)
+
+    def _on_graph_resize(self, event):
+        """Drop the cached backgrounds; the next full draw recaptures them."""
+        self._graph_backgrounds = None
+
     def initialize_data_buffers(self):
         """Initialize efficient data storage for monitoring."""
-        self.time_data = deque(maxlen=self.max_points)
-        self.cpu_data = deque(maxlen=self.max_points)
-        self.ram_data = deque(maxlen=self.max_points)
-        self.gpu_data = deque(maxlen=self.max_points)
+        # One ring of rows (time, cpu, ram, gpu) written at mon_idx
+        self.mon = np.zeros((4, self.max_points), np.float64)
+        self.mon_idx = 0
+        self.mon_count = 0
+
+    def _mon_order(self):
+        """Ring indices of the stored samples, oldest first."""
+        start = self.mon_idx - self.mon_count
+        return (np.arange(self.mon_count) + start) % self.max_points
+
+    def _latest_sample(self, row):
+        """Most recent value of a monitoring row, or 0 before the first sample."""
+        if not self.mon_count:
+            return 0
+        return float(self.mon[row, self.mon_idx - 1])
 
     def init_settings_tab(self):
         """Initialize settings tab."""
@@ -683,42 +883,7 @@ class HardwareAnalyzerApp(QMainWindow):
         layout.addWidget(QLabel("Theme:"))
         self.theme_combo = QComboBox()
         self.theme_combo.addItems(["Light", "Dark", "System"])
-        self.theme_combo.setStyleSheet(
-            """
-            QComboBox {
-                background-color: #252526;
-                color: #FFFFFF;
-                padding: 5px 10px;
-                border: 1px solid #3a3a3a;
-                border-radius: 4px;
-                min-width: 150px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                width: 12px;
-                height: 12px;
-                color: #FFFFFF;
-                /* Use unicode triangle as fallback */
-                image: none;
-                /* Add the arrow using pseudo-element */
-            }
-            QComboBox::down-arrow:after {
-                content: "▼";
-            }
-            QComboBox:hover {
-                background-color: #3d3d3d;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #252526;
-                color: #FFFFFF;
-                border: 1px solid #3a3a3a;
-                selection-background-color: #0078d4;
-            }
-        """
-        )
+        self.theme_combo.setObjectName("themeCombo")
         self.theme_combo.currentTextChanged.connect(self.change_theme)
         layout.addWidget(self.theme_combo)
 
@@ -726,26 +891,12 @@ class HardwareAnalyzerApp(QMainWindow):
         layout.addWidget(QLabel("Auto-refresh Interval:"))
         self.refresh_combo = QComboBox()
         self.refresh_combo.addItems(["5s", "10s", "30s", "1m"])
-        self.refresh_combo.setStyleSheet(
-            """
-            QComboBox {
-                padding: 5px;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-            }
-        """
-        )
+        self.refresh_combo.setObjectName("refreshCombo")
         layout.addWidget(self.refresh_combo)
 
         # Auto-start option
         self.autostart_check = QCheckBox("Start with System")
-        self.autostart_check.setStyleSheet(
-            """
-            QCheckBox {
-                spacing: 5px;
-            }
-        """
-        )
+        self.autostart_check.setObjectName("autostartCheck")
         layout.addWidget(self.autostart_check)
 
         layout.addStretch()
@@ -757,52 +908,20 @@ class HardwareAnalyzerApp(QMainWindow):
 
         # Refresh All button with modern styling
         refresh_btn = QPushButton("🔄 Refresh All")
-        refresh_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #0066cc;
-                color: white;
-                padding: 8px 15px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0052a3;
-            }
-        """
-        )
+        refresh_btn.setObjectName("refreshBtn")
         refresh_btn.clicked.connect(self.refresh_all)
         toolbar.addWidget(refresh_btn)
 
         # Export options with styled dropdown
         export_combo = QComboBox()
         export_combo.addItems(["Export JSON", "Export CSV", "Export PDF"])
-        export_combo.setStyleSheet(
-            """
-            QComboBox {
-                padding: 8px;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                min-width: 150px;
-            }
-        """
-        )
+        export_combo.setObjectName("exportCombo")
         export_combo.currentTextChanged.connect(self.handle_export)
         toolbar.addWidget(export_combo)
 
         # Auto refresh toggle with modern switch style
         self.auto_refresh_cb = QCheckBox("Auto Refresh")
-        self.auto_refresh_cb.setStyleSheet(
-            """
-            QCheckBox {
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-        """
-        )
+        self.auto_refresh_cb.setObjectName("autoRefreshCheck")
         self.auto_refresh_cb.stateChanged.connect(self.toggle_auto_refresh)
         toolbar.addWidget(self.auto_refresh_cb)
 
@@ -852,33 +971,39 @@ class HardwareAnalyzerApp(QMainWindow):
             self.show_error("Auto-refresh Error", str(e))
 
     def refresh_all(self):
+        """Sample all components off the GUI thread."""
+        self._start_sampler(self._refresh_sampler)
+
+    def _collect_refresh(self):
+        """Collect hardware and network data; runs on the thread pool."""
+        # Network probes and the hardware snapshot block independently
+        network = self._probe_pool.submit(self._collect_network)
+        snapshot = self.hardware_manager.snapshot()
+        return dict(network.result(), snapshot=snapshot)
+
+    def _apply_refresh(self, payload):
         """Optimized refresh method with reduced UI updates."""
         try:
-            QApplication.processEvents()  # Process pending events
+            if "error" in payload:
+                raise RuntimeError(payload["error"])
 
             # Batch updates with proper error handling
             self.setUpdatesEnabled(False)  # Disable updates during refresh
             try:
                 # Refresh hardware info first
-                formatted_output = self.hardware_manager.get_formatted_summary()
-                self.hardware_text.setFont(QFont("Cascadia Code", 10))
-                self.hardware_text.setText(formatted_output)
+                snap = payload["snapshot"]
+                self._set_hardware_text(snap.summary)
 
                 # Get current metrics
-                cpu_usage = float(self.hardware_manager.get_cpu_usage())
-                ram_usage = float(self.hardware_manager.get_ram_usage())
-                gpu_usage = float(self.hardware_manager.get_gpu_usage())
+                cpu_usage, ram_usage, gpu_usage = snap.cpu, snap.ram, snap.gpu
 
                 # Update progress bars
-                self.cpu_progress.setValue(int(cpu_usage))
-                self.ram_progress.setValue(int(ram_usage))
-                self.gpu_progress.setValue(int(gpu_usage))
+                self._set_progress_bars(cpu_usage, ram_usage, gpu_usage)
 
                 # Update network info
-                network_info = self.network_manager.get_network_summary()
+                network_info = payload["network"]
                 self.update_network_status(network_info)
-                formatted_json = json.dumps(network_info, indent=2)
-                self.network_text.setText(formatted_json)
+                self._set_network_text(payload["network_json"])
 
                 # Update status bar
                 self.status_bar.showMessage(
@@ -886,7 +1011,7 @@ class HardwareAnalyzerApp(QMainWindow):
                 )
 
                 # Update graphs if available
-                if hasattr(self, 'graph_timer'):
+                if hasattr(self, "graph_timer") and self.graph_timer.isActive():
                     self.update_graphs()
 
             finally:
@@ -900,21 +1025,45 @@ class HardwareAnalyzerApp(QMainWindow):
             self.logger.error(f"Refresh failed: {e}")
             self.show_error("Refresh Error", str(e))
 
+    def _set_hardware_text(self, text):
+        """Show the hardware summary, skipping the re-layout when unchanged."""
+        text_hash = hash(text)
+        if text_hash != self._hw_text_hash:
+            # Plain text skips the rich-text sniffing setText does
+            with QSignalBlocker(self.hardware_text):
+                self.hardware_text.setPlainText(text)
+            self._hw_text_hash = text_hash
+
+    def _set_network_text(self, text):
+        """Show the network JSON, skipping the re-layout when unchanged."""
+        text_hash = hash(text)
+        if text_hash != self._net_json_hash:
+            # Plain text skips the rich-text sniffing setText does on JSON
+            with QSignalBlocker(self.network_text):
+                self.network_text.setPlainText(text)
+            self._net_json_hash = text_hash
+
     def refresh_hardware(self):
+        """Sample hardware information off the GUI thread."""
+        self._start_sampler(self._hardware_sampler)
+
+    def _collect_hardware(self):
+        """Collect a hardware snapshot; runs on the thread pool."""
+        return {"snapshot": self.hardware_manager.snapshot()}
+
+    def _apply_hardware(self, payload):
         """Refresh hardware information with optimized display."""
         try:
-            # Use the new pre-formatted summary method
-            formatted_output = self.hardware_manager.get_formatted_summary()
-            self.hardware_text.setFont(
-                QFont("Cascadia Code", 10)
-            )  # Better monospace font
-            self.hardware_text.setText(formatted_output)
+            if "error" in payload:
+                raise RuntimeError(payload["error"])
+
+            # One snapshot feeds both the text and the status bar
+            snap = payload["snapshot"]
+            self._set_hardware_text(snap.summary)
 
             # Update status bar with CPU and RAM usage
-            cpu_usage = self.hardware_manager.get_cpu_usage()
-            ram_usage = self.hardware_manager.get_ram_usage()
             self.status_bar.showMessage(
-                f"✓ Updated | CPU: {cpu_usage:.1f}% | RAM: {ram_usage:.1f}% | {datetime.now().strftime('%H:%M:%S')}"
+                f"✓ Updated | CPU: {snap.cpu:.1f}% | RAM: {snap.ram:.1f}% | {datetime.now().strftime('%H:%M:%S')}"
             )
 
         except Exception as e:
@@ -924,49 +1073,35 @@ class HardwareAnalyzerApp(QMainWindow):
     def _format_hardware_summary(self, summary):
         """Format hardware summary for display."""
         try:
-            sections = []
-
-            # CPU Section with enhanced visuals
             cpu_info = summary.get("cpu", {})
-            sections.append("╔════════════════ CPU INFORMATION ════════════════╗")
-            sections.append(f"║  Model      : {cpu_info.get('name', 'Unknown'):<35} ║")
-            sections.append(
-                f"║  Cores      : {cpu_info.get('cores', 0)} Physical, {cpu_info.get('threads', 0)} Logical ║"
-            )
-            sections.append(
-                f"║  Frequency  : {cpu_info.get('frequency', 'Unknown'):<35} ║"
-            )
-            usage = float(
-                cpu_info.get("current_usage", "0").strip("%")
-                if isinstance(cpu_info.get("current_usage"), str)
-                else cpu_info.get("current_usage", 0)
-            )
-            sections.append(f"║  Usage      : {self._get_colored_status(usage)}% ║")
-            sections.append("╚══════════════════════════════════════════════════╝")
+            try:
+                usage = float(str(cpu_info.get("current_usage", "0")).rstrip("%"))
+            except ValueError:
+                usage = 0.0
 
-            # RAM Section
             ram_info = summary.get("ram", {})
-            sections.append("\n╔════════════════ MEMORY STATUS ════════════════╗")
-
             try:
                 total_ram = float(ram_info.get("total", "0").split()[0])
                 used_ram = float(ram_info.get("used", "0").split()[0])
-                ram_percent = float(ram_info.get("percent", 0))
+                ram_percent = float(ram_info.get("percent_used", "0").rstrip("%"))
                 available_ram = float(ram_info.get("available", "0").split()[0])
             except (ValueError, AttributeError):
-                total_ram = used_ram = ram_percent = available_ram = 0
-
-            sections.append(
-                f"║  Total      : {total_ram:>6.2f} GB {self._get_memory_bar(ram_percent)} ║"
+                total_ram = used_ram = ram_percent = available_ram = 0.0
+
+            return self._HW_TEMPLATE.format_map(
+                {
+                    "cpu_name": cpu_info.get("name", "Unknown"),
+                    "cores": cpu_info.get("cores", 0),
+                    "threads": cpu_info.get("threads", 0),
+                    "frequency": cpu_info.get("frequency", "Unknown"),
+                    "usage": self._get_colored_status(usage),
+                    "total_ram": total_ram,
+                    "used_ram": used_ram,
+                    "ram_percent": ram_percent,
+                    "available_ram": available_ram,
+                    "ram_bar": self._get_memory_bar(ram_percent),
+                }
             )
-            sections.append(f"║  Used       : {used_ram:>6.2f} GB ({ram_percent}%) ║")
-            sections.append(f"║  Available  : {available_ram:>6.2f} GB ║")
-            sections.append("╚══════════════════════════════════════════════════╝")
-
-            # Rest of sections...
-            # ... existing code for GPU and Storage sections ...
-
-            return "\n".join(sections)
 
         except Exception as e:
             self.logger.error(f"Error formatting hardware summary: {e}")
@@ -983,22 +1118,17 @@ class HardwareAnalyzerApp(QMainWindow):
 
     def _get_memory_bar(self, percent):
         """Generate a visual memory usage bar."""
-        width = 20
-        filled = int(width * percent / 100)
-        bar = "█" * filled + "░" * (width - filled)
-        return f"[{bar}]"
+        return _MEM_BARS[max(0, min(20, int(20 * percent / 100)))]
 
     def _get_storage_bar(self, percent):
         """Generate a visual storage usage bar."""
-        width = 40
-        filled = int(width * percent / 100)
         if percent < 60:
-            bar = "█" * filled + "░" * (width - filled)
+            bars = _STOR_BARS_LIGHT
         elif percent < 80:
-            bar = "▒" * filled + "░" * (width - filled)
+            bars = _STOR_BARS_MED
         else:
-            bar = "▓" * filled + "░" * (width - filled)
-        return f"[{bar}]"
+            bars = _STOR_BARS_HEAVY
+        return bars[max(0, min(40, int(40 * percent / 100)))]
 
     def _get_enhanced_status(self, status):
         """Convert status to enhanced visual indicator."""
@@ -1010,14 +1140,18 @@ class HardwareAnalyzerApp(QMainWindow):
             return "🚨 High Usage Alert"
 
     def refresh_network(self):
+        """Sample network information for the network tab off the GUI thread."""
+        self._start_sampler(self._network_refresh_sampler)
+
+    def _apply_network_refresh(self, payload):
         """Refresh network information with error handling."""
         try:
-            # Get network info
-            network_info = self.network_manager.get_network_summary()
+            if "error" in payload:
+                raise RuntimeError(payload["error"])
+            network_info = payload["network"]
 
             # Update the text display
-            formatted_json = json.dumps(network_info, indent=2)
-            self.network_text.setText(formatted_json)
+            self._set_network_text(payload["network_json"])
 
             # Update status indicators
             self.update_network_status(network_info)
@@ -1039,78 +1173,36 @@ class HardwareAnalyzerApp(QMainWindow):
         try:
             # Update connection status
             is_connected = network_info.get("connectivity", {}).get("connected", False)
-            self.connection_status.setText(
-                "🟢 Connected" if is_connected else "🔴 Disconnected"
-            )
-            self.connection_status.setStyleSheet(
-                """
-                QLabel {
-                    padding: 10px;
-                    border-radius: 5px;
-                    font-weight: bold;
-                    background-color: #E8F5E9;
-                    color: #2E7D32;
-                }
-            """
-                if is_connected
-                else """
-                QLabel {
-                    padding: 10px;
-                    border-radius: 5px;
-                    font-weight: bold;
-                    background-color: #FFEBEE;
-                    color: #C62828;
-                }
-            """
+            self._set_connection_status(
+                is_connected, "🟢 Connected" if is_connected else "🔴 Disconnected"
             )
 
             # Update network interfaces
-            self._clear_layout(self.interfaces_layout)
-            for iface in network_info.get("interfaces", []):
-                interface_card = self._create_interface_card(iface)
-                self.interfaces_layout.addWidget(interface_card)
+            self._sync_interface_cards(network_info.get("interfaces", []))
 
             # Update network statistics
             io_stats = network_info.get("io_stats", {})
-            stats_text = (
-                f"📊 Network Statistics\n\n"
-                f"📥 Received: {self._format_bytes(io_stats.get('bytes_recv', 0))}\n"
-                f"📤 Sent: {self._format_bytes(io_stats.get('bytes_sent', 0))}\n"
-                f"📦 Packets In: {io_stats.get('packets_recv', 0):,}\n"
-                f"📦 Packets Out: {io_stats.get('packets_sent', 0):,}\n"
-                f"❌ Errors In: {io_stats.get('errin', 0)}\n"
-                f"❌ Errors Out: {io_stats.get('errout', 0)}"
-            )
-            self.network_stats.setText(stats_text)
-            self.network_stats.setStyleSheet(
-                """
-                QLabel {
-                    font-family: 'Consolas';
-                    font-size: 12px;
-                    padding: 15px;
-                    background-color: #252526;
-                    color: #ffffff;
-                    border-radius: 5px;
-                }
-            """
-            )
+            io_key = self._io_key("status", io_stats)
+            if io_key != self._last_io:
+                stats_text = (
+                    f"📊 Network Statistics\n\n"
+                    f"📥 Received: {self._format_bytes(io_stats.get('bytes_recv', 0))}\n"
+                    f"📤 Sent: {self._format_bytes(io_stats.get('bytes_sent', 0))}\n"
+                    f"📦 Packets In: {io_stats.get('packets_recv', 0):,}\n"
+                    f"📦 Packets Out: {io_stats.get('packets_sent', 0):,}\n"
+                    f"❌ Errors In: {io_stats.get('errin', 0)}\n"
+                    f"❌ Errors Out: {io_stats.get('errout', 0)}"
+                )
+                self.network_stats.setText(stats_text)
+                self._last_io = io_key
+            self._set_style(self.network_stats, self._STATS_STYLE)
 
             # Update IP information
             external_ip = network_info.get("connectivity", {}).get(
                 "external_ip", "Unknown"
             )
             self.external_ip.setText(f"🌐 External IP: {external_ip}")
-            self.external_ip.setStyleSheet(
-                """
-                QLabel {
-                    font-size: 13px;
-                    padding: 10px;
-                    background-color: #252526;
-                    color: #ffffff;
-                    border-radius: 5px;
-                }
-            """
-            )
+            self._set_style(self.external_ip, self._EXTERNAL_IP_STYLE)
 
         except Exception as e:
             self.logger.error(f"Error updating network status: {e}")
@@ -1118,16 +1210,19 @@ class HardwareAnalyzerApp(QMainWindow):
     def update_monitoring(self):
         """Update real-time monitoring data."""
         try:
-            cpu_usage = self.hardware_manager.get_cpu_usage()
-            ram_usage = self.hardware_manager.get_ram_usage()
-            gpu_usage = self.hardware_manager.get_gpu_usage()
-
-            self.cpu_progress.setValue(int(cpu_usage))
-            self.ram_progress.setValue(int(ram_usage))
-            self.gpu_progress.setValue(int(gpu_usage))
+            self._set_progress_bars(*self.hardware_manager.get_usage_vector())
         except Exception as e:
             self.show_error("Monitoring Update Error", str(e))
 
+    def _set_progress_bars(self, cpu_usage, ram_usage, gpu_usage):
+        """Update the usage bars, skipping any whose integer value is unchanged."""
+        bars = (self.cpu_progress, self.ram_progress, self.gpu_progress)
+        values = (int(cpu_usage), int(ram_usage), int(gpu_usage))
+        for i, (bar, value) in enumerate(zip(bars, values)):
+            if value != self._last_bars[i]:
+                bar.setValue(value)
+                self._last_bars[i] = value
+
     def update_status_bar(self, refresh_status=None):
         """Update the status bar with the latest information."""
         try:
@@ -1148,18 +1243,18 @@ class HardwareAnalyzerApp(QMainWindow):
         """Update hardware display with new metrics."""
         try:
             # Update progress bars safely
-            self.cpu_progress.setValue(int(results.get("cpu", 0)))
-            self.ram_progress.setValue(int(results.get("ram", 0)))
-            self.gpu_progress.setValue(int(results.get("gpu", 0)))
+            self._set_progress_bars(
+                results.get("cpu", 0), results.get("ram", 0), results.get("gpu", 0)
+            )
 
             # Get and format summary with error handling
             try:
                 summary = self.hardware_manager.get_hardware_summary()
                 formatted_output = self._format_hardware_summary(summary)
-                self.hardware_text.setText(formatted_output)
+                self._set_hardware_text(formatted_output)
             except Exception as e:
                 self.logger.error(f"Error getting hardware summary: {e}")
-                self.hardware_text.setText("Error retrieving hardware information")
+                self._set_hardware_text("Error retrieving hardware information")
 
         except Exception as e:
             self.logger.error(f"Error updating hardware display: {e}")
@@ -1168,21 +1263,12 @@ class HardwareAnalyzerApp(QMainWindow):
     def change_theme(self, theme_name):
         """Change application theme with smooth transition."""
         try:
-            if theme_name == "Dark":
-                self.setStyleSheet(self.theme_manager.get_dark_theme())
-                self.current_theme = "Dark"
-            elif theme_name == "Light":
-                self.setStyleSheet(self.theme_manager.get_light_theme())
-                self.current_theme = "Light"
-            else:  # System
-                import darkdetect
-
-                system_theme = "Dark" if darkdetect.isDark() else "Light"
-                if system_theme == "Dark":
-                    self.setStyleSheet(self.theme_manager.get_dark_theme())
-                else:
-                    self.setStyleSheet(self.theme_manager.get_light_theme())
-                self.current_theme = system_theme
+            if theme_name not in self._themes:  # System
+                theme_name = "Dark" if self._system_is_dark else "Light"
+
+            # Re-applying the same sheet would still restyle every widget
+            self._set_style(self, self._themes[theme_name])
+            self.current_theme = theme_name
 
             # Save theme preference
             self.save_settings()
@@ -1191,7 +1277,17 @@ class HardwareAnalyzerApp(QMainWindow):
             self.logger.error(f"Theme change error: {e}")
             self.show_error("Theme Error", str(e))
 
+    def _on_system_theme_changed(self, theme):
+        """Track the OS theme and follow it while "System" is selected."""
+        self._system_is_dark = theme == "Dark"
+        if self.theme_combo.currentText() == "System":
+            self.change_theme("System")
+
     def save_settings(self):
+        """Schedule a settings save, restarting the delay on each change."""
+        self._settings_save_timer.start()
+
+    def _do_save_settings(self):
         """Save application settings."""
         try:
             settings = {
@@ -1199,30 +1295,32 @@ class HardwareAnalyzerApp(QMainWindow):
                 "refresh_interval": self.refresh_combo.currentText(),
                 "autostart": self.autostart_check.isChecked(),
             }
-            with open("settings.json", "w") as f:
-                json.dump(settings, f)
+            # Write a sibling file and swap it in so a crash never truncates
+            _SETTINGS_TMP_PATH.write_bytes(dumps_json(settings, indent=False))
+            _SETTINGS_TMP_PATH.replace(_SETTINGS_PATH)
         except Exception as e:
             self.logger.error(f"Settings save error: {e}")
 
     def load_settings(self):
         """Load application settings."""
         try:
-            if os.path.exists("settings.json"):
-                with open("settings.json", "r") as f:
-                    settings = json.load(f)
+            try:
+                settings = json.loads(_SETTINGS_PATH.read_bytes())
+            except FileNotFoundError:
+                return  # First run keeps the defaults
 
-                # Apply theme
-                theme = settings.get("theme", "System")
-                self.theme_combo.setCurrentText(theme)
-                self.change_theme(theme)
+            # Apply theme
+            theme = settings.get("theme", "System")
+            self.theme_combo.setCurrentText(theme)
+            self.change_theme(theme)
 
-                # Apply refresh interval
-                interval = settings.get("refresh_interval", "5s")
-                self.refresh_combo.setCurrentText(interval)
+            # Apply refresh interval
+            interval = settings.get("refresh_interval", "5s")
+            self.refresh_combo.setCurrentText(interval)
 
-                # Apply autostart
-                autostart = settings.get("autostart", False)
-                self.autostart_check.setChecked(autostart)
+            # Apply autostart
+            autostart = settings.get("autostart", False)
+            self.autostart_check.setChecked(autostart)
 
         except Exception as e:
             self.logger.error(f"Settings load error: {e}")
@@ -1234,8 +1332,8 @@ class HardwareAnalyzerApp(QMainWindow):
                 self, "Export Hardware Info", "", "JSON Files (*.json)"
             )
             if file_name:
-                with open(file_name, "w") as f:
-                    json.dump(self.hardware_manager.get_hardware_summary(), f, indent=2)
+                with open(file_name, "wb", buffering=65536) as f:
+                    f.write(dumps_json(self.hardware_manager.get_hardware_summary()))
         except Exception as e:
             self.show_error("Export Error", str(e))
 
@@ -1246,8 +1344,8 @@ class HardwareAnalyzerApp(QMainWindow):
                 self, "Export Network Info", "", "JSON Files (*.json)"
             )
             if file_name:
-                with open(file_name, "w") as f:
-                    json.dump(self.network_manager.get_network_summary(), f, indent=2)
+                with open(file_name, "wb", buffering=65536) as f:
+                    f.write(dumps_json(self.network_manager.get_network_summary()))
         except Exception as e:
             self.show_error("Export Error", str(e))
 
@@ -1264,9 +1362,9 @@ class HardwareAnalyzerApp(QMainWindow):
                     "network": self.network_manager.get_network_summary(),
                     "timestamp": timestamp,
                     "system_metrics": {
-                        "cpu_usage": self.cpu_data[-1] if self.cpu_data else 0,
-                        "ram_usage": self.ram_data[-1] if self.ram_data else 0,
-                        "gpu_usage": self.gpu_data[-1] if self.gpu_data else 0,
+                        "cpu_usage": self._latest_sample(1),
+                        "ram_usage": self._latest_sample(2),
+                        "gpu_usage": self._latest_sample(3),
                     },
                 }
                 self._save_export(data, default_name, "JSON Files (*.json)")
@@ -1288,38 +1386,62 @@ class HardwareAnalyzerApp(QMainWindow):
         file_name, _ = QFileDialog.getSaveFileName(
             self,
             "Save Report",
-            os.path.join(os.path.expanduser("~/Desktop"), default_name),
+            str(_DESKTOP / default_name),
             file_filter,
         )
         if file_name:
-            with open(file_name, "w") as f:
+            with open(file_name, "wb", buffering=65536) as f:
                 if file_filter.startswith("JSON"):
-                    json.dump(data, f, indent=2)
+                    f.write(dumps_json(data))
                 self.show_success(f"Report exported to {file_name}")
 
+    def _save_export_csv(self, default_name):
+        """Save the hardware report or the monitoring samples as CSV."""
+        file_name, selected_filter = QFileDialog.getSaveFileName(
+            self,
+            "Save Report",
+            str(_DESKTOP / default_name),
+            "Report CSV (*.csv);;Monitoring Samples CSV (*.csv)",
+        )
+        if file_name:
+            if selected_filter.startswith("Monitoring"):
+                self._export_monitoring_csv(file_name)
+            else:
+                self.export_data_to_csv(file_name)
+            self.show_success(f"Report exported to {file_name}")
+
+    def _export_monitoring_csv(self, file_path):
+        """Export the monitoring samples, oldest first, as numeric CSV."""
+        # The buffer is already one float row per series; write it in one go
+        samples = self.mon[:, self._mon_order()].T
+        np.savetxt(
+            file_path,
+            samples,
+            fmt="%.3f",
+            delimiter=",",
+            header="t,cpu,ram,gpu",
+            comments="",
+        )
+
     def export_data_to_csv(self, file_path):
         """Export data to CSV format."""
+        import csv
+
         try:
             hardware_summary = self.hardware_manager.get_hardware_summary()
-            with open(file_path, "w", newline="") as csvfile:
-                writer = csv.writer(csvfile)
-
-                # Write system information
-                writer.writerow(["System Information"])
-                for key, value in hardware_summary["system_info"].items():
-                    writer.writerow([key, value])
-                writer.writerow([])
-
-                # Write CPU information
-                writer.writerow(["CPU Information"])
-                for key, value in hardware_summary["cpu"].items():
-                    writer.writerow([key, value])
-                writer.writerow([])
-
-                # Write RAM information
-                writer.writerow(["Memory Information"])
-                for key, value in hardware_summary["ram"].items():
-                    writer.writerow([key, value])
+            # System, CPU and memory blocks, written in one writerows call
+            rows = [
+                ["System Information"],
+                *hardware_summary["system_info"].items(),
+                [],
+                ["CPU Information"],
+                *hardware_summary["cpu"].items(),
+                [],
+                ["Memory Information"],
+                *hardware_summary["ram"].items(),
+            ]
+            with open(file_path, "w", newline="", buffering=1 << 20) as csvfile:
+                csv.writer(csvfile).writerows(rows)
 
         except Exception as e:
             raise Exception(f"CSV export failed: {e}")
@@ -1368,6 +1490,17 @@ class HardwareAnalyzerApp(QMainWindow):
         try:
             if hasattr(self, "refresh_timer"):
                 self.refresh_timer.stop()
+                self.network_timer.stop()
+
+            if self._settings_save_timer.isActive():
+                # Flush a pending settings save
+                self._settings_save_timer.stop()
+                self._do_save_settings()
+
+            if hasattr(self, "_thread_pool"):
+                # Let an in-flight sample finish before the managers shut down
+                self._thread_pool.waitForDone(5000)
+                self._probe_pool.shutdown(wait=True)
 
             if hasattr(self, "hardware_manager"):
                 self.hardware_manager.cleanup()
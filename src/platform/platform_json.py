@@ -0,0 +1,13 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # Optional; falls back to the stdlib encoder
+    orjson = None
+
+
+def dumps_pretty(data):
+    """Serialize data to indented JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=4)
@@ -1,6 +1,37 @@
+import functools
+import os
 import platform
+import re
 import subprocess
-import json
+
+from platform_json import dumps_pretty
+
+_CPUINFO_FIELD = re.compile(
+    r"^(processor|vendor_id|model name|physical id|siblings|cpu cores|cpu MHz)"
+    r"\s*:\s*(.+)$",
+    re.M,
+)
+_OS_RELEASE = "/etc/os-release"
+
+
+def _unquote(value):
+    """Strip one pair of matching surrounding quotes from an os-release value."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_os_release(mtime_ns):
+    """Parse os-release; the mtime key drops the cache when the file changes."""
+    os_info = {}
+    with open(_OS_RELEASE, "r") as file:
+        for line in file:
+            parts = line.strip().split("=", 1)
+            # Skip blank lines and comments
+            if len(parts) == 2 and not parts[0].startswith("#"):
+                os_info[parts[0]] = _unquote(parts[1])
+    return os_info
 
 
 class PlatformLinux:
@@ -12,12 +43,7 @@ class PlatformLinux:
     def _get_os_info(self):
         """Retrieve Linux distribution information."""
         try:
-            with open("/etc/os-release", "r") as file:
-                os_info = {}
-                for line in file:
-                    key, value = line.strip().split("=")
-                    os_info[key] = value.strip('"')
-                return os_info
+            return dict(_parse_os_release(os.stat(_OS_RELEASE).st_mtime_ns))
         except Exception as e:
             return {"error": f"Failed to fetch OS info: {e}"}
 
@@ -29,9 +55,51 @@ class PlatformLinux:
             return f"Failed to fetch kernel version: {e}"
 
     def get_hardware_info(self):
+        """Retrieve hardware-specific information from /proc/cpuinfo."""
+        try:
+            with open("/proc/cpuinfo", "r") as file:
+                hardware_info = self._parse_cpuinfo(file.read())
+            if hardware_info:
+                return hardware_info
+        except OSError:
+            pass
+        return self._get_lscpu_info()
+
+    def _parse_cpuinfo(self, text):
+        """Map /proc/cpuinfo fields onto the keys lscpu reports."""
+        fields = {}
+        processors = 0
+        sockets = set()
+        for key, value in _CPUINFO_FIELD.findall(text):
+            if key == "processor":
+                processors += 1
+            elif key == "physical id":
+                sockets.add(value)
+            else:
+                fields.setdefault(key, value.strip())
+        # ARM kernels list no model name; lscpu decodes their CPU part ids
+        if "model name" not in fields:
+            return {}
+
+        hardware_info = {
+            "Architecture": platform.machine(),
+            "CPU(s)": str(processors),
+            "Vendor ID": fields.get("vendor_id", "Unknown"),
+            "Model name": fields["model name"],
+        }
+        if "cpu cores" in fields and "siblings" in fields:
+            cores, siblings = int(fields["cpu cores"]), int(fields["siblings"])
+            hardware_info["Thread(s) per core"] = str(siblings // max(cores, 1))
+            hardware_info["Core(s) per socket"] = str(cores)
+        hardware_info["Socket(s)"] = str(len(sockets) or 1)
+        if "cpu MHz" in fields:
+            hardware_info["CPU MHz"] = fields["cpu MHz"]
+        return hardware_info
+
+    def _get_lscpu_info(self):
         """Retrieve hardware-specific information using lscpu."""
         try:
-            output = subprocess.check_output("lscpu", shell=True).decode("utf-8")
+            output = subprocess.check_output(["lscpu"], text=True)
             hardware_info = {}
             for line in output.splitlines():
                 if ":" in line:
@@ -52,7 +120,7 @@ class PlatformLinux:
 
     def to_json(self):
         """Convert platform details to JSON."""
-        return json.dumps(self.to_dict(), indent=4)
+        return dumps_pretty(self.to_dict())
 
     def __str__(self):
         """String representation of platform details."""
@@ -1,6 +1,39 @@
+import ctypes
+import ctypes.util
+import functools
 import platform
 import subprocess
-import json
+
+from platform_json import dumps_pretty
+
+
+@functools.lru_cache(maxsize=None)
+def _libc():
+    """Load libc once and declare the sysctlbyname prototype."""
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    libc.sysctlbyname.argtypes = [
+        ctypes.c_char_p,
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_size_t),
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+    ]
+    libc.sysctlbyname.restype = ctypes.c_int
+    return libc
+
+
+def _sysctl(name, as_int=False):
+    """Read one sysctl value through libc instead of forking a tool."""
+    libc = _libc()
+    size = ctypes.c_size_t()
+    if libc.sysctlbyname(name.encode(), None, ctypes.byref(size), None, 0):
+        raise OSError(ctypes.get_errno(), f"sysctlbyname({name}) failed")
+    buffer = ctypes.create_string_buffer(size.value)
+    if libc.sysctlbyname(name.encode(), buffer, ctypes.byref(size), None, 0):
+        raise OSError(ctypes.get_errno(), f"sysctlbyname({name}) failed")
+    if as_int:
+        return int.from_bytes(buffer.raw[: size.value], "little")
+    return buffer.value.decode("utf-8")
 
 
 class PlatformMac:
@@ -29,6 +62,19 @@ class PlatformMac:
             return f"Failed to fetch kernel version: {e}"
 
     def get_hardware_info(self):
+        """Retrieve hardware-specific information through sysctl."""
+        try:
+            return {
+                "Model Identifier": _sysctl("hw.model"),
+                "Processor Name": _sysctl("machdep.cpu.brand_string"),
+                "Total Number of Cores": str(_sysctl("hw.physicalcpu", as_int=True)),
+                "Logical Processors": str(_sysctl("hw.logicalcpu", as_int=True)),
+                "Memory": f"{_sysctl('hw.memsize', as_int=True) >> 30} GB",
+            }
+        except Exception:
+            return self._get_system_profiler_info()
+
+    def _get_system_profiler_info(self):
         """Retrieve hardware-specific information using system profiler."""
         try:
             output = subprocess.check_output(
@@ -54,7 +100,7 @@ class PlatformMac:
 
     def to_json(self):
         """Convert platform details to JSON."""
-        return json.dumps(self.to_dict(), indent=4)
+        return dumps_pretty(self.to_dict())
 
     def __str__(self):
         """String representation of platform details."""
@@ -1,9 +1,26 @@
+import functools
 import platform
 import subprocess
-import json
-import wmi  # Install using `pip install WMI`
+import threading
 import psutil
-import win32com.client
+
+from platform_json import dumps_pretty
+
+# WMI connections are apartment-threaded, so each thread keeps its own
+_wmi_local = threading.local()
+
+
+def _get_wmi():
+    """Get this thread's WMI connection, connecting on first use."""
+    conn = getattr(_wmi_local, "conn", None)
+    if conn is None:
+        # Imported here: loading wmi pulls in win32com and its gen-py cache
+        import pythoncom
+        import wmi  # Install using `pip install WMI`
+
+        pythoncom.CoInitialize()
+        conn = _wmi_local.conn = wmi.WMI()
+    return conn
 
 
 class PlatformWindows:
@@ -34,17 +51,20 @@ class PlatformWindows:
         except Exception as e:
             return f"Failed to fetch kernel version: {e}"
 
-    def _get_hardware_info(self):
+    def _get_hardware_info(self, detailed=False):
         """Retrieve detailed hardware information using WMI."""
         try:
-            w = wmi.WMI()
+            w = _get_wmi()
             cpu = w.Win32_Processor()[0]
-            memory = w.Win32_PhysicalMemory()
             system = w.Win32_ComputerSystem()[0]
 
-            memory_info = {
-                "total_memory": f"{sum(int(mem.Capacity) for mem in memory) / (1024 ** 3):.2f} GB"
-            }
+            if detailed:
+                # Installed DIMM capacity; Win32_PhysicalMemory walks SMBIOS
+                total = sum(int(mem.Capacity) for mem in w.Win32_PhysicalMemory())
+            else:
+                # OS-visible memory from one GlobalMemoryStatusEx call
+                total = psutil.virtual_memory().total
+            memory_info = {"total_memory": f"{total / (1024 ** 3):.2f} GB"}
 
             return {
                 "cpu": {
@@ -73,7 +93,7 @@ class PlatformWindows:
 
     def to_json(self):
         """Convert platform details to JSON."""
-        return json.dumps(self.to_dict(), indent=4)
+        return dumps_pretty(self.to_dict())
 
     def __str__(self):
         """String representation of platform details."""
@@ -83,8 +103,13 @@ class PlatformWindows:
 class WindowsPlatform:
     @staticmethod
     def get_cpu_info():
-        w = wmi.WMI()
-        cpu = w.Win32_Processor()[0]
+        # None of these fields change while the process runs
+        return dict(WindowsPlatform._static_cpu_info())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _static_cpu_info():
+        cpu = _get_wmi().Win32_Processor()[0]
         return {
             "name": cpu.Name.strip(),
             "cores": psutil.cpu_count(logical=False),
@@ -95,7 +120,7 @@ class WindowsPlatform:
 
     @staticmethod
     def get_gpu_info():
-        w = wmi.WMI()
+        w = _get_wmi()
         return [
             {
                 "name": gpu.Name,
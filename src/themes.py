@@ -1,7 +1,198 @@
-from typing import Dict
+import re
+import types
+from typing import Mapping
+
+_SYSTEM_COLORS = types.MappingProxyType(
+    {
+        "success": "#2ed573",
+        "warning": "#f7b731",
+        "error": "#ff4757",
+        "info": "#0078d4",
+        "text": "#ffffff",
+        "text_secondary": "#8c8c8c",
+        "border": "#3a3a3a",
+        "background": "#1a1a1a",
+        "background_secondary": "#2d2d2d",
+    }
+)
+
+_QSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE = re.compile(r"\s+")
+_QSS_PUNCT_SPACE = re.compile(r" ?([{};,]) ?")
+
+
+def _minify_qss(css: str) -> str:
+    """Drop comments and insignificant whitespace from a Qt stylesheet."""
+    css = _QSS_SPACE.sub(" ", _QSS_COMMENT.sub("", css))
+    return _QSS_PUNCT_SPACE.sub(r"\1", css).strip()
 
 
 class ThemeManager:
+    # Widget rules selected by object name, shared by both themes so Qt
+    # parses them once with the window stylesheet instead of per widget
+    WIDGET_STYLES = """
+        QTextEdit#hardwareText {
+            background-color: #1E1E1E;
+            color: #FFFFFF;
+            border: 1px solid #333333;
+            padding: 10px;
+        }
+
+        QTextEdit#networkText {
+            background-color: #252526;
+            color: #ffffff;
+            border: 1px solid #3a3a3a;
+            border-radius: 4px;
+            padding: 10px;
+        }
+
+        QPushButton#refreshBtn, QPushButton#networkRefreshBtn {
+            background-color: #0066cc;
+            color: white;
+            padding: 8px 15px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+
+        QPushButton#networkRefreshBtn {
+            margin-bottom: 10px;
+        }
+
+        QPushButton#refreshBtn:hover, QPushButton#networkRefreshBtn:hover {
+            background-color: #0052a3;
+        }
+
+        QPushButton#exportBtn {
+            background-color: #28a745;
+            color: white;
+            padding: 8px 15px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+
+        QPushButton#exportBtn:hover {
+            background-color: #218838;
+        }
+
+        QGroupBox#statusGroup,
+        QGroupBox#interfacesGroup,
+        QGroupBox#interfacesGroup QGroupBox,
+        QGroupBox#statsGroup {
+            border: 2px solid #2196F3;
+            border-radius: 8px;
+            margin-top: 1ex;
+            font-weight: bold;
+        }
+
+        /* Interface cards inherit the green border of their group */
+        QGroupBox#interfacesGroup, QGroupBox#interfacesGroup QGroupBox {
+            border-color: #4CAF50;
+        }
+
+        QGroupBox#statsGroup {
+            border-color: #9C27B0;
+        }
+
+        QGroupBox#statusGroup::title,
+        QGroupBox#interfacesGroup::title,
+        QGroupBox#interfacesGroup QGroupBox::title,
+        QGroupBox#statsGroup::title {
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 5px;
+        }
+
+        QLabel#ifaceStatus {
+            padding: 5px;
+            border-radius: 3px;
+            background-color: #2d2d2d;
+        }
+
+        QLabel#ifaceAddress {
+            font-family: 'Consolas';
+            padding: 2px;
+        }
+
+        QProgressBar#cpuProgress, QProgressBar#ramProgress, QProgressBar#gpuProgress {
+            border: 1px solid #ccc;
+            border-radius: 5px;
+            text-align: center;
+        }
+
+        QProgressBar#cpuProgress::chunk {
+            background-color: #0066cc;
+            border-radius: 5px;
+        }
+
+        QProgressBar#ramProgress::chunk {
+            background-color: #28a745;
+            border-radius: 5px;
+        }
+
+        QProgressBar#gpuProgress::chunk {
+            background-color: #dc3545;
+            border-radius: 5px;
+        }
+
+        QComboBox#themeCombo {
+            background-color: #252526;
+            color: #FFFFFF;
+            padding: 5px 10px;
+            border: 1px solid #3a3a3a;
+            border-radius: 4px;
+            min-width: 150px;
+        }
+
+        QComboBox#themeCombo::drop-down {
+            border: none;
+            width: 20px;
+        }
+
+        QComboBox#themeCombo::down-arrow {
+            width: 12px;
+            height: 12px;
+            color: #FFFFFF;
+            image: none;
+        }
+
+        QComboBox#themeCombo:hover {
+            background-color: #3d3d3d;
+        }
+
+        QComboBox#themeCombo QAbstractItemView {
+            background-color: #252526;
+            color: #FFFFFF;
+            border: 1px solid #3a3a3a;
+            selection-background-color: #0078d4;
+        }
+
+        QComboBox#refreshCombo {
+            padding: 5px;
+            border: 1px solid #ccc;
+            border-radius: 4px;
+        }
+
+        QComboBox#exportCombo {
+            padding: 8px;
+            border: 1px solid #ccc;
+            border-radius: 4px;
+            min-width: 150px;
+        }
+
+        QCheckBox#autostartCheck {
+            spacing: 5px;
+        }
+
+        QCheckBox#autoRefreshCheck {
+            spacing: 8px;
+        }
+
+        QCheckBox#autoRefreshCheck::indicator {
+            width: 18px;
+            height: 18px;
+        }
+    """
+
     def __init__(self):
         self.colors = {
             "light": {
@@ -19,35 +210,23 @@ class ThemeManager:
                 "border": "#3a3a3a",
             },
         }
+        # colors never change after construction, so build and minify each
+        # sheet once; Qt re-parses the string on every setStyleSheet
+        self._stylesheets = {
+            name: _minify_qss(self._build_stylesheet(name)) for name in self.colors
+        }
 
     def get_dark_theme(self) -> str:
         """Get dark theme stylesheet."""
-        c = self.colors["dark"]
-        return f"""
-        QMainWindow, QWidget {{
-            background-color: {c['background']};
-            color: {c['text']};
-        }}
-        
-        QPushButton {{
-            background-color: {c['primary']};
-            color: white;
-            padding: 8px 15px;
-            border: none;
-            border-radius: 4px;
-            font-weight: bold;
-        }}
-        
-        QPushButton:hover {{
-            background-color: #1884d9;
-        }}
-        
-        /* ...rest of dark theme... */
-        """
+        return self._stylesheets["dark"]
 
     def get_light_theme(self) -> str:
         """Get light theme stylesheet."""
-        c = self.colors["light"]
+        return self._stylesheets["light"]
+
+    def _build_stylesheet(self, name: str) -> str:
+        """Build the stylesheet for one color scheme."""
+        c = self.colors[name]
         return f"""
         QMainWindow, QWidget {{
             background-color: {c['background']};
@@ -67,19 +246,9 @@ class ThemeManager:
             background-color: #1884d9;
         }}
         
-        /* ...rest of light theme... */
-        """
+        /* ...rest of {name} theme... */
+        """ + self.WIDGET_STYLES
 
     @staticmethod
-    def get_system_colors() -> Dict[str, str]:
-        return {
-            "success": "#2ed573",
-            "warning": "#f7b731",
-            "error": "#ff4757",
-            "info": "#0078d4",
-            "text": "#ffffff",
-            "text_secondary": "#8c8c8c",
-            "border": "#3a3a3a",
-            "background": "#1a1a1a",
-            "background_secondary": "#2d2d2d",
-        }
+    def get_system_colors() -> Mapping[str, str]:
+        return _SYSTEM_COLORS
@@ -1,10 +1,53 @@
 from flask import Flask, jsonify, render_template, send_from_directory, request
+from flask.json.provider import DefaultJSONProvider
 from core.hardware_manager import HardwareManager
 from core.network import Network
+from core.utils import dumps_json, loads_json
+import functools
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from flask_cors import CORS
+from jinja2 import FileSystemBytecodeCache
 import logging
 
+try:
+    from flask_compress import Compress
+except ImportError:  # Optional; responses go out uncompressed without it
+    Compress = None
+
+
+# json.dumps arguments the fast path reproduces; anything else, such as a
+# custom default or cls, goes to Flask's stdlib encoder
+_FAST_DUMPS_ARGS = frozenset({"indent", "separators", "sort_keys", "ensure_ascii"})
+
+
+class _FastJSONProvider(DefaultJSONProvider):
+    """Route Flask's JSON through dumps_json/loads_json, which prefer orjson."""
+
+    def dumps(self, obj, **kwargs):
+        # sort_keys and compact are honoured; ensure_ascii is not, since the
+        # fast path always emits UTF-8, which every JSON reader accepts
+        if kwargs.keys() <= _FAST_DUMPS_ARGS:
+            sort_keys = kwargs.get("sort_keys", self.sort_keys)
+            try:
+                return dumps_json(
+                    obj, indent=bool(kwargs.get("indent")), sort_keys=sort_keys
+                ).decode("utf-8")
+            except TypeError:
+                # Types only Flask's default hook knows, like Decimal
+                pass
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            # Hooks such as object_hook exist only in the stdlib decoder
+            return super().loads(s, **kwargs)
+        # Decode errors subclass ValueError, which get_json() reports as 400
+        return loads_json(s)
+
+
 # Initialize Flask app with static and template directories
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 app = Flask(
@@ -14,6 +57,19 @@ app = Flask(
     ),  # Serve CSS/JS files from the static directory
     template_folder=os.path.join(BASE_DIR, "templates"),  # Serve HTML templates
 )
+app.json = _FastJSONProvider(app)
+# Deployments behind nginx/Apache set FLASK_USE_X_SENDFILE=true so result
+# downloads are handed to the front server instead of streamed from Python
+app.config.from_prefixed_env()
+if Compress is not None:
+    # Summaries are repetitive JSON; small bodies are not worth the CPU
+    app.config.setdefault("COMPRESS_ALGORITHM", ["br", "gzip"])
+    app.config.setdefault("COMPRESS_MIN_SIZE", 512)
+    Compress(app)
+# Compiled templates persist across restarts instead of re-parsing each boot.
+# With no directory Jinja uses a per-user cache it creates 0700 and refuses
+# to share, so other local users cannot plant bytecode in it.
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
 CORS(app)
 # Define Results directory for downloadable and uploaded files
 RESULTS_DIR = os.path.join(BASE_DIR, "Results")
@@ -21,8 +77,105 @@ RESULTS_DIR = os.path.join(BASE_DIR, "Results")
 # Ensure Results directory exists
 os.makedirs(RESULTS_DIR, exist_ok=True)
 
-hardware_manager = HardwareManager()
-network_manager = Network()
+
+def _lazy(factory):
+    """Build factory() on the first call and return that instance after."""
+    lock = threading.Lock()
+    instance = []
+
+    def get():
+        if not instance:
+            with lock:
+                if not instance:
+                    instance.append(factory())
+        return instance[0]
+
+    return get
+
+
+# Managers probe hardware when built, so each worker pays for that on the
+# first request that needs one rather than at import/fork time
+hardware_manager = _lazy(HardwareManager)
+network_manager = _lazy(Network)
+# fdatasync skips the metadata flush; Windows only offers fsync
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+# Network probes wait on sockets, so they overlap the hardware summary
+_probe_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="report-probe")
+
+# (cpu, ram, gpu) from the sampler thread; rebinding the tuple is atomic,
+# so readers always see one consistent sample
+_latest_usage = (0.0, 0.0, 0.0)
+# Seconds to wait before retrying after the sampler fails
+_SAMPLER_RETRY_DELAY = 1.0
+
+
+def _sample_usage():
+    """Refresh the components on the fast interval so routes never probe."""
+    global _latest_usage
+    while True:
+        try:
+            manager = hardware_manager()
+            results = manager.refresh_all()
+            _latest_usage = (results["cpu"], results["ram"], results["gpu"])
+            time.sleep(manager.refresh_intervals["fast"])
+        except Exception as e:
+            logging.error(f"Usage sampler error: {e}")
+            time.sleep(_SAMPLER_RETRY_DELAY)
+
+
+@_lazy
+def _usage_sampler():
+    """Seed the usage sample and start the sampler thread in this process."""
+    global _latest_usage
+    _latest_usage = hardware_manager().get_usage_vector()
+    sampler = threading.Thread(target=_sample_usage, name="usage-sampler", daemon=True)
+    sampler.start()
+    return sampler
+
+
+def _sampled_summary():
+    """Hardware summary of the sampler's last refresh, without resampling."""
+    # psutil.cpu_percent(None) reports usage since its previous call in the
+    # process, so a second caller would split the interval with the sampler
+    _usage_sampler()
+    return hardware_manager().get_hardware_summary(refresh=False)
+
+
+# Polls within this window share one probe and its serialized body
+_ROUTE_TTL = 0.5
+# key -> (time.monotonic() stamp, JSON body bytes)
+_route_cache = {}
+_route_locks = {
+    key: threading.Lock()
+    for key in ("hardware", "network", "network_dict", "devices", "monitoring")
+}
+
+
+def _cached_json(key, compute):
+    """Respond with compute()'s JSON, reusing a body younger than _ROUTE_TTL."""
+    # Per-key lock: concurrent pollers wait for the probe already running
+    with _route_locks[key]:
+        stamp, body = _route_cache.get(key, (0.0, None))
+        now = time.monotonic()
+        if body is None or now - stamp >= _ROUTE_TTL:
+            # Through app.json so types orjson rejects still encode
+            body = app.json.dumps(compute()).encode("utf-8")
+            _route_cache[key] = (now, body)
+    return app.response_class(body, mimetype=app.json.mimetype)
+
+
+def _conditional(view):
+    """Tag successful responses with an ETag and answer If-None-Match with 304."""
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        response = app.make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            response.add_etag()
+            response.make_conditional(request)
+        return response
+
+    return wrapper
 
 
 @app.route("/")
@@ -37,39 +190,37 @@ def index():
 
 
 @app.route("/api/hardware_summary", methods=["GET"])
+@_conditional
 def hardware_summary():
     """
     API Endpoint: Fetch hardware summary.
     """
     try:
-        manager = HardwareManager()
-        summary = manager.get_hardware_summary()
-        return jsonify(summary), 200
+        return _cached_json("hardware", _sampled_summary)
     except Exception as e:
         return jsonify({"error": f"Failed to fetch hardware summary: {str(e)}"}), 500
 
 
 @app.route("/api/network_summary", methods=["GET"])
+@_conditional
 def network_summary():
     """
     API Endpoint: Fetch network summary.
     """
     try:
-        network = Network()
-        summary = network.to_dict()
-        return jsonify(summary), 200
+        return _cached_json("network_dict", network_manager().to_dict)
     except Exception as e:
         return jsonify({"error": f"Failed to fetch network summary: {str(e)}"}), 500
 
 
 @app.route("/api/device_status", methods=["GET"])
+@_conditional
 def device_status():
     """
     API Endpoint: Check the status of connected devices.
     """
     try:
-        devices = HardwareManager().get_device_status()
-        return jsonify(devices), 200
+        return _cached_json("devices", hardware_manager().get_device_status)
     except Exception as e:
         return jsonify({"error": f"Failed to fetch device status: {str(e)}"}), 500
 
@@ -97,7 +248,8 @@ def upload_results():
         if file.filename == "":
             return jsonify({"error": "No selected file"}), 400
         save_path = os.path.join(RESULTS_DIR, file.filename)
-        file.save(save_path)
+        # 1 MiB chunks instead of Werkzeug's 16 KiB default
+        file.save(save_path, buffer_size=1 << 20)
         return (
             jsonify({"message": f"File '{file.filename}' uploaded successfully"}),
             201,
@@ -112,10 +264,9 @@ def generate_report():
     Endpoint to generate a report combining hardware and network summaries.
     """
     try:
-        manager = HardwareManager()
-        network = Network()
-        hardware_summary = manager.get_hardware_summary()
-        network_summary = network.to_dict()
+        network_future = _probe_pool.submit(network_manager().to_dict)
+        hardware_summary = _sampled_summary()
+        network_summary = network_future.result()
 
         combined_summary = {
             "hardware_summary": hardware_summary,
@@ -123,8 +274,13 @@ def generate_report():
         }
 
         report_path = os.path.join(RESULTS_DIR, "combined_report.json")
-        with open(report_path, "w") as report_file:
-            report_file.write(json.dumps(combined_summary, indent=4))
+        # One encode straight to bytes; binary mode skips the text layer
+        with open(report_path, "wb", buffering=65536) as report_file:
+            report_file.write(dumps_json(combined_summary))
+            # Flush to disk here so the cost lands on this request rather
+            # than on a later writeback stall
+            report_file.flush()
+            _fdatasync(report_file.fileno())
 
         return (
             jsonify(
@@ -140,44 +296,53 @@ def generate_report():
 
 
 @app.route("/api/hardware")
+@_conditional
 def get_hardware():
     try:
-        return jsonify(hardware_manager.get_hardware_summary())
+        return _cached_json("hardware", _sampled_summary)
     except Exception as e:
         logging.error(f"Hardware API error: {e}")
         return jsonify({"error": str(e)}), 500
 
 
 @app.route("/api/network")
+@_conditional
 def get_network():
     try:
-        return jsonify(network_manager.get_network_summary())
+        return _cached_json("network", network_manager().get_network_summary)
     except Exception as e:
         logging.error(f"Network API error: {e}")
         return jsonify({"error": str(e)}), 500
 
 
+def _monitoring_sample():
+    """Current CPU, RAM and GPU usage percentages."""
+    _usage_sampler()
+    cpu_usage, ram_usage, gpu_usage = _latest_usage
+    return {"cpu_usage": cpu_usage, "ram_usage": ram_usage, "gpu_usage": gpu_usage}
+
+
 @app.route("/api/monitoring")
 def get_monitoring():
     try:
-        return jsonify(
-            {
-                "cpu_usage": hardware_manager.get_cpu_usage(),
-                "ram_usage": hardware_manager.get_ram_usage(),
-                "gpu_usage": hardware_manager.get_gpu_usage(),
-            }
-        )
+        return _cached_json("monitoring", _monitoring_sample)
     except Exception as e:
         logging.error(f"Monitoring API error: {e}")
         return jsonify({"error": str(e)}), 500
 
 
+@functools.lru_cache(maxsize=1)
+def _not_found_page():
+    """Render the 404 page, which takes no variables, on first use only."""
+    return render_template("404.html")
+
+
 @app.errorhandler(404)
 def page_not_found(e):
     """
     Custom 404 error handler.
     """
-    return render_template("404.html"), 404
+    return _not_found_page(), 404
 
 
 @app.errorhandler(500)
@@ -190,5 +355,8 @@ def internal_error(e):
 
 
 if __name__ == "__main__":
+    # Development server only; for production run a WSGI server from src,
+    # e.g. `gunicorn -k gthread --threads 8 -b 0.0.0.0:5000 web_app:app`.
+    # Debug mode (reloader, debugger) is opt-in through FLASK_DEBUG=1.
     # Enable access on all network interfaces for mobile and web clients
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    app.run(host="0.0.0.0", port=5000, debug=app.debug, threaded=True)
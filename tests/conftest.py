@@ -2,17 +2,18 @@ import os
 import sys
 import pytest
 
-# Add parent directory to Python path
+# Add parent and src directories to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def hardware_manager():
-    """Fixture to provide a HardwareManager instance."""
-    from src.core.hardware_manager import HardwareManager
+    """Fixture to provide a HardwareManager instance, built once per session."""
+    from core.hardware_manager import HardwareManager
     return HardwareManager()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def network_manager():
-    """Fixture to provide a Network instance."""
-    from src.core.network import Network
+    """Fixture to provide a Network instance, built once per session."""
+    from core.network import Network
     return Network()
@@ -1,36 +1,27 @@
-import sys
-import os
-from pathlib import Path
-
-# Add src directory to Python path
-src_path = str(Path(__file__).parent.parent / 'src')
-if src_path not in sys.path:
-    sys.path.insert(0, src_path)
-
-from core.hardware_manager import HardwareManager
-
-def test_hardware_manager_initialization():
+def test_hardware_manager_initialization(hardware_manager):
     """Test basic initialization of HardwareManager."""
-    manager = HardwareManager()
-    assert manager is not None
+    assert hardware_manager is not None
 
-def test_get_cpu_usage():
+def test_get_cpu_usage(hardware_manager):
     """Test CPU usage retrieval."""
-    manager = HardwareManager()
-    usage = manager.get_cpu_usage()
+    usage = hardware_manager.get_cpu_usage()
     assert isinstance(usage, float)
     assert 0 <= usage <= 100
 
-def test_get_ram_usage():
+def test_get_ram_usage(hardware_manager):
     """Test RAM usage retrieval."""
-    manager = HardwareManager()
-    usage = manager.get_ram_usage()
+    usage = hardware_manager.get_ram_usage()
     assert isinstance(usage, float)
     assert 0 <= usage <= 100
 
-def test_get_gpu_usage():
+def test_get_gpu_usage(hardware_manager):
     """Test GPU usage retrieval."""
-    manager = HardwareManager()
-    usage = manager.get_gpu_usage()
+    usage = hardware_manager.get_gpu_usage()
     assert isinstance(usage, float)
     assert 0 <= usage <= 100
+
+def test_get_usage_vector(hardware_manager):
+    """Test combined CPU/RAM/GPU usage retrieval."""
+    usage = hardware_manager.get_usage_vector()
+    assert len(usage) == 3
+    assert all(isinstance(value, float) and 0 <= value <= 100 for value in usage)
@@ -0,0 +1,51 @@
+import pytest
+
+from core.utils import format_size, load_from_json, save_to_csv, save_to_json
+
+def test_format_size_units():
+    """Test unit selection at the 1024 boundaries."""
+    assert format_size(0) == "0.00 B"
+    assert format_size(1023) == "1023.00 B"
+    assert format_size(1024) == "1.00 KB"
+    assert format_size(1536) == "1.50 KB"
+    assert format_size(5 * 1024 ** 3) == "5.00 GB"
+
+def test_format_size_large_values():
+    """Test that sizes of a terabyte and above are formatted."""
+    assert format_size(1024 ** 4) == "1.00 TB"
+    assert format_size(3 * 1024 ** 5) == "3.00 PB"
+    assert format_size(2048 * 1024 ** 6) == "2048.00 EB"
+
+def test_save_to_json_replaces_atomically(tmp_path):
+    """Test that a Path target is replaced whole and no temp file remains."""
+    target = tmp_path / "data.json"
+    target.write_text("old")
+    save_to_json(target, {"name": "CPU", "value": 80})
+    assert load_from_json(target) == {"name": "CPU", "value": 80}
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+def test_save_to_json_keeps_old_file_on_error(tmp_path):
+    """Test that a failed write leaves the previous file and no temp file."""
+    target = tmp_path / "data.json"
+    target.write_text("old")
+    with pytest.raises(TypeError):
+        save_to_json(target, {"bad": object()})
+    assert target.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+def test_save_to_csv_rejects_unknown_fields(tmp_path):
+    """Test that a row with a key outside fieldnames raises, as DictWriter does."""
+    with pytest.raises(ValueError, match="'c'"):
+        save_to_csv(tmp_path / "data.csv", [{"a": 1, "b": 2}, {"a": 3, "c": 9}])
+    assert not list(tmp_path.iterdir())
+
+def test_save_to_csv_fills_missing_fields(tmp_path):
+    """Test that missing keys are written empty."""
+    target = tmp_path / "data.csv"
+    save_to_csv(target, [{"a": 1, "b": 2}, {"a": 3}])
+    assert target.read_text().splitlines() == ["a,b", "1,2", "3,"]
+
+def test_save_to_csv_empty_data_raises(tmp_path):
+    """Test that empty data without fieldnames raises instead of writing nothing."""
+    with pytest.raises(IndexError):
+        save_to_csv(tmp_path / "data.csv", [])
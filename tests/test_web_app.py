@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+
+import web_app
+
+@pytest.fixture(scope="module")
+def client():
+    """Fixture to provide a Flask test client for the web app."""
+    web_app.app.config["TESTING"] = True
+    return web_app.app.test_client()
+
+def test_jsonify_honours_sort_keys():
+    """Test that jsonify output goes through the provider with sorted keys."""
+    with web_app.app.app_context():
+        response = web_app.jsonify({"b": 1, "a": [1, "x"]})
+    assert response.mimetype == "application/json"
+    assert response.get_data().strip() == b'{"a":[1,"x"],"b":1}'
+
+def test_provider_falls_back_for_custom_default():
+    """Test that arguments the fast path cannot reproduce use Flask's encoder."""
+    text = web_app.app.json.dumps({"value": object()}, default=lambda o: "custom")
+    assert web_app.app.json.loads(text) == {"value": "custom"}
+
+def test_hardware_route_is_cached_and_conditional(client):
+    """Test that polls share one body and a matching ETag answers 304."""
+    first = client.get("/api/hardware")
+    assert first.status_code == 200
+    assert "system_info" in first.get_json()
+    etag = first.headers["ETag"]
+
+    # Within _ROUTE_TTL the same serialized body, and so the same ETag, is reused
+    second = client.get("/api/hardware")
+    assert second.headers["ETag"] == etag
+
+    cached = client.get("/api/hardware", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.get_data() == b""
+
+def test_monitoring_route_reads_sampler(client):
+    """Test that monitoring returns the sampled usage percentages."""
+    response = client.get("/api/monitoring")
+    assert response.status_code == 200
+    usage = response.get_json()
+    assert set(usage) == {"cpu_usage", "ram_usage", "gpu_usage"}
+    assert all(0 <= value <= 100 for value in usage.values())